@@ -1,55 +1,58 @@
-import pandas as pd
+import os
+import sys
+import time
+import argparse
+import resource
 
-CSV_FILE = r"/home/masrkaii/Job_Market_Analysis/Data/Scraped-back/Morocco/Software Engineering/Software Engineering.csv"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
 
-# =========================
-# LOAD CSV
-# =========================
-df = pd.read_csv(CSV_FILE)
+from helpers.paths import project_path  # noqa: E402
+from helpers.dedup import SCOPES, MemoryIndex, DiskIndex, dedup_tree  # noqa: E402
+from csv_to_dataset import iter_category_csvs  # noqa: E402
+from migrate_links import crawl_in_progress  # noqa: E402
 
-# =========================
-# EMPTY FILE CHECK
-# =========================
-if df.empty:
-    print("The CSV file is empty. No data to process.")
-    exit()
 
-print(f"Loaded {len(df)} rows.")
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
 
-# =========================
-# COLUMN DETECTION
-# =========================
-url_candidates = ["url", "job_url", "link", "job_link", "apply_link"]
 
-url_column = next((c for c in url_candidates if c in df.columns), None)
-
-if url_column is None:
-    raise ValueError(
-        f"No URL column found. Available columns: {df.columns.tolist()}"
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find and remove duplicated postings across the whole scraped CSV tree in one pass."
     )
-
-if "location" not in df.columns:
-    raise ValueError("No 'location' column found in CSV.")
-
-# =========================
-# NORMALIZATION
-# =========================
-df["location"] = df["location"].astype(str).str.strip().str.lower()
-df[url_column] = df[url_column].astype(str).str.strip()
-
-# =========================
-# DUPLICATE DETECTION
-# =========================
-duplicate_mask = df.duplicated(subset=["location", url_column], keep="first")
-duplicate_count = duplicate_mask.sum()
-
-# =========================
-# DELETE DUPLICATES (INTENTIONAL)
-# =========================
-if duplicate_count == 0:
-    print("No duplicated jobs found. CSV remains unchanged.")
-else:
-    print(f"Found {duplicate_count} duplicated jobs.")
-    df_cleaned = df[~duplicate_mask]
-    df_cleaned.to_csv(CSV_FILE, index=False)
-    print(f"Duplicates removed. CSV now has {len(df_cleaned)} rows.")
+    parser.add_argument("--input", default=project_path("scraped"),
+                        help="scraped CSV tree (<Country>/<Category>/<Category>.csv)")
+    parser.add_argument("--scope", choices=list(SCOPES), default="file",
+                        help="duplicates to remove: within a file (default), also across categories "
+                             "of a country, or also across countries")
+    parser.add_argument("--dry-run", action="store_true", help="only report, don't rewrite anything")
+    parser.add_argument("--disk", action="store_true",
+                        help="keep the job-ID set in a temporary SQLite file instead of memory")
+    parser.add_argument("--force", action="store_true",
+                        help="compact even though an interrupted crawl could resume against these files")
+    args = parser.parse_args()
+
+    if (not args.dry_run and not args.force and os.path.abspath(args.input) == project_path("scraped")
+            and crawl_in_progress()):
+        parser.error("an interrupted crawl is waiting to resume (see its journal); "
+                     "finish it first or pass --force")
+
+    started = time.perf_counter()
+    index = DiskIndex(directory=project_path("cache")) if args.disk else MemoryIndex()
+    report = dedup_tree(iter_category_csvs(args.input), scope=args.scope, dry_run=args.dry_run, index=index)
+    elapsed = time.perf_counter() - started
+
+    for path, removed in report["changed_files"].items():
+        print(f"  {os.path.relpath(path, args.input)}: {removed} rows {'to remove' if args.dry_run else 'removed'}")
+
+    print(f"Scanned {report['rows']} rows in {report['files']} files: {report['unique']} unique postings")
+    for kind, count in report["duplicates"].items():
+        print(f"  {kind.replace('_', ' ')}: {count}")
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"{verb} {report['removed']} rows (scope: {args.scope}) from {len(report['changed_files'])} files")
+    print(f"Took {elapsed:.1f} s, peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Size on disk, write time and read time of raw pages kept as loose HTML
+files against the page archive (helpers/page_archive.py), with and
+without a trained dictionary.
+
+Search pages are rendered like the mock server's (cards from a scraped
+CSV) and job pages from the saved example page, a share of them fetched
+twice with an identical body:
+
+    python Benchmarks/archive_benchmark.py
+    python Benchmarks/archive_benchmark.py --search-pages 5000 --job-pages 5000 --duplicates 0.2
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_linkedin_server import load_rows, render_card  # noqa: E402
+from helpers.page_archive import PageArchive  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+
+
+def make_pages(rows, search_pages, job_pages, duplicates, seed=0):
+    """[(key, body bytes)]: search pages under request-like keys, job pages under job IDs."""
+    rng = random.Random(seed)
+    with open(project_path("examples", "Ex_of_imp_elements.html"), "r", encoding="utf-8") as f:
+        example = f.read()
+
+    pages = []
+    for page in range(search_pages):
+        cards = [render_card(rows[(page * 10 + i) % len(rows)], 4_000_000_000 + page * 10 + i, i + 1, rng)
+                 for i in range(10)]
+        pages.append((f"search-{page}", "".join(cards).encode("utf-8")))
+    for job in range(job_pages):
+        row = rows[job % len(rows)]
+        body = example.replace("Notion", row["company"]).replace("Software Engineer", row["title"])
+        pages.append((3_000_000_000 + job, body.encode("utf-8")))
+
+    # Pages fetched again unchanged (replays, re-crawled keywords)
+    pages += rng.sample(pages, int(len(pages) * duplicates))
+    return pages
+
+
+def file_name(key):
+    return f"{key}.html"
+
+
+def run_loose(pages, root, lookups):
+    started = time.perf_counter()
+    for key, body in pages:
+        with open(os.path.join(root, file_name(key)), "wb") as f:
+            f.write(body)
+    write_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            with open(os.path.join(dirpath, name), "rb") as f:
+                f.read()
+    scan_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for key in lookups:
+        with open(os.path.join(root, file_name(key)), "rb") as f:
+            f.read()
+    lookup_s = time.perf_counter() - started
+
+    size = sum(os.path.getsize(os.path.join(root, name)) for name in os.listdir(root))
+    return {"bytes": size, "write_s": round(write_s, 3), "scan_s": round(scan_s, 3),
+            "lookup_us": round(1e6 * lookup_s / len(lookups), 1)}
+
+
+def run_archive(pages, root, lookups, train_after):
+    started = time.perf_counter()
+    archive = PageArchive(root, train_after=train_after)
+    for key, body in pages:
+        archive.put(key, body)
+    archive.close()
+    write_s = time.perf_counter() - started
+
+    archive = PageArchive(root)
+    started = time.perf_counter()
+    for _ in archive.iter_pages():
+        pass
+    scan_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for key in lookups:
+        archive.get_bytes(key)
+    lookup_s = time.perf_counter() - started
+
+    for key, body in pages[:200]:
+        assert archive.get_bytes(key) == body
+    archive.close()
+
+    size = sum(os.path.getsize(os.path.join(root, name)) for name in os.listdir(root))
+    return {"bytes": size, "write_s": round(write_s, 3), "scan_s": round(scan_s, 3),
+            "lookup_us": round(1e6 * lookup_s / len(lookups), 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--search-pages", type=int, default=2000)
+    parser.add_argument("--job-pages", type=int, default=2000)
+    parser.add_argument("--duplicates", type=float, default=0.1,
+                        help="share of pages fetched a second time with an identical body")
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = load_rows(project_path("scraped", "Egypt", "Cybersecurity", "Cybersecurity.csv"))
+    pages = make_pages(rows, args.search_pages, args.job_pages, args.duplicates)
+    rng = random.Random(1)
+    lookups = [rng.choice(pages)[0] for _ in range(args.lookups)]
+
+    report = {"pages": len(pages), "raw_bytes": sum(len(body) for _, body in pages)}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.mkdir(os.path.join(tmp, "loose"))
+        report["loose_files"] = run_loose(pages, os.path.join(tmp, "loose"), lookups)
+        report["archive_no_dictionary"] = run_archive(pages, os.path.join(tmp, "plain"), lookups, train_after=0)
+        report["archive"] = run_archive(pages, os.path.join(tmp, "archive"), lookups, train_after=64)
+
+    for name in ("archive_no_dictionary", "archive"):
+        report[f"{name}_size_ratio"] = round(report["loose_files"]["bytes"] / report[name]["bytes"], 1)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+End-to-end crawl throughput benchmark against the local stand-in server.
+
+Starts Benchmarks/mock_linkedin_server.py in a separate process, points the
+scraper at it and reports pages/s, jobs/s, p50/p99 request latency and CPU
+time per page of the crawling process:
+
+    python Benchmarks/crawl_benchmark.py --mode scheduler --keywords 200
+    python Benchmarks/crawl_benchmark.py --mode keyword --keywords 20 --burst-every 50
+    python Benchmarks/crawl_benchmark.py --parser bs4 --parse-workers 4 --fixtures ../Data/Cache/responses
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import multiprocessing
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_linkedin_server import SEARCH_PATH, add_server_arguments, serve  # noqa: E402
+
+
+def wait_for_server(url, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Mock server did not come up at {url}")
+
+
+def server_stats(root):
+    with urllib.request.urlopen(f"{root}/_stats", timeout=5) as response:
+        return json.load(response)
+
+
+async def bench_keywords(plan):
+    """Old path: one scrape_linkedin_jobs_concurrent call per keyword, in order."""
+    from helpers.LinkedinAPI2 import scrape_linkedin_jobs_concurrent
+    from helpers.http_client import close_async_session
+
+    jobs = 0
+    try:
+        for entry in plan:
+            jobs += len(await scrape_linkedin_jobs_concurrent(entry["keyword"], entry["country"]))
+    finally:
+        await close_async_session()
+    return jobs
+
+
+def bench_scheduler(plan, args):
+    """Scraper.main path: the global scheduler streaming into per-category CSVs."""
+    import Scraper
+    from helpers.scheduler import run_crawl
+    from helpers.parse_pool import configure_parse_pool, close_parse_pool
+    from helpers.csv_writer import configure_csv_writer, close_csv_writer
+
+    configure_parse_pool(args.parse_workers)
+    configure_csv_writer()
+    try:
+        stats, _ = run_crawl(
+            plan,
+            Scraper.save_results,
+            max_concurrent=args.max_concurrent,
+            per_host=args.per_host,
+            max_keywords=args.max_keywords,
+        )
+    finally:
+        close_parse_pool()
+        close_csv_writer()
+    return stats["jobs"]
+
+
+def main():
+    parser = add_server_arguments(argparse.ArgumentParser(description=__doc__.strip().splitlines()[0]))
+    parser.set_defaults(port=8765, latency_ms=50.0, jitter_ms=25.0)
+    parser.add_argument("--mode", choices=["scheduler", "keyword"], default="scheduler")
+    parser.add_argument("--keywords", type=int, default=100,
+                        help="number of (country, keyword) pairs to crawl")
+    parser.add_argument("--rate", type=float, default=500.0,
+                        help="initial and maximum requests/s of the rate controller")
+    parser.add_argument("--max-concurrent", type=int, default=32)
+    parser.add_argument("--per-host", type=int, default=32)
+    parser.add_argument("--max-keywords", type=int, default=64)
+    parser.add_argument("--parser", choices=["fast", "bs4"], default="fast",
+                        help="search-card parser backend")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse pages in N worker processes (0 = on the event loop)")
+    args = parser.parse_args()
+
+    root = f"http://{args.host}:{args.port}"
+    os.environ["LINKEDIN_BASE_URL"] = root + SEARCH_PATH
+
+    server = multiprocessing.Process(target=serve, args=(args,), daemon=True)
+    server.start()
+    try:
+        wait_for_server(f"{root}/_stats")
+
+        # Imported only now so LinkedinAPI2 picks up LINKEDIN_BASE_URL
+        import Scraper
+        from helpers.card_parser import configure_card_parser
+        from helpers.http_client import client_stats, reset_client_stats
+        from helpers.rate_control import get_rate_controller
+
+        controller = get_rate_controller()
+        controller.initial_rate = controller.max_rate = args.rate
+        configure_card_parser(args.parser)
+        reset_client_stats()
+
+        output_dir = tempfile.mkdtemp(prefix="crawl_bench_")
+        plan = Scraper.build_plan(output_dir)[:args.keywords]
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if args.mode == "keyword":
+            jobs = asyncio.run(bench_keywords(plan))
+        else:
+            jobs = bench_scheduler(plan, args)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+        http = client_stats()["async"]
+        served = server_stats(root)
+    finally:
+        server.terminate()
+        server.join()
+
+    pages = http["requests"]
+    report = {
+        "mode": args.mode,
+        "parser": args.parser,
+        "parse_workers": args.parse_workers,
+        "keywords": len(plan),
+        "requests": pages,
+        "pages_with_cards": served["pages"],
+        "jobs": jobs,
+        "wall_s": round(wall, 2),
+        "pages_per_s": round(pages / wall, 1) if wall else 0.0,
+        "jobs_per_s": round(jobs / wall, 1) if wall else 0.0,
+        "p50_ms": http["p50_ms"],
+        "p99_ms": http["p99_ms"],
+        "cpu_ms_per_page": round(1000 * cpu / pages, 2) if pages else 0.0,
+        "throttled": served["throttled"],
+        "output_dir": output_dir,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Rows/s of the buffered CsvWriter against append_to_csv.
+
+Replays rows of a scraped CSV the way the scraper writes them: one batch
+of --batch rows per page, pages spread over --files category CSVs. Both
+are timed alone and behind the crawl journal, which fsyncs every page for
+append_to_csv and every flush for the buffered writer:
+
+    python Benchmarks/csv_writer_benchmark.py
+    python Benchmarks/csv_writer_benchmark.py --rows 200000 --files 76
+"""
+import os
+import sys
+import csv
+import json
+import time
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.checkpointing import CrawlJournal  # noqa: E402
+from helpers.csv_writer import CsvWriter  # noqa: E402
+from helpers.makefolder import append_to_csv  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+
+SAMPLE_CSV = project_path("scraped", "United States", "Cybersecurity", "Cybersecurity.csv")
+
+
+def make_pages(sample, rows, batch, files, root):
+    """[(entry, rows)] of every page, round-robin over `files` CSV paths."""
+    with open(sample, newline="", encoding="utf-8") as f:
+        source = list(csv.DictReader(f))
+    records = [dict(source[i % len(source)]) for i in range(rows)]
+
+    pages = []
+    for page, start in enumerate(range(0, rows, batch)):
+        index = page % files
+        entry = {
+            "country": "Benchmark", "category": f"category-{index}", "keyword": f"keyword-{page // files}",
+            "csv_path": os.path.join(root, f"category-{index}", f"category-{index}.csv"),
+        }
+        pages.append((entry, records[start:start + batch]))
+    return pages
+
+
+def run_append_to_csv(pages, root, journaled):
+    journal = CrawlJournal(os.path.join(root, "journal.jsonl")) if journaled else None
+    for start, (entry, rows) in enumerate(pages):
+        def write(entry=entry, rows=rows):
+            append_to_csv(rows, entry["csv_path"])
+        if journal is None:
+            write()
+        else:
+            journal.persist(entry, start, len(rows), entry["csv_path"], write)
+    if journal is not None:
+        journal.close()
+
+
+def run_csv_writer(pages, root, journaled):
+    writer = CsvWriter()
+    journal = None
+    if journaled:
+        journal = CrawlJournal(os.path.join(root, "journal.jsonl"))
+        journal.attach(writer)
+    for start, (entry, rows) in enumerate(pages):
+        def write(entry=entry, rows=rows):
+            writer.write(entry["csv_path"], rows)
+        if journal is None:
+            write()
+        else:
+            journal.persist(entry, start, len(rows), entry["csv_path"], write)
+    writer.close()
+    if journal is not None:
+        journal.close()
+
+
+def timed(func, args, journaled):
+    """Run `func` into a fresh directory; returns (seconds, bytes of CSV written)."""
+    with tempfile.TemporaryDirectory() as root:
+        pages = make_pages(args.sample, args.rows, args.batch, args.files, root)
+        for entry, _ in pages[:args.files]:
+            os.makedirs(os.path.dirname(entry["csv_path"]), exist_ok=True)
+
+        started = time.perf_counter()
+        func(pages, root, journaled)
+        elapsed = time.perf_counter() - started
+
+        contents = []
+        for entry, _ in pages[:args.files]:
+            with open(entry["csv_path"], "rb") as f:
+                contents.append(f.read())
+    return elapsed, contents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sample", default=SAMPLE_CSV,
+                        help="scraped CSV whose rows are replayed")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=10, help="rows per page")
+    parser.add_argument("--files", type=int, default=76, help="category CSVs written to")
+    args = parser.parse_args()
+
+    # append_to_csv logs through makefolder's logger; keep the timing about the writes
+    logging.disable(logging.INFO)
+
+    report = {"rows": args.rows, "batch": args.batch, "files": args.files}
+    for journaled in (False, True):
+        label = "journaled_" if journaled else ""
+        old_s, old_contents = timed(run_append_to_csv, args, journaled)
+        new_s, new_contents = timed(run_csv_writer, args, journaled)
+        report[f"{label}append_to_csv_rows_per_s"] = round(args.rows / old_s)
+        report[f"{label}csv_writer_rows_per_s"] = round(args.rows / new_s)
+        report[f"{label}speedup"] = round(old_s / new_s, 1)
+        report[f"{label}identical_output"] = old_contents == new_contents
+
+    print(json.dumps(report, indent=2))
+    if not (report["identical_output"] and report["journaled_identical_output"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Time to find every scraped row of a job ID: scanning the CSV tree for it
+(what grepping Data/Scraped does) against the memory-mapped job index of
+helpers/job_index.py.
+
+The index is built into a temporary directory, then timed again as an
+incremental update of the unchanged tree:
+
+    python Benchmarks/job_index_benchmark.py
+    python Benchmarks/job_index_benchmark.py --lookups 10000 --scans 5
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_to_dataset import iter_category_csvs  # noqa: E402
+from helpers.job_index import ENTRY_DTYPE, INDEX_FILE, JobIndex, update_job_index  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+
+
+def scan_for(scraped_dir, job_id):
+    """Lines of the CSV tree that mention `job_id`, read front to back."""
+    needle = str(job_id).encode("ascii")
+    matches = []
+    for _, _, csv_path in iter_category_csvs(scraped_dir):
+        with open(csv_path, "rb") as f:
+            matches.extend(line for line in f if needle in line)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", default=project_path("scraped"))
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--scans", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        started = time.perf_counter()
+        built = update_job_index(args.input, index_dir)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        update_job_index(args.input, index_dir)
+        update_ms = 1000 * (time.perf_counter() - started)
+
+        job_ids = np.unique(np.fromfile(os.path.join(index_dir, INDEX_FILE), dtype=ENTRY_DTYPE)["job_id"])
+        rng = random.Random(0)
+        sample = [int(rng.choice(job_ids)) for _ in range(args.lookups)]
+
+        index = JobIndex(index_dir)
+        # Opens the CSVs the sample reads from
+        rows = sum(len(index.rows(job_id)) for job_id in sample)
+
+        started = time.perf_counter()
+        for job_id in sample:
+            index.rows(job_id)
+        rows_us = 1e6 * (time.perf_counter() - started) / len(sample)
+
+        started = time.perf_counter()
+        for job_id in sample:
+            index.lookup(job_id)
+        lookup_us = 1e6 * (time.perf_counter() - started) / len(sample)
+
+        scanned = sample[:args.scans]
+        started = time.perf_counter()
+        for job_id in scanned:
+            assert len(scan_for(args.input, job_id)) >= len(index.rows(job_id))
+        scan_ms = 1000 * (time.perf_counter() - started) / len(scanned)
+        index_bytes = os.path.getsize(os.path.join(index_dir, INDEX_FILE))
+        index.close()
+
+    report = {
+        "entries": built["entries"],
+        "index_bytes": index_bytes,
+        "build_s": round(build_s, 2),
+        "unchanged_update_ms": round(update_ms, 1),
+        "rows_per_lookup": round(rows / len(sample), 2),
+        "csv_scan_ms": round(scan_ms, 1),
+        "index_lookup_us": round(lookup_us, 1),
+        "index_rows_us": round(rows_us, 1),
+    }
+    report["speedup_rows"] = round(1000 * scan_ms / rows_us)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Per-page timing of the single-pass job page extractor against the old
+three-script path.
+
+The old path parsed every page three times with BeautifulSoup
+(Parsers/application_ldplusjson.py, Parsers/show-more-less-html.py and
+Parsers/fixing_schemadotorg_descriptions.py, which parsed the schema.org
+description once more after html.unescape). Their parsing code is kept
+below as the reference the extractor is checked against:
+
+    python Benchmarks/job_page_benchmark.py
+    python Benchmarks/job_page_benchmark.py --fixtures /path/to/saved/job/pages
+"""
+import os
+import sys
+import json
+import html
+import time
+import argparse
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.job_page import extract_job_page  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+
+
+def legacy_ld_json(html_content):
+    soup = BeautifulSoup(html_content, 'html.parser')
+    extracted_data = []
+    for script in soup.find_all('script', {'type': 'application/ld+json'}):
+        if script.string:
+            try:
+                extracted_data.append(json.loads(script.string))
+            except json.JSONDecodeError:
+                continue
+    return extracted_data
+
+
+def legacy_show_more_less(html_content):
+    soup = BeautifulSoup(html_content, 'html.parser')
+    sections = soup.find_all('section', class_=lambda c: c and 'show-more-less-html' in c.split())
+
+    texts = []
+    for sec in sections:
+        target = sec.find('div', class_=lambda c: c and 'show-more-less-html__markup' in c) or sec
+
+        lines = []
+        for elem in target.descendants:
+            if not hasattr(elem, 'name'):
+                continue
+            if elem.name == 'p':
+                text = elem.get_text(strip=True)
+                if text:
+                    lines.append(text)
+                    lines.append('')
+            elif elem.name == 'br':
+                lines.append('')
+            elif elem.name == 'li':
+                text = elem.get_text(strip=True)
+                if text:
+                    lines.append(f"• {text}")
+            elif elem.name in ['ul', 'ol']:
+                if lines and lines[-1] != '':
+                    lines.append('')
+
+        cleaned = []
+        prev_blank = False
+        for line in lines:
+            if line == '':
+                if not prev_blank:
+                    cleaned.append(line)
+                    prev_blank = True
+            else:
+                cleaned.append(line)
+                prev_blank = False
+
+        text_block = '\n'.join(cleaned).strip()
+        if text_block:
+            texts.append(text_block)
+    return texts
+
+
+def legacy_description(raw_description):
+    soup = BeautifulSoup(html.unescape(raw_description), 'html.parser')
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+    for li in soup.find_all("li"):
+        li.insert_before("- ")
+        li.append("\n")
+    return soup.get_text().strip()
+
+
+def legacy_path(html_content):
+    ld_json = legacy_ld_json(html_content)
+    posting = next((d for d in ld_json if isinstance(d, dict) and d.get("@type") == "JobPosting"), {})
+    return {
+        "ld_json": ld_json,
+        "show_more_less": legacy_show_more_less(html_content),
+        "description": legacy_description(posting["description"]) if posting.get("description") else None,
+    }
+
+
+def time_per_page(func, pages, repeat):
+    """Best-of-`repeat` milliseconds per page."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            func(page)
+        best = min(best, time.perf_counter() - started)
+    return 1000 * best / len(pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", default=None,
+                        help="directory of saved job pages (*.html); default: the example page")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        paths = sorted(Path(args.fixtures).rglob("*.html"))
+    else:
+        paths = [Path(project_path("examples", "Ex_of_imp_elements.html"))]
+    pages = [path.read_text(encoding="utf-8", errors="replace") for path in paths]
+    if not pages:
+        sys.exit(f"No *.html pages found in {args.fixtures}")
+
+    mismatches = {"ld_json": 0, "show_more_less": 0, "description": 0}
+    for page in pages:
+        expected = legacy_path(page)
+        extracted = extract_job_page(page)
+        for field in mismatches:
+            if expected[field] != extracted[field]:
+                mismatches[field] += 1
+
+    legacy_ms = time_per_page(legacy_path, pages, args.repeat)
+    unified_ms = time_per_page(extract_job_page, pages, args.repeat)
+    report = {
+        "pages": len(pages),
+        "mismatches": mismatches,
+        "three_script_ms_per_page": round(legacy_ms, 3),
+        "single_pass_ms_per_page": round(unified_ms, 3),
+        "speedup": round(legacy_ms / unified_ms, 1) if unified_ms else 0.0,
+    }
+    print(json.dumps(report, indent=2))
+
+    if any(mismatches.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
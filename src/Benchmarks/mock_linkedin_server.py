@@ -0,0 +1,286 @@
+"""
+Local stand-in for LinkedIn's guest job search endpoint.
+
+Serves /jobs-guest/jobs/api/seeMoreJobPostings/search with card HTML in the
+same markup the real API returns, so the scraper can be benchmarked offline:
+
+    python Benchmarks/mock_linkedin_server.py --port 8080 --latency-ms 120
+    LINKEDIN_BASE_URL=http://127.0.0.1:8080/jobs-guest/jobs/api/seeMoreJobPostings/search \\
+        python Scraper.py --no-cache --output-dir /tmp/scraped
+
+Job pages are served under /jobs/view/<job_id> from a recorded page:
+
+    LINKEDIN_DETAIL_URL=http://127.0.0.1:8080/jobs/view/{job_id} python DetailScraper.py
+"""
+import os
+import sys
+import csv
+import gzip
+import json
+import random
+import asyncio
+import zlib
+import argparse
+from html import escape
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helpers.resolve_path import resolve_file_path  # noqa: E402
+
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+DETAIL_PATH = "/jobs/view/{job_id}"
+PAGE_SIZE = 10
+
+CARD_TEMPLATE = """<li>
+  <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}" data-impression-id="jobs-search-result-{position}" data-reference-id="{ref_id}" data-tracking-id="{tracking_id}" data-column="1" data-row="{position}">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="{link}" data-tracking-control-name="public_jobs_jserp-result_search-card" data-tracking-client-ingraph data-tracking-will-navigate>
+      <span class="sr-only">
+          {title}
+      </span>
+    </a>
+    <div class="search-entity-media">
+        <img class="artdeco-entity-image artdeco-entity-image--square-4" data-delayed-url="https://media.licdn.com/dms/image/v2/logo_{job_id}" data-ghost-classes="artdeco-entity-image--ghost" data-ghost-url="https://static.licdn.com/aero-v1/sc/h/cs8pjfgyw96g44ln9r7tct85f" alt="{company}">
+    </div>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+            {title}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+          <a class="hidden-nested-link" data-tracking-client-ingraph data-tracking-control-name="public_jobs_jserp-result_job-search-card-subtitle" data-tracking-will-navigate href="https://www.linkedin.com/company/{company_slug}?trk=public_jobs_jserp-result_job-search-card-subtitle">
+            {company}
+          </a>
+      </h4>
+      <div class="base-search-card__metadata">
+          <span class="job-search-card__location">
+            {location}
+          </span>
+          <div class="job-posting-benefits text-sm">
+            <icon class="job-posting-benefits__icon" data-delayed-url="https://static.licdn.com/aero-v1/sc/h/8zmuwb93z5ol2s2hgxmn8t5rk" data-svg-class-name="job-posting-benefits__icon-svg"></icon>
+            <span class="job-posting-benefits__text">
+              Actively Hiring
+            </span>
+          </div>
+          <time class="job-search-card__listdate" datetime="2025-11-{day:02d}">
+            {days_ago} days ago
+          </time>
+      </div>
+    </div>
+  </div>
+</li>
+"""
+
+
+def load_rows(csv_path, limit=5000):
+    """Read (title, company, location, link) rows used to generate cards."""
+    rows = []
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            if row.get("link"):
+                rows.append(row)
+            if len(rows) >= limit:
+                break
+    return rows
+
+
+def load_fixture_pages(fixtures_dir):
+    """
+    Load recorded search pages from a directory.
+
+    Accepts loose *.html files as well as response cache entries
+    (*.json.gz written by helpers/response_cache.py); empty bodies are skipped.
+    """
+    pages = []
+    for path in sorted(Path(fixtures_dir).rglob("*")):
+        if path.suffix == ".html":
+            body = path.read_text(encoding="utf-8", errors="replace")
+        elif path.name.endswith(".json.gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                body = json.load(f)["body"]
+        else:
+            continue
+        if body.strip():
+            pages.append(body)
+    return pages
+
+
+def render_card(row, job_id, position, rng):
+    slug_title = "-".join(row["title"].lower().split())[:60]
+    company = row["company"]
+    link = (
+        f"https://eg.linkedin.com/jobs/view/{slug_title}-at-"
+        f"{'-'.join(company.lower().split())}-{job_id}"
+        f"?position={position}&amp;pageNum=0&amp;refId={rng.getrandbits(64):x}"
+        f"&amp;trackingId={rng.getrandbits(64):x}"
+    )
+    days_ago = rng.randint(1, 28)
+    return CARD_TEMPLATE.format(
+        job_id=job_id,
+        position=position,
+        ref_id=f"{rng.getrandbits(64):x}",
+        tracking_id=f"{rng.getrandbits(64):x}",
+        link=link,
+        title=escape(row["title"]),
+        company=escape(company),
+        company_slug="-".join(company.lower().split()),
+        location=escape(row["location"]),
+        day=29 - days_ago,
+        days_ago=days_ago,
+    )
+
+
+class MockGuestAPI:
+    """
+    Request handler state of the stand-in server.
+
+    Args:
+        rows: Rows used to generate cards (ignored when `pages` is given)
+        pages: Recorded page bodies served instead of generated cards
+        results: Mean number of results per keyword; each (keywords,
+                 location) pair gets a deterministic count in [0, 2 * results]
+        latency_ms: Mean response latency
+        jitter_ms: Uniform spread around latency_ms
+        burst_every: Start a burst of 429s every this many requests (0 = never)
+        burst_length: Length of each 429 burst
+        retry_after: Retry-After value (seconds) sent with every 429
+        detail_page: Job page served for every /jobs/view/<job_id>
+        gone_every: Answer every N-th job ID with a 404 (0 = never)
+    """
+
+    def __init__(self, rows=None, pages=None, results=75, latency_ms=100.0,
+                 jitter_ms=50.0, burst_every=0, burst_length=5, retry_after=1,
+                 detail_page="", gone_every=0):
+        self.rows = rows or []
+        self.pages = pages or []
+        self.detail_page = detail_page
+        self.gone_every = gone_every
+        self.results = results
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.retry_after = retry_after
+        self.requests = 0
+        self.stats = {"pages": 0, "empty": 0, "throttled": 0, "details": 0, "gone": 0}
+
+    def result_count(self, keywords, location):
+        # Deterministic per keyword so repeated runs see the same result sets
+        seed = zlib.crc32(f"{keywords}|{location}".encode("utf-8"))
+        return seed % (2 * self.results + 1)
+
+    def render_page(self, keywords, location, start):
+        total = self.result_count(keywords, location)
+        if start >= total:
+            return ""
+
+        if self.pages:
+            return self.pages[(start // PAGE_SIZE) % len(self.pages)]
+
+        rng = random.Random(zlib.crc32(f"{keywords}|{location}|{start}".encode("utf-8")))
+        cards = []
+        for offset in range(min(PAGE_SIZE, total - start)):
+            index = start + offset
+            row = self.rows[(zlib.crc32(keywords.encode("utf-8")) + index) % len(self.rows)]
+            job_id = 4_000_000_000 + zlib.crc32(f"{keywords}|{location}|{index}".encode("utf-8")) % 400_000_000
+            cards.append(render_card(row, job_id, offset + 1, rng))
+        return "".join(cards)
+
+    async def _delay_or_throttle(self):
+        """Sleep for the simulated latency; returns a 429 response during a burst."""
+        self.requests += 1
+        delay = max(0.0, self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms))
+        await asyncio.sleep(delay / 1000)
+
+        if self.burst_every and self.requests % self.burst_every < self.burst_length:
+            self.stats["throttled"] += 1
+            return web.Response(status=429, headers={"Retry-After": str(self.retry_after)})
+        return None
+
+    async def handle_search(self, request):
+        throttled = await self._delay_or_throttle()
+        if throttled is not None:
+            return throttled
+
+        query = request.rel_url.query
+        body = self.render_page(
+            query.get("keywords", ""), query.get("location", ""), int(query.get("start", 0))
+        )
+        self.stats["empty" if not body else "pages"] += 1
+        return web.Response(text=body, content_type="text/html")
+
+    async def handle_detail(self, request):
+        throttled = await self._delay_or_throttle()
+        if throttled is not None:
+            return throttled
+
+        job_id = int(request.match_info["job_id"])
+        if not self.detail_page or (self.gone_every and job_id % self.gone_every == 0):
+            self.stats["gone"] += 1
+            return web.Response(status=404)
+
+        self.stats["details"] += 1
+        return web.Response(text=self.detail_page, content_type="text/html")
+
+    async def handle_stats(self, request):
+        return web.json_response({"requests": self.requests, **self.stats})
+
+
+def make_app(api):
+    app = web.Application()
+    app.router.add_get(SEARCH_PATH, api.handle_search)
+    app.router.add_get(DETAIL_PATH, api.handle_detail)
+    app.router.add_get("/_stats", api.handle_stats)
+    return app
+
+
+def build_api(args):
+    pages = load_fixture_pages(args.fixtures) if args.fixtures else None
+    rows = None if pages else load_rows(resolve_file_path(args.rows_csv))
+    return MockGuestAPI(
+        rows=rows,
+        pages=pages,
+        results=args.results,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        retry_after=args.retry_after,
+        detail_page=Path(resolve_file_path(args.detail_page)).read_text(encoding="utf-8"),
+        gone_every=args.gone_every,
+    )
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", default=None,
+                        help="directory of recorded pages (*.html or response cache *.json.gz)")
+    parser.add_argument("--rows-csv",
+                        default="../../Data/Scraped/Egypt/Software Engineering/Software Engineering.csv",
+                        help="CSV whose rows are turned into generated cards")
+    parser.add_argument("--results", type=int, default=75,
+                        help="mean results per keyword (the tail after it is empty)")
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--burst-every", type=int, default=0,
+                        help="start a burst of 429s every N requests (0 = never)")
+    parser.add_argument("--burst-length", type=int, default=5)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--detail-page",
+                        default="../../Data/HTML_example_parsing_issues/Ex_of_imp_elements.html",
+                        help="recorded job page served for /jobs/view/<job_id>")
+    parser.add_argument("--gone-every", type=int, default=0,
+                        help="answer every N-th job ID with a 404 (0 = never)")
+    return parser
+
+
+def serve(args):
+    """Run the stand-in server until interrupted."""
+    api = build_api(args)
+    print(f"Mock guest API on http://{args.host}:{args.port}{SEARCH_PATH}")
+    web.run_app(make_app(api), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    serve(add_server_arguments(argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])).parse_args())
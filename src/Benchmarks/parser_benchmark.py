@@ -0,0 +1,101 @@
+"""
+Search-card parser benchmark over recorded pages.
+
+Parses every page with each backend of helpers/card_parser.py, checks that
+the results are field-for-field equal to BeautifulSoup's and reports cards/s:
+
+    python Benchmarks/parser_benchmark.py --fixtures ../Data/Cache/responses
+    python Benchmarks/parser_benchmark.py --generate 500
+
+Without --fixtures the response cache is used; if it is empty, pages are
+generated from the stand-in server's card template.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_linkedin_server import MockGuestAPI, load_fixture_pages, load_rows  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+from helpers.resolve_path import resolve_file_path  # noqa: E402
+from helpers import card_parser  # noqa: E402
+
+
+def generated_pages(rows_csv, count):
+    api = MockGuestAPI(rows=load_rows(resolve_file_path(rows_csv)), results=10 * count)
+    return [api.render_page(f"benchmark {i}", "Egypt", 0) for i in range(count)]
+
+
+def time_backend(parse, pages, repeat):
+    """Best-of-`repeat` wall time to parse all pages, and the cards found."""
+    best = float("inf")
+    cards = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cards = sum(len(parse(page)) for page in pages)
+        best = min(best, time.perf_counter() - started)
+    return best, cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", default=None,
+                        help="directory of recorded pages (*.html or response cache *.json.gz)")
+    parser.add_argument("--generate", type=int, default=0,
+                        help="benchmark N generated pages instead of recorded ones")
+    parser.add_argument("--rows-csv",
+                        default="../../Data/Scraped/Egypt/Software Engineering/Software Engineering.csv",
+                        help="CSV whose rows are turned into generated cards")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = []
+    if not args.generate:
+        fixtures = args.fixtures or project_path("cache", "responses")
+        if os.path.isdir(fixtures):
+            pages = load_fixture_pages(fixtures)
+    source = "recorded"
+    if not pages:
+        pages = generated_pages(args.rows_csv, args.generate or 200)
+        source = "generated"
+
+    # Field-for-field check against the reference parser
+    mismatches = 0
+    fast_failures = 0
+    for page in pages:
+        reference = card_parser.parse_cards_bs4(page)
+        try:
+            fast = card_parser.parse_cards_fast(page)
+        except card_parser.CardMarkupError:
+            fast_failures += 1
+            continue
+        if fast != reference:
+            mismatches += 1
+
+    report = {"pages": len(pages), "source": source, "mismatches": mismatches,
+              "fast_fallbacks": fast_failures, "backends": {}}
+
+    for name, parse in card_parser.BACKENDS.items():
+        card_parser.configure_card_parser(name)
+        elapsed, cards = time_backend(card_parser.parse_cards, pages, args.repeat)
+        report["backends"][name] = {
+            "cards": cards,
+            "seconds": round(elapsed, 3),
+            "cards_per_s": round(cards / elapsed) if elapsed else 0,
+            "ms_per_page": round(1000 * elapsed / len(pages), 3) if pages else 0.0,
+        }
+
+    bs4_s = report["backends"]["bs4"]["seconds"]
+    fast_s = report["backends"]["fast"]["seconds"]
+    report["speedup"] = round(bs4_s / fast_s, 1) if fast_s else 0.0
+    print(json.dumps(report, indent=2))
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Per-call cost of resolving project paths.
+
+Compares the old caller-relative resolution (inspect.stack(), kept below
+as the reference) with the frame lookup resolve_file_path now uses and
+with the path registry of helpers/paths.py. Calls are made --depth frames
+deep, since inspect.stack() pays for every frame above the caller (the
+scraper writes from inside the event loop, a few dozen frames down):
+
+    python Benchmarks/path_benchmark.py
+    python Benchmarks/path_benchmark.py --depth 60 --calls 2000
+"""
+import os
+import sys
+import json
+import time
+import inspect
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.makefolder import ensure_dir  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+from helpers.resolve_path import resolve_file_path  # noqa: E402
+
+
+def legacy_resolve_file_path(file_path, base_dir=None):
+    if os.path.isabs(file_path):
+        return os.path.abspath(file_path)
+    if base_dir is not None:
+        return os.path.abspath(os.path.join(base_dir, file_path))
+    caller_frame = inspect.stack()[1]
+    caller_file = caller_frame.filename
+    caller_dir = os.path.dirname(os.path.abspath(caller_file))
+    return os.path.abspath(os.path.join(caller_dir, file_path))
+
+
+def at_depth(depth, func):
+    """Run `func()` with `depth` extra frames on the stack."""
+    if depth <= 0:
+        return func()
+    return at_depth(depth - 1, func)
+
+
+def per_call_us(func, calls, depth):
+    def loop():
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        return time.perf_counter() - started
+    return 1e6 * min(at_depth(depth, loop) for _ in range(3)) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=30)
+    args = parser.parse_args()
+
+    # ensure_dir logs every call at debug level; only the resolution is timed
+    logging.disable(logging.INFO)
+
+    relative = "../../Data/Scraped/Egypt"
+    expected = project_path("scraped", "Egypt")
+    results = {
+        "legacy_inspect_stack": (lambda: legacy_resolve_file_path(relative)),
+        "resolve_file_path": (lambda: resolve_file_path(relative)),
+        "project_path": (lambda: project_path("scraped", "Egypt")),
+        "ensure_dir_relative": (lambda: ensure_dir(relative)),
+        "ensure_dir_registry_path": (lambda: ensure_dir(expected)),
+    }
+
+    # Same directory either way (this file and helpers/ are both two levels below the root)
+    assert legacy_resolve_file_path(relative) == resolve_file_path(relative) == expected
+
+    report = {"calls": args.calls, "depth": args.depth}
+    for name, func in results.items():
+        report[f"{name}_us"] = round(per_call_us(func, args.calls, args.depth), 2)
+    report["speedup_resolve"] = round(report["legacy_inspect_stack_us"] / report["resolve_file_path_us"], 1)
+    report["speedup_registry"] = round(report["legacy_inspect_stack_us"] / report["project_path_us"], 1)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
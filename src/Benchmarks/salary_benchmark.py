@@ -0,0 +1,117 @@
+"""
+Throughput of the column-wise salary engine against parsing row by row.
+
+The corpus is built from the example page (its compensation__salary div
+and the salary range of its schema.org description) plus a few salary
+formats of the other scraped countries, repeated to --rows rows. The
+reference runs the same patterns with Python's re one row at a time, the
+way a DataFrame.apply over the records would:
+
+    python Benchmarks/salary_benchmark.py
+    python Benchmarks/salary_benchmark.py --rows 1000000
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers import salary  # noqa: E402
+from helpers.job_page import extract_job_page, job_record  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+
+EXAMPLE_PAGE = project_path("examples", "Ex_of_imp_elements.html")
+
+OTHER_FORMATS = [
+    "EGP 20,000 to 30,000 per month",
+    "10 000 - 15 000 zł",
+    "60.000 € - 75.000 € per year",
+    "£40,000 annually",
+    "$45/hr",
+    "$120k-$150k",
+    "R$ 8.500,00/mo",
+    "No salary listed",
+]
+
+
+def example_texts():
+    with open(EXAMPLE_PAGE, "r", encoding="utf-8") as f:
+        record = job_record(extract_job_page(f.read()))
+    # Keep the sentence around the range, not the whole description
+    start = record["description"].find("$")
+    return [record["salary_text"], record["description"][max(0, start - 80):start + 80]]
+
+
+def reference(texts, strict=False):
+    """Per-row parse with the same patterns and tables."""
+    prefixed, suffixed = re.compile(salary.PREFIXED), re.compile(salary.SUFFIXED)
+    rows = []
+    for text in texts:
+        row = [np.nan, np.nan, None, None]
+        match = (prefixed.search(text) or suffixed.search(text)) if text else None
+        if match:
+            parts = match.groupdict()
+            numbers = []
+            for n in ("1", "2"):
+                if parts.get(f"int{n}"):
+                    value = float(re.sub(r"[,.\s]", "", parts[f"int{n}"]) + "." + (parts[f"dec{n}"] or "0"))
+                    numbers.append(value * 1000 if parts[f"k{n}"] else value)
+            currency = salary.CURRENCIES[parts["cur1"].lower()]
+            period = parts.get("per2") or parts.get("per1")
+            row = [min(numbers), max(numbers), "USD" if currency == "$" else currency,
+                   salary.PERIODS[period.lower()] if period else None]
+            if strict and len(numbers) == 1 and period is None:
+                row = [np.nan, np.nan, None, None]
+        rows.append(row)
+    return pd.DataFrame(rows, columns=salary.COLUMNS[:4])
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    formats = example_texts() + OTHER_FORMATS
+    texts = pd.Series((formats * (args.rows // len(formats) + 1))[:args.rows])
+
+    vector_s, vectorized = best_of(lambda: salary.parse_salaries(texts), args.repeat)
+    row_s, expected = best_of(lambda: reference(texts), args.repeat)
+
+    mismatches = int((~(
+        (vectorized.isna() & expected.isna()) | (vectorized.astype(object) == expected.astype(object))
+    )).any(axis=1).sum())
+    sample = vectorized.iloc[:len(formats)].assign(text=formats)
+
+    report = {
+        "rows": len(texts),
+        "arrow_regex": salary.pa is not None,
+        "mismatches": mismatches,
+        "per_row_rows_per_s": round(len(texts) / row_s),
+        "vectorized_rows_per_s": round(len(texts) / vector_s),
+        "speedup": round(row_s / vector_s, 1),
+    }
+    print(sample.to_string())
+    print(json.dumps(report, indent=2))
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
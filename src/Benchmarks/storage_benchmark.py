@@ -0,0 +1,96 @@
+"""
+Size on disk and full-scan load time of the scraped CSV tree against the
+partitioned Parquet dataset.
+
+The dataset is converted from the CSVs into a temporary directory unless
+--dataset points at an existing one:
+
+    python Benchmarks/storage_benchmark.py
+    python Benchmarks/storage_benchmark.py --dataset ../Data/Dataset --repeat 5
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_to_dataset import iter_category_csvs, convert  # noqa: E402
+from helpers.columnar_store import load_dataset  # noqa: E402
+from helpers.paths import project_path  # noqa: E402
+
+
+def tree_bytes(root, suffix):
+    return sum(
+        os.path.getsize(os.path.join(dirpath, name))
+        for dirpath, _, files in os.walk(root) for name in files if name.endswith(suffix)
+    )
+
+
+def load_csv_tree(scraped_dir):
+    frames = []
+    for country, category, csv_path in iter_category_csvs(scraped_dir):
+        frame = pd.read_csv(csv_path)
+        frame["country"] = country
+        frame["category"] = category
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def run(scraped_dir, dataset_dir, repeat):
+    csv_s, csv_frame = best_of(lambda: load_csv_tree(scraped_dir), repeat)
+    parquet_s, parquet_frame = best_of(lambda: load_dataset(dataset_dir), repeat)
+    column_s, _ = best_of(lambda: load_dataset(dataset_dir, columns=["company"]), repeat)
+
+    csv_bytes = tree_bytes(scraped_dir, ".csv")
+    parquet_bytes = tree_bytes(dataset_dir, ".parquet")
+    return {
+        "rows_csv": len(csv_frame),
+        "rows_parquet": len(parquet_frame),
+        "csv_mb": round(csv_bytes / 1e6, 1),
+        "parquet_mb": round(parquet_bytes / 1e6, 1),
+        "size_ratio": round(csv_bytes / parquet_bytes, 1),
+        "csv_load_s": round(csv_s, 3),
+        "parquet_load_s": round(parquet_s, 3),
+        "load_speedup": round(csv_s / parquet_s, 1),
+        "parquet_one_column_s": round(column_s, 3),
+        "csv_memory_mb": round(csv_frame.memory_usage(deep=True).sum() / 1e6, 1),
+        "parquet_memory_mb": round(parquet_frame.memory_usage(deep=True).sum() / 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scraped", default=project_path("scraped"))
+    parser.add_argument("--dataset", default=None,
+                        help="existing dataset directory (default: convert into a temporary one)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.dataset:
+        report = run(args.scraped, args.dataset, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            convert(args.scraped, tmp)
+            report = run(args.scraped, tmp, args.repeat)
+
+    print(json.dumps(report, indent=2))
+    if report["rows_csv"] != report["rows_parquet"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
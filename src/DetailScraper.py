@@ -0,0 +1,62 @@
+import asyncio
+import argparse
+
+from helpers.paths import project_path
+from helpers.job_details import JobDetailStore, crawl_job_details, read_job_ids
+from helpers.parse_pool import configure_parse_pool, close_parse_pool
+from helpers.page_archive import configure_page_archive, close_page_archive
+
+URLS_FILE = project_path("processed", "urls_only.txt")
+DETAILS_FILE = project_path("processed", "job_details.jsonl")
+ARCHIVE_DIR = project_path("archive")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch the detail page of every scraped job.")
+    parser.add_argument("--input", default=URLS_FILE,
+                        help="file of job links or IDs, one per line, optionally .gz (default: urls_only.txt "
+                             "written by extract_links.py)")
+    parser.add_argument("--output", default=DETAILS_FILE,
+                        help="JSONL file of job records; jobs already in it are skipped")
+    parser.add_argument("--max-concurrent", type=int, default=8,
+                        help="global number of requests in flight")
+    parser.add_argument("--per-host", type=int, default=6,
+                        help="requests in flight against a single host")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse pages in N worker processes (0 = on the event loop)")
+    parser.add_argument("--limit", type=int, default=0,
+                        help="only consider the first N job IDs (0 = all)")
+    parser.add_argument("--archive", nargs="?", const=ARCHIVE_DIR, default=None, metavar="DIR",
+                        help="also keep every fetched job page in a compressed page archive "
+                             "(default: Data/Archive)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    job_ids = read_job_ids(args.input)
+    if args.limit:
+        job_ids = job_ids[:args.limit]
+
+    store = JobDetailStore(args.output)
+    print(f"{len(job_ids)} jobs listed, {len(store.done)} already recorded in {args.output}")
+
+    configure_parse_pool(args.parse_workers)
+    configure_page_archive(args.archive)
+    try:
+        stats = asyncio.run(crawl_job_details(
+            job_ids, store, max_concurrent=args.max_concurrent, per_host=args.per_host,
+        ))
+    finally:
+        close_parse_pool()
+        close_page_archive()
+        store.close()
+
+    print(f"Done: {stats}")
+    if stats["failed"]:
+        print(f"{stats['failed']} jobs failed and will be retried on the next run")
+
+
+if __name__ == "__main__":
+    main()
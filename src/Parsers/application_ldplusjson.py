@@ -1,35 +1,25 @@
 import os
 import json
 import sys
-from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helpers.job_page import extract_job_page  # noqa: E402
+from helpers.page_archive import read_page, page_stem  # noqa: E402
 
 def extract_ld_json_content(html_file_path):
-    # 1. Open and parse the file
-    with open(html_file_path, 'r', encoding='utf-8') as file:
-        soup = BeautifulSoup(file, 'html.parser')
+    # 1. Open and parse the file, or <archive dir>:<job_id> from the page archive
+    #    (one pass, see helpers/job_page.py)
+    extracted_data = extract_job_page(read_page(html_file_path))["ld_json"]
 
-    scripts = soup.find_all('script', {'type': 'application/ld+json'})
-    
-    if not scripts:
+    if not extracted_data:
         print("No LD+JSON found.")
         return
 
     # 2. Construct the output file path
-    # Get the directory and the base filename (without extension)
-    base_path = os.path.splitext(html_file_path)[0]
-    output_path = f"{base_path}_extracted.json"
-
-    # 3. Extract and save content
-    extracted_data = []
-    for script in scripts:
-        if script.string:
-            try:
-                json_content = json.loads(script.string)
-                extracted_data.append(json_content)
-            except json.JSONDecodeError:
-                continue
+    # Next to the page file, or <job_id>_extracted.json for an archived page
+    output_path = f"{page_stem(html_file_path)}_extracted.json"
 
-    # 4. Write to the new file
+    # 3. Write to the new file
     with open(output_path, 'w', encoding='utf-8') as outfile:
         json.dump(extracted_data, outfile, indent=2, ensure_ascii=False)
     
@@ -37,7 +27,7 @@ def extract_ld_json_content(html_file_path):
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
-        print("Usage: python script.py <path_to_html_file>")
+        print("Usage: python script.py <path_to_html_file | archive_dir:job_id>")
         sys.exit(1)
     
     extract_ld_json_content(sys.argv[1])
\ No newline at end of file
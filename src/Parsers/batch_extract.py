@@ -0,0 +1,248 @@
+"""
+Batch mode of the job page parsers.
+
+Extracts every saved job page of a directory, glob, tar/zip archive or page
+archive (helpers/page_archive.py) in a pool of worker processes and streams one record per page to a single JSONL
+(or Parquet) file:
+
+    python Parsers/batch_extract.py ../Data/Pages -o ../Data/Processed/pages.jsonl
+    python Parsers/batch_extract.py "pages/**/*.html" pages.tar.gz -o pages.parquet --workers 8
+    python Parsers/batch_extract.py ../Data/Archive -o ../Data/Processed/pages.jsonl
+
+Every record holds the source name plus the fields of helpers/job_page.py
+(LD+JSON posting fields, salary, criteria, description); --full also keeps
+the raw LD+JSON objects and show-more-less-html sections.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import tarfile
+import zipfile
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helpers.job_page import extract_job_page, job_record  # noqa: E402
+from helpers.normalize import extract_job_id  # noqa: E402
+from helpers.page_archive import PageArchive, is_page_archive  # noqa: E402
+
+PAGE_SUFFIXES = (".html", ".htm")
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".zip")
+
+# Columns of a flattened job record
+RECORD_FIELDS = list(job_record({"ld_json": [], "criteria": {}, "salary_text": None, "description": None}))
+
+
+def iter_pages(inputs):
+    """
+    Yield (name, raw bytes) for every page of the inputs, one at a time.
+
+    Args:
+        inputs: Directories (searched recursively), glob patterns, single
+                pages, tar/zip archives or page archives
+    """
+    for item in inputs:
+        if os.path.isdir(item) and is_page_archive(item):
+            yield from iter_page_archive(item)
+        elif os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                for name in sorted(files):
+                    if name.lower().endswith(PAGE_SUFFIXES):
+                        path = os.path.join(root, name)
+                        with open(path, "rb") as f:
+                            yield path, f.read()
+        elif item.lower().endswith(ARCHIVE_SUFFIXES) and os.path.isfile(item):
+            yield from iter_archive(item)
+        elif os.path.isfile(item):
+            with open(item, "rb") as f:
+                yield item, f.read()
+        else:
+            paths = sorted(glob.glob(item, recursive=True))
+            if not paths:
+                print(f"[!] Nothing matches {item}")
+            yield from iter_pages(paths)
+
+
+def iter_archive(path):
+    """Yield (member name, raw bytes) of every page inside a tar or zip archive."""
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(PAGE_SUFFIXES):
+                    yield f"{path}:{info.filename}", archive.read(info)
+        return
+
+    # Streaming mode reads the archive front to back without seeking
+    with tarfile.open(path, "r|*") as archive:
+        for member in archive:
+            if member.isfile() and member.name.lower().endswith(PAGE_SUFFIXES):
+                yield f"{path}:{member.name}", archive.extractfile(member).read()
+
+
+def iter_page_archive(path):
+    """Yield (<archive>:<job_id>, raw bytes) of every job page in a page archive, in storage order."""
+    archive = PageArchive(path, readonly=True)
+    try:
+        for job_id, raw in archive.iter_pages(archive.job_ids()):
+            yield f"{path}:{job_id}", raw
+    finally:
+        archive.close()
+
+
+def extract_record(name, raw, full=False):
+    """Decode and extract one page; runs in a worker process."""
+    try:
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        # Fallback for files with different encoding
+        content = raw.decode("latin-1")
+
+    record = {"source": name, "job_id": extract_job_id(name) or _id_from_name(name)}
+    try:
+        extracted = extract_job_page(content)
+    except Exception as e:
+        record["error"] = str(e)
+        return record
+
+    record.update(job_record(extracted))
+    if full:
+        record["ld_json"] = extracted["ld_json"]
+        record["show_more_less"] = extracted["show_more_less"]
+    return record
+
+
+def _id_from_name(name):
+    # Pages saved as <job_id>.html, or archived as <archive>:<job_id>
+    stem = os.path.splitext(os.path.basename(name.rpartition(":")[2]))[0]
+    return int(stem) if stem.isdigit() else None
+
+
+class JsonlSink:
+    def __init__(self, path):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSink:
+    """Buffers records and writes them as Parquet row groups (needs pyarrow)."""
+
+    def __init__(self, path, full=False, row_group_size=10_000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow: pip install pyarrow")
+
+        # Fixed schema, so a row group whose column is all empty still matches the others
+        types = {"job_id": pa.int64(), "salary_min": pa.float64(), "salary_max": pa.float64(),
+                 "has_ld_json": pa.bool_()}
+        names = ["source", "job_id", "error", *RECORD_FIELDS]
+        if full:
+            names += ["ld_json", "show_more_less"]
+        self.schema = pa.schema([(name, types.get(name, pa.string())) for name in names])
+
+        self._pa = pa
+        self._writer = pq.ParquetWriter(path, self.schema)
+        self._rows = []
+        self.row_group_size = row_group_size
+
+    def write(self, record):
+        # Nested values are stored as JSON strings
+        self._rows.append({
+            key: json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value
+            for key, value in record.items()
+        })
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+def run_batch(inputs, output, workers=None, full=False, max_pending=None, progress_every=5.0):
+    """
+    Extract every page of `inputs` into `output` across a process pool.
+
+    At most `max_pending` pages are read ahead of the workers, and records
+    are written in input order as they complete.
+
+    Returns:
+        Dict with pages, errors, bytes and throughput
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 4 * workers
+    sink = ParquetSink(output, full=full) if output.endswith(".parquet") else JsonlSink(output)
+
+    stats = {"pages": 0, "errors": 0, "bytes": 0}
+    started = last_report = time.perf_counter()
+    pending = deque()
+
+    def drain_one():
+        nonlocal last_report
+        record = pending.popleft().result()
+        sink.write(record)
+        stats["pages"] += 1
+        stats["errors"] += "error" in record
+
+        now = time.perf_counter()
+        if now - last_report >= progress_every:
+            last_report = now
+            elapsed = now - started
+            print(f"{stats['pages']} pages, {stats['pages'] / elapsed:.1f} pages/s, "
+                  f"{stats['bytes'] / elapsed / 1e6:.1f} MB/s")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for name, raw in iter_pages(inputs):
+                stats["bytes"] += len(raw)
+                pending.append(pool.submit(extract_record, name, raw, full))
+                if len(pending) >= max_pending:
+                    drain_one()
+            while pending:
+                drain_one()
+    finally:
+        sink.close()
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed_s"] = round(elapsed, 2)
+    stats["pages_per_s"] = round(stats["pages"] / elapsed, 1) if elapsed else 0.0
+    stats["mb_per_s"] = round(stats["bytes"] / elapsed / 1e6, 2) if elapsed else 0.0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("inputs", nargs="+",
+                        help="directories, glob patterns, pages or tar/zip archives of pages")
+    parser.add_argument("-o", "--output", required=True,
+                        help="output file (.jsonl, or .parquet with pyarrow installed)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--full", action="store_true",
+                        help="also keep the raw LD+JSON objects and show-more-less sections")
+    args = parser.parse_args()
+
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    os.makedirs(output_dir, exist_ok=True)
+
+    stats = run_batch(args.inputs, args.output, workers=args.workers, full=args.full)
+    print(f"Done: {json.dumps(stats)}")
+    print(f"Saved {stats['pages']} records to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 import json
 import html
 import os
-from bs4 import BeautifulSoup
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helpers.job_page import description_text  # noqa: E402
 
 def parse_description_to_txt(json_input):
     # 1. Parse the JSON string to get the 'description' field
@@ -16,17 +19,8 @@ def parse_description_to_txt(json_input):
     # 2. Convert HTML entities (e.g., &lt; to <)
     unescaped_html = html.unescape(raw_description)
 
-    # 3. Use BeautifulSoup to remove tags and handle line breaks
-    soup = BeautifulSoup(unescaped_html, 'html.parser')
-    
-    # Replace <br> and </li> with actual newlines for readability
-    for br in soup.find_all("br"):
-        br.replace_with("\n")
-    for li in soup.find_all("li"):
-        li.insert_before("- ")
-        li.append("\n")
-
-    clean_text = soup.get_text()
+    # 3. Remove tags; <br> and </li> become newlines, <li> a "- " bullet
+    clean_text = description_text(unescaped_html)
 
     # 4. Save to a .txt file
     output_filename = "job_description.txt"
@@ -1,8 +1,21 @@
 import os
+import shutil
+import argparse
 
-from helpers.resolve_path import resolve_file_path
-from helpers.LinkedinAPI2 import scrape_linkedin_jobs
-from helpers.makefolder import ensure_dir, ensure_file, append_to_csv
+from helpers.paths import project_path
+from helpers.scheduler import run_crawl
+from helpers.pagination import load_history, save_history
+from helpers.checkpointing import CrawlJournal
+from helpers.seen_jobs import SeenJobs
+from helpers.sharding import shard_plan, run_shards, merge_shards
+from helpers.card_parser import BACKENDS, configure_card_parser
+from helpers.parse_pool import configure_parse_pool, close_parse_pool
+from helpers.response_cache import DEFAULT_TTL, configure_response_cache
+from helpers.columnar_store import configure_dataset_writer, close_dataset_writer, get_dataset_writer
+from helpers.sqlite_store import configure_job_store, close_job_store, get_job_store
+from helpers.page_archive import configure_page_archive, close_page_archive
+from helpers.makefolder import ensure_dir, ensure_file, save_to_csv
+from helpers.csv_writer import configure_csv_writer, close_csv_writer, get_csv_writer
 
 from helpers.data_fetcher_from_Json_DS import (
     length_of,
@@ -10,15 +23,22 @@ from helpers.data_fetcher_from_Json_DS import (
     make_jobs_dictionary,
 )
 
-json_file = resolve_file_path("../Data/CS_Job_Titles_Categorized.json")
+json_file = project_path("data", "CS_Job_Titles_Categorized.json")
 
 jobs_dict = make_jobs_dictionary(json_file)
 categories_list = make_category_list(jobs_dict)
 
 categories_number = length_of(categories_list)
 
-BASE_DIR = "../../Data"
-SCRAPED_DIR = os.path.join(BASE_DIR, "Scraped")
+SCRAPED_DIR = project_path("scraped")
+FAILED_PAGES_CSV = project_path("processed", "failed_pages.csv")
+HISTORY_FILE = project_path("processed", "pagination_history.json")
+CACHE_DIR = project_path("cache", "responses")
+JOURNAL_FILE = project_path("processed", "crawl_journal.jsonl")
+SHARD_ROOT = project_path("cache", "shards")
+DATASET_DIR = project_path("dataset")
+SQLITE_FILE = project_path("processed", "jobs.sqlite")
+ARCHIVE_DIR = project_path("archive")
 
 COUNTRIES = [
     "United States","Germany","Canada", # 1st class
@@ -27,41 +47,255 @@ COUNTRIES = [
 ]
 
 
-def main():
-    ensure_dir(SCRAPED_DIR)
+def build_plan(scraped_dir=SCRAPED_DIR):
+    """Create the output tree and list every (country, category, keyword) to crawl."""
+    ensure_dir(scraped_dir)
+    plan = []
 
     for country in COUNTRIES:
-        country_dir = os.path.join(SCRAPED_DIR, country)
+        country_dir = os.path.join(scraped_dir, country)
         ensure_dir(country_dir)
-        print(f"working on: {country}")
 
         for category_name in categories_list:
             category_dir = os.path.join(country_dir, category_name)
             ensure_dir(category_dir)
-            print(f"Scraping {category_name}:")
 
             # Define the specific CSV file path for this category
             csv_filename = f"{category_name}.csv"
             csv_path = os.path.join(category_dir, csv_filename)
 
-            # Ensure the file exists (optional, append_to_csv handles it)
-            ensure_file(csv_path)
+            # Ensure the file exists; the absolute path is what the journal records
+            csv_path = ensure_file(csv_path)
+
+            for job in jobs_dict[category_name]:
+                plan.append({
+                    "country": country,
+                    "category": category_name,
+                    "keyword": job,
+                    "csv_path": csv_path,
+                })
+
+    return plan
+
+
+def save_results(entry, results):
+    """Hand one completed batch of a keyword to the writer of its category CSV."""
+    for item in results:
+        item['search_keyword'] = entry["keyword"]
+
+    get_csv_writer().write(entry["csv_path"], results)
+    dataset = get_dataset_writer()
+    if dataset is not None:
+        dataset.write(results, entry["country"], entry["category"])
+    store = get_job_store()
+    if store is not None:
+        store.write(results, entry["country"], entry["category"])
+    print(f"    Saved {len(results)} results for {entry['keyword']} ({entry['country']})")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn guest job listings.")
+    parser.add_argument("--max-concurrent", type=int, default=8,
+                        help="global number of requests in flight")
+    parser.add_argument("--per-host", type=int, default=6,
+                        help="requests in flight against a single host")
+    parser.add_argument("--max-keywords", type=int, default=16,
+                        help="keywords paginated at the same time")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="don't read or store raw responses in the response cache")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL / 3600,
+                        help="hours a cached response stays fresh (default: 168)")
+    parser.add_argument("--replay", action="store_true",
+                        help="run the whole pipeline from the response cache, no network "
+                             "(needs --output-dir)")
+    parser.add_argument("--output-dir", default=None,
+                        help="write CSVs here instead of Data/Scraped (required with --replay)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="start a new crawl instead of resuming an interrupted one")
+    parser.add_argument("--keep-duplicates", action="store_true",
+                        help="write postings again when another keyword already found them")
+    parser.add_argument("--bloom", action="store_true",
+                        help="track seen job IDs in a Bloom filter (bounded memory)")
+    parser.add_argument("--parser", choices=sorted(BACKENDS), default="fast",
+                        help="search-card parser (fast falls back to bs4 on unusual markup)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="parse pages in N worker processes (0 = on the event loop)")
+    parser.add_argument("--shards", type=int, default=1,
+                        help="crawl in N worker processes, each with the budgets above")
+    parser.add_argument("--flush-rows", type=int, default=5000,
+                        help="buffered rows that trigger a write to the CSVs")
+    parser.add_argument("--flush-interval", type=float, default=5.0,
+                        help="seconds after which buffered rows are written to the CSVs")
+    parser.add_argument("--dataset", action="store_true",
+                        help="also write rows to the partitioned Parquet dataset in Data/Dataset "
+                             "(needs pyarrow; the CSVs stay the resumable record, rebuild the "
+                             "dataset with csv_to_dataset.py after an interrupted run)")
+    parser.add_argument("--sqlite", action="store_true",
+                        help="also upsert rows into the SQLite database Data/Processed/jobs.sqlite, "
+                             "keyed by job ID (with --keep-duplicates it maps every keyword that "
+                             "surfaced a posting)")
+    parser.add_argument("--archive", action="store_true",
+                        help="also keep every fetched search page in the compressed page archive "
+                             "Data/Archive, for re-parsing later")
+    args = parser.parse_args()
+    if args.replay and not args.output_dir:
+        # Re-parsing the cache into Data/Scraped would append a second copy of the corpus
+        parser.error("--replay needs --output-dir, it must not write to the live Data/Scraped CSVs")
+    if args.archive and args.shards > 1:
+        parser.error("--archive has a single writer and can't be combined with --shards")
+    return args
+
+
+def configure(args):
+    """Set up the process-wide response cache and card parser from the command line."""
+    configure_card_parser(args.parser)
+    if args.replay or not args.no_cache:
+        configure_response_cache(CACHE_DIR, ttl=args.cache_ttl * 3600, replay=args.replay)
+
+
+def dataset_root(args):
+    """Directory of the Parquet dataset, or None when it isn't written."""
+    if not args.dataset:
+        return None
+    return os.path.join(os.path.abspath(args.output_dir), "dataset") if args.output_dir else DATASET_DIR
+
+
+def sqlite_path(args):
+    """SQLite database file, or None when it isn't written."""
+    if not args.sqlite:
+        return None
+    return os.path.join(os.path.abspath(args.output_dir), "jobs.sqlite") if args.output_dir else SQLITE_FILE
+
+
+def archive_dir(args):
+    """Page archive directory, or None when pages aren't archived."""
+    if not args.archive:
+        return None
+    return os.path.join(os.path.abspath(args.output_dir), "archive") if args.output_dir else ARCHIVE_DIR
+
+
+def crawl(plan, args, journal_file, history):
+    """
+    Crawl `plan` in this process, journaling progress to `journal_file`.
+
+    Returns:
+        Tuple (stats, failed_pages) as returned by run_crawl
+    """
+    # A crashed run resumes where it stopped; a finished one starts over
+    journal = CrawlJournal(journal_file, fresh=args.fresh)
+    if journal.resumed:
+        print(f"Resuming interrupted crawl: {len(journal.done)} keywords already done")
+
+    # Job IDs seen this run; a resumed run first re-learns what it already wrote
+    seen = None
+    if not args.keep_duplicates:
+        seen = SeenJobs(use_bloom=args.bloom)
+        if journal.resumed:
+            seeded = seen.seed_from_csvs(journal.first_offsets)
+            print(f"Seeded {seeded} already-written job IDs")
+
+    # Pages are parsed in worker processes while the event loop keeps fetching
+    configure_parse_pool(args.parse_workers)
+    configure_dataset_writer(dataset_root(args))
+    configure_job_store(sqlite_path(args))
+    configure_page_archive(archive_dir(args))
+    # Rows are buffered and written in groups, each group committed to the journal at once
+    journal.attach(configure_csv_writer(max_rows=args.flush_rows, flush_interval=args.flush_interval))
+    try:
+        stats, failed_pages = run_crawl(
+            plan,
+            save_results,
+            max_concurrent=args.max_concurrent,
+            per_host=args.per_host,
+            max_keywords=args.max_keywords,
+            history=history,
+            journal=journal,
+            seen=seen,
+        )
+        close_csv_writer()
+        # Keep the journal open for a resume while some pages still need a retry
+        if not failed_pages:
+            journal.run_complete()
+    finally:
+        close_parse_pool()
+        close_csv_writer()
+        close_dataset_writer()
+        close_job_store()
+        close_page_archive()
+        journal.close()
+
+    return stats, failed_pages
+
+
+def crawl_shard(shard_id, entries, shard_dir, args, history):
+    """
+    Worker of the sharded crawl: crawl one shard's entries into its own
+    directory, with its own event loop, rate controller and budgets.
+
+    Returns:
+        Tuple (stats, failed_pages, history entries this shard changed)
+    """
+    configure(args)
+
+    local_plan = []
+    for entry in entries:
+        csv_path = os.path.join(shard_dir, entry["country"], entry["category"], f"{entry['category']}.csv")
+        local_plan.append({**entry, "csv_path": ensure_file(csv_path)})
+
+    before = dict(history)
+    stats, failed_pages = crawl(local_plan, args, os.path.join(shard_dir, "crawl_journal.jsonl"), history)
+    print(f"Shard {shard_id}: {stats['jobs']} jobs from {stats['keywords']} keywords")
+
+    changed = {key: value for key, value in history.items() if before.get(key) != value}
+    return stats, failed_pages, changed
+
+
+def main():
+    args = parse_args()
+
+    configure(args)
+    if args.replay:
+        print(f"Replay mode: serving every page from {CACHE_DIR}")
+
+    scraped_dir = os.path.abspath(args.output_dir) if args.output_dir else SCRAPED_DIR
+    plan = build_plan(scraped_dir)
+    print(f"Crawling {len(plan)} keywords across {len(COUNTRIES)} countries")
+
+    # Result counts of earlier runs size each keyword's pagination windows
+    history = load_history(HISTORY_FILE, scraped_dir=SCRAPED_DIR)
 
-            jobs_in_this_category = jobs_dict[category_name]
+    if args.shards > 1:
+        # Every (country, category) CSV has one writer: the shard that owns it
+        shard_root = os.path.join(scraped_dir, "shards") if args.output_dir else SHARD_ROOT
+        results = run_shards(shard_plan(plan, args.shards), shard_root, crawl_shard, args, history)
 
-            for job in jobs_in_this_category:
-                print(f"  - Searching keyword: {job}")
-                results = scrape_linkedin_jobs(job, country)
+        failed_pages = []
+        for shard_id, (stats, shard_failed, changed) in results:
+            history.update(changed)
+            failed_pages.extend(shard_failed)
+            print(f"Shard {shard_id} done: {stats}")
 
-                if results:
-                    for item in results:
-                        item['search_keyword'] = job
+        merged = merge_shards(shard_root, scraped_dir)
+        print(f"Merged {merged['bytes']} bytes into {merged['targets']} category CSVs")
+        # Shard journals are only worth keeping while some shard can still resume
+        if not failed_pages:
+            shutil.rmtree(shard_root)
+    else:
+        journal_file = os.path.join(scraped_dir, "crawl_journal.jsonl") if args.output_dir else JOURNAL_FILE
+        stats, failed_pages = crawl(plan, args, journal_file, history)
+        print(f"Done: {stats}")
+        print(f"Pagination requests saved this run: {stats['pagination']['requests_saved']}")
+        if "seen" in stats:
+            print(f"Duplicate postings skipped: {stats['seen']['rows_avoided_fraction']:.1%} of rows, "
+                  f"~{stats['seen']['requests_avoided_fraction']:.1%} of requests")
 
-                    append_to_csv(results, csv_path)
-                    print(f"    Saved {len(results)} results for {job}")
-                else:
-                    print(f"    No results found for {job}")
+    if not args.replay:
+        save_history(history, HISTORY_FILE)
 
+    # Pages that kept failing are reported, not silently treated as "no more jobs"
+    if failed_pages:
+        save_to_csv(failed_pages, FAILED_PAGES_CSV)
+        print(f"{len(failed_pages)} pages failed permanently, see {FAILED_PAGES_CSV}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+import os
+import sys
+import argparse
+
+from helpers.paths import project_path
+from helpers.normalize import extract_job_id
+from helpers.page_archive import PageArchive
+
+ARCHIVE_DIR = project_path("archive")
+PAGE_SUFFIXES = (".html", ".htm")
+
+
+def iter_html_files(paths):
+    """Yield every page file among `paths` (directories are searched recursively)."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(PAGE_SUFFIXES):
+                        yield os.path.join(root, name)
+        elif os.path.isfile(path):
+            yield path
+        else:
+            print(f"[!] Not found: {path}")
+
+
+def page_key(path):
+    """Job ID of a page saved as <job_id>.html or under its job link, else its file name."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if stem.isdigit():
+        return int(stem)
+    return extract_job_id(path) or os.path.basename(path)
+
+
+def add_files(archive, paths):
+    for path in iter_html_files(paths):
+        with open(path, "rb") as f:
+            archive.put(page_key(path), f.read(), fetched_at=os.path.getmtime(path))
+    return archive.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add saved pages to the page archive, or read one back.")
+    parser.add_argument("--archive", default=ARCHIVE_DIR, help="page archive directory")
+    parser.add_argument("--add", nargs="+", metavar="PATH",
+                        help="archive these pages (directories are searched for *.html)")
+    parser.add_argument("--get", metavar="KEY",
+                        help="print the page archived under a job ID (or file name) to stdout")
+    args = parser.parse_args()
+
+    # Reading never needs the writer (and must not disturb a crawl archiving into it)
+    archive = PageArchive(args.archive, readonly=not args.add)
+    try:
+        if args.add:
+            stats = add_files(archive, args.add)
+            print(f"Archived {stats['puts']} pages: {stats['stored']} stored, {stats['duplicates']} identical "
+                  f"to a stored one; {stats['raw_bytes'] / 1e6:.1f} MB -> {stats['stored_bytes'] / 1e6:.1f} MB")
+
+        if args.get:
+            page = archive.get(int(args.get) if args.get.isdigit() else args.get)
+            if page is None:
+                sys.exit(f"No page {args.get} in {args.archive}")
+            sys.stdout.write(page)
+            return
+
+        segments = sum(os.path.getsize(os.path.join(args.archive, name))
+                       for name in os.listdir(args.archive) if name.startswith("seg-"))
+        print(f"{args.archive}: {len(archive)} pages ({len(archive.job_ids())} job pages), "
+              f"{len(archive.blobs)} distinct bodies in {segments / 1e6:.1f} MB, "
+              f"codec {archive.meta['codec']}, dictionaries {archive.meta['dictionaries'] or 'none'}")
+    finally:
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
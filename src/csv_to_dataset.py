@@ -0,0 +1,66 @@
+import os
+import shutil
+import argparse
+
+import pandas as pd
+
+from helpers.paths import project_path
+from helpers.columnar_store import DatasetWriter
+from helpers.normalize import canonicalize_jobs
+
+SCRAPED_DIR = project_path("scraped")
+DATASET_DIR = project_path("dataset")
+
+
+def iter_category_csvs(scraped_dir):
+    """Yield (country, category, csv path) for every <Country>/<Category>/<Category>.csv."""
+    for country in sorted(os.listdir(scraped_dir)):
+        country_dir = os.path.join(scraped_dir, country)
+        if not os.path.isdir(country_dir):
+            continue
+        for category in sorted(os.listdir(country_dir)):
+            csv_path = os.path.join(country_dir, category, f"{category}.csv")
+            if os.path.isfile(csv_path) and os.path.getsize(csv_path) > 0:
+                yield country, category, csv_path
+
+
+def convert(scraped_dir, dataset_dir, rows_per_file=500_000):
+    """
+    Write every category CSV of `scraped_dir` into the Parquet dataset.
+
+    Returns:
+        Writer stats (rows, files, bytes)
+    """
+    writer = DatasetWriter(dataset_dir, rows_per_file=rows_per_file)
+    for country, category, csv_path in iter_category_csvs(scraped_dir):
+        frame = pd.read_csv(csv_path, dtype=str, keep_default_na=False).replace("", None)
+        # CSVs written before links were canonicalized get their job_id here
+        writer.write(canonicalize_jobs(frame.to_dict("records")), country, category)
+        # One file per partition
+        writer.flush()
+        print(f"  {country} / {category}: {len(frame)} rows")
+    writer.close()
+    return writer.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the scraped CSV tree into the Parquet dataset.")
+    parser.add_argument("--input", default=SCRAPED_DIR,
+                        help="scraped CSV tree (<Country>/<Category>/<Category>.csv)")
+    parser.add_argument("--output", default=DATASET_DIR,
+                        help="dataset directory (country=/category= partitions)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="replace an existing dataset instead of refusing to convert")
+    args = parser.parse_args()
+
+    if os.path.exists(args.output) and os.listdir(args.output):
+        if not args.overwrite:
+            parser.error(f"{args.output} already holds a dataset, pass --overwrite to replace it")
+        shutil.rmtree(args.output)
+
+    stats = convert(args.input, args.output)
+    print(f"Wrote {stats['rows']} rows in {stats['files']} files ({stats['bytes'] / 1e6:.1f} MB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import os
+import time
+import argparse
+
+import pandas as pd
+
+from helpers.paths import project_path
+from helpers.normalize import canonicalize_jobs
+from helpers.sqlite_store import JobStore, jobs_per_company
+from csv_to_dataset import iter_category_csvs
+
+SCRAPED_DIR = project_path("scraped")
+SQLITE_FILE = project_path("processed", "jobs.sqlite")
+
+
+def load_csv_tree(scraped_dir, store):
+    """Upsert every category CSV of `scraped_dir` into `store`; returns rows read."""
+    rows = 0
+    for country, category, csv_path in iter_category_csvs(scraped_dir):
+        frame = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+        store.write(canonicalize_jobs(frame.to_dict("records")), country, category)
+        rows += len(frame)
+        print(f"  {country} / {category}: {len(frame)} rows")
+    store.flush()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upsert the scraped CSV tree into the SQLite job database.")
+    parser.add_argument("--input", default=SCRAPED_DIR,
+                        help="scraped CSV tree (<Country>/<Category>/<Category>.csv)")
+    parser.add_argument("--output", default=SQLITE_FILE,
+                        help="SQLite database; rows already in it are updated, not duplicated")
+    parser.add_argument("--top-companies", metavar="COUNTRY", default=None,
+                        help="afterwards print the companies with most postings in COUNTRY")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    store = JobStore(args.output, batch_size=20_000)
+    try:
+        rows = load_csv_tree(args.input, store)
+        jobs, hits = (store.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                      for table in ("jobs", "job_hits"))
+        print(f"Upserted {rows} rows in {time.perf_counter() - started:.1f} s: "
+              f"{jobs} unique jobs, {hits} (job, country, category, keyword) hits, "
+              f"{store.stats['without_id']} rows without a job ID")
+
+        if args.top_companies:
+            for company, postings in jobs_per_company(store.connection, args.top_companies):
+                print(f"{postings:6d}  {company}")
+    finally:
+        store.close()
+    print(f"Saved to: {os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,179 @@
+import io
+import os
 import csv
+import gzip
+import json
+import time
 import logging
-from pathlib import Path
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
 from helpers.resolve_path import resolve_file_path
-from helpers.makefolder import ensure_dir, save_to_csv
+from helpers.makefolder import ensure_dir
+from helpers.paths import project_path
+from helpers.normalize import canonical_job_url
+from helpers.dedup import row_key
+from helpers.csv_tail import scan_csvs, read_appended
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+MANIFEST_VERSION = 1
 
-def get_links_only(base_path, output_file=None):
-    """
-    Extract just the URL strings from all CSV files.
 
-    Args:
-        base_path: Root directory containing the CSV files
-        output_file: Optional file to save URLs (one per line)
+def open_links(path, mode="r"):
+    """Open a links file as text, gzip-compressed if its name ends in .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
 
-    Returns:
-        List of URL strings
-    """
-    base_path = Path(resolve_file_path(base_path))
-    all_links = []
-
-    # Find all CSV files recursively
-    csv_files = list(base_path.rglob("*.csv"))
-    logger.info(f"Found {len(csv_files)} CSV files to process")
 
-    for csv_file in csv_files:
-        try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+def read_links(path):
+    """Yield the links of a file written by extract_links(), in order."""
+    with open_links(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
 
-                for row in reader:
-                    if 'link' in row and row['link']:
-                        all_links.append(row['link'].strip())
 
-            logger.info(f"Extracted {len(all_links)} links from {csv_file.name}")
-
-        except Exception as e:
-            logger.error(f"Error reading {csv_file}: {e}")
+def read_appended_links(path, entry=None):
+    """
+    Links of the rows appended to one CSV since `entry` (its manifest entry).
 
-    logger.info(f"Total links extracted: {len(all_links)}")
+    Only complete lines are read; a rewritten file is read again from the
+    start (see helpers/csv_tail.py).
 
-    if output_file:
-        output_path = Path(resolve_file_path(output_file))
-        ensure_dir(str(output_path.parent))
+    Returns:
+        (new manifest entry, [(dedup key, link)] unique within this chunk)
+    """
+    new_entry, header_line, _, data = read_appended(path, entry)
+    links = {}
+
+    header = next(csv.reader([header_line]), [])
+    if "link" in header:
+        link_col = header.index("link")
+        for row in csv.reader(io.StringIO(data.decode("utf-8"))):
+            if len(row) > link_col and row[link_col].strip():
+                link = row[link_col].strip()
+                key = row_key(link)
+                if key not in links:
+                    links[key] = canonical_job_url(key) if key > 0 else link
+    return new_entry, list(links.items())
+
+
+def _load_manifest(manifest_file, output_file):
+    """Manifest of a previous run, or a blank one if it doesn't match `output_file`."""
+    blank = {"version": MANIFEST_VERSION, "output": output_file, "output_size": 0, "files": {}}
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return blank
+
+    # A missing, truncated or different output file can't be appended to: start over
+    if (manifest.get("version") != MANIFEST_VERSION or manifest.get("output") != output_file
+            or not os.path.exists(output_file) or os.path.getsize(output_file) < manifest["output_size"]):
+        return blank
+    return manifest
+
+
+def _save_manifest(manifest_file, manifest):
+    tmp_path = f"{manifest_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_file)
+
+
+def _read_file(args):
+    path, entry = args
+    return read_appended_links(path, entry)
+
+
+def extract_links(base_path, output_file, manifest_file=None, workers=None):
+    """
+    Append the links of every CSV row added since the last run to `output_file`.
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(all_links))
+    A manifest (`<output_file>.manifest.json` by default) records the size,
+    mtime and read offset of every CSV, so unchanged files are skipped by
+    their stat alone and appended ones are only read past their offset.
+    Changed files are read in `workers` processes. Links are written as
+    canonical job URLs, each job once across all runs (links without a job
+    ID are kept as they are, also once). A `.gz` output file is written
+    gzip-compressed.
 
-        logger.info(f"Saved {len(all_links)} URLs to {output_file}")
+    Args:
+        base_path: Root directory containing the CSV files
+        output_file: File of links, one per line
+        manifest_file: Where to keep the manifest
+        workers: Reader processes for changed files (default: CPU count, 1 = in this process)
 
-    return all_links
+    Returns:
+        Dict with the number of CSVs, CSVs read, new links and links in the output
+    """
+    base_path = resolve_file_path(base_path)
+    output_file = os.path.abspath(resolve_file_path(output_file))
+    manifest_file = manifest_file or f"{output_file}.manifest.json"
+    workers = workers or os.cpu_count() or 1
+
+    manifest = _load_manifest(manifest_file, output_file)
+    known = manifest["files"]
+    found = scan_csvs(base_path)
+    changed = sorted(name for name, stat in found.items()
+                     if name not in known or (known[name]["size"], known[name]["mtime_ns"]) != stat)
+    report = {"files": len(found), "read": len(changed), "new_links": 0,
+              "links": manifest.get("links", 0)}
+
+    if not changed and found.keys() == known.keys():
+        return report
+
+    # Jobs already written by earlier runs
+    seen = set(map(row_key, read_links(output_file))) if manifest["output_size"] else set()
+    tasks = [(os.path.join(base_path, name), known.get(name)) for name in changed]
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(_read_file, tasks, chunksize=4))
+    else:
+        results = list(map(_read_file, tasks))
+
+    ensure_dir(os.path.dirname(output_file))
+    # Without a matching manifest the output is rewritten from scratch
+    with open_links(output_file, "a" if manifest["output_size"] else "w") as out:
+        for name, (entry, links) in zip(changed, results):
+            new = [link for key, link in links if key not in seen and not seen.add(key)]
+            if new:
+                out.write("\n".join(new) + "\n")
+            report["new_links"] += len(new)
+            logger.info(f"{name}: {len(new)} new links")
+            entry["size"], entry["mtime_ns"] = found[name]
+            known[name] = entry
+
+    # Deleted CSVs are forgotten; the links they contributed stay in the output
+    manifest["files"] = {name: known[name] for name in found}
+    manifest["output_size"] = os.path.getsize(output_file)
+    manifest["links"] = report["links"] = len(seen)
+    _save_manifest(manifest_file, manifest)
+    return report
 
 
-# Example usage
 if __name__ == "__main__":
-    scraped_data_dir = "../Data/Scraped"
-
-    urls = get_links_only(
-        scraped_data_dir,
-        output_file="../Data/Processed/urls_only.txt"
+    parser = argparse.ArgumentParser(
+        description="Collect the job links of the scraped CSVs, reading only rows added since the last run."
     )
-    print(f"Extracted {len(urls)} URLs")
\ No newline at end of file
+    parser.add_argument("--input", default=project_path("scraped"),
+                        help="scraped CSV tree")
+    parser.add_argument("--output", default=project_path("processed", "urls_only.txt"),
+                        help="file of canonical job links, one per line")
+    parser.add_argument("--compress", action="store_true",
+                        help="write the links gzip-compressed (to <output>.gz)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes reading changed CSVs (default: CPU count)")
+    args = parser.parse_args()
+
+    output_file = args.output + ".gz" if args.compress and not args.output.endswith(".gz") else args.output
+    started = time.perf_counter()
+    report = extract_links(args.input, output_file, workers=args.workers)
+    print(f"Read {report['read']} of {report['files']} CSVs in {1000 * (time.perf_counter() - started):.1f} ms: "
+          f"{report['new_links']} new links, {report['links']} in {output_file}")
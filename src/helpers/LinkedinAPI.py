@@ -1,10 +1,10 @@
 import time
-import random
-import requests
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
 
 from helpers.UserAgent import generate_advanced_ua
-from helpers.normalize import normalize_linkedin_url  # Import your new helper
+from helpers.card_parser import parse_cards
+from helpers.http_client import get_sync_session
+from helpers.rate_control import get_rate_controller
 
 
 def scrape_linkedin_jobs(keywords, location, max_jobs=0):
@@ -13,6 +13,9 @@ def scrape_linkedin_jobs(keywords, location, max_jobs=0):
 
     job_list = []
     start_index = 0
+    session = get_sync_session()  # pooled keep-alive connections across calls
+    rate_controller = get_rate_controller()
+    host = urlsplit(base_url).netloc
 
     while True:
         user_agent = generate_advanced_ua()
@@ -26,54 +29,34 @@ def scrape_linkedin_jobs(keywords, location, max_jobs=0):
         print(f"Fetching jobs starting at index {start_index}...")
 
         try:
-            response = requests.get(
+            rate_controller.acquire_sync(host, location)
+            started = time.monotonic()
+            response = session.get(
                 base_url, params=params, headers=headers, timeout=10
             )
+            rate_controller.record(
+                host, location, status=response.status_code,
+                latency=time.monotonic() - started,
+                empty=not response.text.strip(),
+                retry_after=response.headers.get("Retry-After"),
+            )
 
             if response.status_code != 200 or not response.text.strip():
                 print("No more jobs found or access blocked.")
                 break
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            cards = soup.find_all("li")
+            page_jobs = parse_cards(response.text)
 
-            if not cards:
+            if not page_jobs:
                 break
 
             new_jobs_count = 0
-            for card in cards:
+            for job in page_jobs:
                 if max_jobs > 0 and len(job_list) >= max_jobs:
                     return job_list  # Exit early if limit reached
 
-                try:
-                    title = card.find(
-                        "h3", class_="base-search-card__title"
-                    ).text.strip()
-                    company = card.find(
-                        "h4", class_="base-search-card__subtitle"
-                    ).text.strip()
-                    location_tag = card.find(
-                        "span", class_="job-search-card__location"
-                    ).text.strip()
-                    link_tag = card.find("a", class_="base-card__full-link")
-
-                    raw_link = link_tag["href"] if link_tag else None
-
-                    if raw_link:
-                        # --- Apply the normalization here ---
-                        normalized_link = normalize_linkedin_url(raw_link)
-
-                        job_list.append(
-                            {
-                                "title": title,
-                                "company": company,
-                                "location": location_tag,
-                                "link": normalized_link,
-                            }
-                        )
-                        new_jobs_count += 1
-                except (AttributeError, TypeError):
-                    continue
+                job_list.append(job)
+                new_jobs_count += 1
 
             if new_jobs_count == 0:
                 break
@@ -83,7 +66,6 @@ def scrape_linkedin_jobs(keywords, location, max_jobs=0):
             # LinkedIn Guest API usually paginates by 10 or 25.
             # If you get fewer than 10 results, it's often the end.
             start_index += 10
-            time.sleep(random.uniform(2, 5))
 
         except Exception as e:
             print(f"Error occurred at start={start_index}: {e}")
@@ -1,156 +1,328 @@
+import os
 import asyncio
-import random
-import aiohttp
-from bs4 import BeautifulSoup
+import time
+from urllib.parse import urlsplit
 from helpers.UserAgent import generate_advanced_ua
-from helpers.normalize import normalize_linkedin_url
+from helpers.card_parser import parse_cards, count_cards
+from helpers.parse_pool import parse_off_loop
+from helpers.http_client import get_async_session, close_async_session
+from helpers.pagination import PAGE_SIZE, PaginationPlanner
+from helpers.response_cache import get_response_cache
+from helpers.page_archive import get_page_archive, request_key
+from helpers.rate_control import get_rate_controller, parse_retry_after
+from helpers.resilience import (
+    OK,
+    END_OF_RESULTS,
+    RETRYABLE,
+    classify,
+    backoff_delay,
+    get_circuit_breaker,
+)
+
+# LINKEDIN_BASE_URL points the scraper at a stand-in server (see Benchmarks/mock_linkedin_server.py)
+BASE_URL = os.environ.get(
+    "LINKEDIN_BASE_URL",
+    "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search",
+)
+
+
+async def _fetch_once(session, base_url, params, semaphore, rate_controller, host, location):
+    """Send one request; returns (text, outcome, retry_after)."""
+    # Wait for a pacing slot before taking a concurrency slot
+    await rate_controller.acquire(host, location)
 
-
-async def fetch_job_batch(session, base_url, keywords, location, start_index, semaphore):
-    """Fetch a single batch of jobs with rate limiting via semaphore."""
     async with semaphore:  # Limit concurrent requests
         user_agent = generate_advanced_ua()  # Fresh UA per request
         headers = {
             "User-Agent": user_agent,
             "Accept-Language": "en-US,en;q=0.9",
         }
-        params = {"keywords": keywords, "location": location, "start": start_index}
 
+        started = time.monotonic()
         try:
             async with session.get(
                 base_url, params=params, headers=headers, timeout=10
             ) as response:
-                if response.status != 200:
-                    return None, start_index
+                text = await response.text() if response.status == 200 else None
+                outcome = classify(status=response.status, text=text)
+                retry_after = response.headers.get("Retry-After")
+                rate_controller.record(
+                    host, location, status=response.status,
+                    latency=time.monotonic() - started,
+                    empty=outcome == END_OF_RESULTS,
+                    retry_after=retry_after,
+                )
+                return text, outcome, retry_after
 
-                text = await response.text()
-                if not text.strip():
-                    return None, start_index
+        except Exception as e:
+            rate_controller.record(host, location, status=None)
+            return None, classify(exc=e), None
 
-                # Add random delay between requests
-                await asyncio.sleep(random.uniform(1, 3))
-                return text, start_index
 
-        except Exception as e:
-            print(f"Error fetching batch at index {start_index}: {e}")
-            return None, start_index
+async def fetch_with_retries(session, url, params, semaphore, location, label,
+                             rate_controller=None, max_retries=4):
+    """
+    GET a guest page, retrying transient failures.
+
+    Timeouts, throttles, blocks, 5xx and network errors are retried with
+    jittered exponential backoff (honouring Retry-After). Every attempt
+    waits on the process-wide circuit breaker first.
+
+    Args:
+        location: Country the request is paced under by the rate controller
+        label: Names the request in log lines
+
+    Returns:
+        (text, outcome) where text is None unless outcome is OK
+    """
+    rate_controller = rate_controller or get_rate_controller()
+    breaker = get_circuit_breaker()
+    host = urlsplit(url).netloc
+
+    for attempt in range(max_retries + 1):
+        await breaker.wait_if_open()
+
+        text, outcome, retry_after = await _fetch_once(
+            session, url, params, semaphore, rate_controller, host, location
+        )
+        breaker.record(outcome)
+
+        if outcome in (OK, END_OF_RESULTS):
+            return text, outcome
+        if outcome not in RETRYABLE or attempt == max_retries:
+            break
+
+        delay = max(backoff_delay(attempt), parse_retry_after(retry_after) or 0)
+        print(f"Retrying {label} ({outcome}) in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    print(f"Giving up on {label}: {outcome}")
+    return None, outcome
+
+
+async def fetch_job_batch(session, base_url, keywords, location, start_index, semaphore,
+                          rate_controller=None, max_retries=4):
+    """
+    Fetch a single batch of jobs, retrying transient failures (see
+    fetch_with_retries). When the response cache is enabled, fresh entries
+    are served from disk and every 200 response is stored; when the page
+    archive is enabled, every fetched page is archived under its request key.
+
+    Returns:
+        (html_text, start_index, outcome) where html_text is None unless
+        outcome is OK. END_OF_RESULTS means the page was genuinely empty;
+        any other outcome means the page failed permanently.
+    """
+    params = {"keywords": keywords, "location": location, "start": start_index}
+
+    # Serve from the response cache when possible; in replay mode never hit the network
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get(base_url, params)
+        if cached is not None:
+            return (cached, start_index, OK) if cached.strip() else (None, start_index, END_OF_RESULTS)
+        if cache.replay:
+            # Never fetched in the recorded crawl: it was past the last page
+            return None, start_index, END_OF_RESULTS
+
+    text, outcome = await fetch_with_retries(
+        session, base_url, params, semaphore, location, f"batch at index {start_index}",
+        rate_controller=rate_controller, max_retries=max_retries,
+    )
+    if cache is not None and outcome in (OK, END_OF_RESULTS):
+        cache.put(base_url, params, text or "")
+    archive = get_page_archive()
+    if archive is not None and outcome == OK:
+        archive.put(request_key(base_url, params), text)
+    return text, start_index, outcome
 
 
 def parse_job_batch(html_text, start_index):
-    """Parse HTML and extract job listings."""
-    jobs = []
-    try:
-        soup = BeautifulSoup(html_text, "html.parser")
-        cards = soup.find_all("li")
-
-        for card in cards:
-            try:
-                title = card.find("h3", class_="base-search-card__title").text.strip()
-                company = card.find("h4", class_="base-search-card__subtitle").text.strip()
-                location_tag = card.find("span", class_="job-search-card__location").text.strip()
-                link_tag = card.find("a", class_="base-card__full-link")
-                raw_link = link_tag["href"] if link_tag else None
-
-                if raw_link:
-                    normalized_link = normalize_linkedin_url(raw_link)
-                    jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": location_tag,
-                        "link": normalized_link,
-                    })
-            except (AttributeError, TypeError):
-                continue
+    """
+    Parse HTML and extract job listings.
 
+    Returns:
+        Tuple (jobs, cards) where cards is the page's <li> count, which
+        stays the page's fill even when some cards don't parse
+    """
+    cards = count_cards(html_text)
+    try:
+        return parse_cards(html_text), cards
     except Exception as e:
         print(f"Error parsing batch at index {start_index}: {e}")
+        return [], cards
 
-    return jobs
 
+async def fetch_and_parse(session, keywords, location, start_index, semaphore):
+    """
+    Fetch one page and parse it (on the parse pool, if configured).
 
-async def scrape_linkedin_jobs_concurrent(keywords, location, max_jobs=0,
-                                          max_concurrent=3, batch_size=5):
+    Returns:
+        Tuple (jobs, cards, start_index, outcome); jobs is None unless
+        outcome is OK, cards is the page's <li> count (see parse_job_batch)
     """
-    Scrape LinkedIn jobs with controlled concurrency.
+    html_text, idx, outcome = await fetch_job_batch(
+        session, BASE_URL, keywords, location, start_index, semaphore
+    )
+    if outcome != OK:
+        return None, 0, idx, outcome
+    jobs, cards = await parse_off_loop(parse_job_batch, html_text, idx)
+    return jobs, cards, idx, outcome
+
+
+async def paginate_keyword(session, keywords, location, semaphore, max_jobs=0,
+                           batch_size=5, on_batch=None, on_failure=None, planner=None,
+                           completed_pages=None, seen=None):
+    """
+    Walk the result pages of one keyword/location pair in concurrent windows.
 
     Args:
+        session: Open aiohttp.ClientSession to issue requests with
         keywords: Job search keywords
         location: Job location
+        semaphore: Async context manager bounding in-flight requests
         max_jobs: Maximum number of jobs to fetch (0 = unlimited)
-        max_concurrent: Maximum concurrent requests (default: 3)
-        batch_size: Number of pages to fetch per batch (default: 5)
+        batch_size: Size of the first window when no planner is given
+        on_batch: Optional callback called as on_batch(jobs, start_index, cards)
+                  for every answered page as soon as its window completes;
+                  `cards` counts the page's <li> cards as served, before
+                  parsing or filtering
+        on_failure: Optional callback called with a dict describing every
+                    page that failed permanently (it is not counted as empty)
+        planner: Optional PaginationPlanner sizing each window; share one
+                 across keywords to get run-wide savings in planner.report()
+        completed_pages: Optional {start_index: cards} of pages persisted by
+                         an earlier, interrupted run; they are not fetched again
+        seen: Optional SeenJobs shared across keywords; jobs already seen are
+              dropped and the keyword stops once its pages are mostly repeats
+
+    Returns:
+        List of all job dicts collected for the keyword (without the jobs
+        of completed_pages)
     """
-    base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    planner = planner or PaginationPlanner(initial_window=batch_size)
+    completed_pages = completed_pages or {}
+    resumed_jobs = sum(completed_pages.values())
     all_jobs = []
     start_index = 0
+    stale_run = 0  # consecutive pages of (nearly) all already-seen jobs
+    window = planner.first_window(keywords, location)
+
+    while window:
+        # Determine which pages to fetch in this window
+        indices = [start_index + (i * PAGE_SIZE) for i in range(window)]
+
+        print(f"Fetching batch: indices {indices[0]} to {indices[-1]}")
+
+        # Fetch multiple pages concurrently (pages persisted earlier are skipped);
+        # each page is parsed as soon as it arrives, while the rest are in flight
+        tasks = [
+            fetch_and_parse(session, keywords, location, idx, semaphore)
+            for idx in indices if idx not in completed_pages
+        ]
+        results = await asyncio.gather(*tasks)
+
+        # Parse all results, remembering how full every answered page was
+        batch_jobs = 0
+        page_fills = {idx: completed_pages[idx] for idx in indices if idx in completed_pages}
+
+        for jobs, cards, idx, outcome in results:
+            if outcome == END_OF_RESULTS:
+                page_fills[idx] = 0
+                continue
 
-    # Semaphore controls concurrent request limit
-    semaphore = asyncio.Semaphore(max_concurrent)
+            if outcome != OK:
+                print(f"Page {idx} of '{keywords}' in {location} failed: {outcome}")
+                if on_failure:
+                    on_failure({
+                        "keyword": keywords,
+                        "location": location,
+                        "start_index": idx,
+                        "reason": outcome,
+                    })
+                continue
 
-    async with aiohttp.ClientSession() as session:
-        while True:
-            # Create batch of requests
-            if max_jobs > 0 and len(all_jobs) >= max_jobs:
-                break
+            # The raw card count, so a card the parser drops doesn't make a full page look short
+            page_fills[idx] = cards
 
-            # Determine how many pages to fetch in this batch
-            indices = [start_index + (i * 10) for i in range(batch_size)]
+            # Drop postings another keyword already surfaced
+            if seen is not None:
+                parsed = len(jobs)
+                jobs = seen.filter_new(jobs)
+                stale_run = stale_run + 1 if seen.is_stale(parsed, len(jobs)) else 0
 
-            print(f"Fetching batch: indices {indices[0]} to {indices[-1]}")
+            # Trim to the job limit before handing the page out
+            if max_jobs > 0:
+                jobs = jobs[:max_jobs - len(all_jobs)]
 
-            # Fetch multiple pages concurrently
-            tasks = [
-                fetch_job_batch(session, base_url, keywords, location, idx, semaphore)
-                for idx in indices
-            ]
-            results = await asyncio.gather(*tasks)
+            all_jobs.extend(jobs)
+            batch_jobs += len(jobs)
+            if on_batch:
+                on_batch(jobs, idx, cards)
 
-            # Parse all results
-            batch_jobs = []
-            empty_results = 0
+        if batch_jobs:
+            print(f"Batch complete: {batch_jobs} jobs. Total: {len(all_jobs)}")
 
-            for html_text, idx in results:
-                if html_text is None:
-                    empty_results += 1
-                    continue
+        if not page_fills:
+            print(f"Whole batch failed, abandoning '{keywords}' in {location}")
+            break
 
-                jobs = parse_job_batch(html_text, idx)
-                if not jobs:
-                    empty_results += 1
-                else:
-                    batch_jobs.extend(jobs)
+        # Check if we've hit the max
+        if max_jobs > 0 and len(all_jobs) >= max_jobs:
+            break
 
-            # Stop if we got mostly empty results
-            if empty_results >= len(results) * 0.7:  # 70% empty
-                print("Most results empty, stopping pagination")
-                break
+        # Move to the next window; the planner returns 0 past the last page
+        window_start = start_index
+        start_index += window * PAGE_SIZE
+        window = planner.next_window(
+            keywords, location, window_start, page_fills, window, resumed_jobs + len(all_jobs)
+        )
 
-            if not batch_jobs:
-                break
+        if window and seen is not None and stale_run >= seen.stale_pages:
+            print(f"'{keywords}' in {location} only repeats seen jobs, stopping early")
+            seen.keyword_cut(planner.cut(keywords, location, window, resumed_jobs + len(all_jobs)))
+            break
 
-            all_jobs.extend(batch_jobs)
-            print(f"Batch complete: {len(batch_jobs)} jobs. Total: {len(all_jobs)}")
+    planner.finish(keywords, location, resumed_jobs + len(all_jobs))
+    return all_jobs
 
-            # Check if we've hit the max
-            if max_jobs > 0 and len(all_jobs) >= max_jobs:
-                all_jobs = all_jobs[:max_jobs]
-                break
 
-            # Move to next batch
-            start_index += batch_size * 10
+async def scrape_linkedin_jobs_concurrent(keywords, location, max_jobs=0,
+                                          max_concurrent=3, batch_size=5):
+    """
+    Scrape LinkedIn jobs with controlled concurrency.
 
-            # Delay between batches
-            await asyncio.sleep(random.uniform(2, 4))
+    Args:
+        keywords: Job search keywords
+        location: Job location
+        max_jobs: Maximum number of jobs to fetch (0 = unlimited)
+        max_concurrent: Maximum concurrent requests (default: 3)
+        batch_size: Number of pages to fetch per batch (default: 5)
+    """
+    # Semaphore controls concurrent request limit
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-    return all_jobs
+    # Shared pooled session: keeps connections alive across keywords
+    session = await get_async_session()
+    return await paginate_keyword(
+        session, keywords, location, semaphore,
+        max_jobs=max_jobs, batch_size=batch_size,
+    )
 
 
 # Wrapper function to maintain compatibility with sync code
 def scrape_linkedin_jobs(keywords, location, max_jobs=0, max_concurrent=3):
     """Synchronous wrapper for the async scraper."""
-    return asyncio.run(
-        scrape_linkedin_jobs_concurrent(keywords, location, max_jobs, max_concurrent)
-    )
+    async def run():
+        try:
+            return await scrape_linkedin_jobs_concurrent(
+                keywords, location, max_jobs, max_concurrent
+            )
+        finally:
+            # The session can't outlive this event loop
+            await close_async_session()
+
+    return asyncio.run(run())
 
 
 # # Example usage
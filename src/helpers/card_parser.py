@@ -0,0 +1,168 @@
+import re
+from html import unescape
+
+from bs4 import BeautifulSoup
+
+from helpers.normalize import normalize_linkedin_url, canonicalize_jobs
+
+
+class CardMarkupError(ValueError):
+    """Raised by the fast parser when a page doesn't look like the known card markup."""
+
+
+# Opening/closing <li> tags; the fast path expects flat, non-nested cards
+_LI_OPEN_RE = re.compile(r"<li[\s>]", re.IGNORECASE)
+_LI_CLOSE_RE = re.compile(r"</li\s*>", re.IGNORECASE)
+
+# An opening tag, allowing quoted ">" inside attribute values
+_TAG_RE = {
+    tag: re.compile(r"<%s\b((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>" % tag)
+    for tag in ("h3", "h4", "span", "a")
+}
+_CLASS_RE = re.compile(r"(?:^|\s)class=\"([^\"]*)\"")
+_HREF_RE = re.compile(r"(?:^|\s)href=\"([^\"]*)\"")
+_INNER_TAG_RE = re.compile(r"<[^>]*>")
+
+# Anything the tokenizer doesn't model is left to BeautifulSoup
+_UNSUPPORTED = ("<!--", "<script", "<style", "<![CDATA[")
+
+
+def _find(card, tag, css_class):
+    """Return (attributes, inner html) of the first `tag` carrying `css_class`."""
+    for match in _TAG_RE[tag].finditer(card):
+        attrs = match.group(1)
+        class_match = _CLASS_RE.search(attrs)
+        if not class_match or css_class not in class_match.group(1).split():
+            continue
+
+        close = card.find(f"</{tag}>", match.end())
+        if close < 0:
+            raise CardMarkupError(f"unclosed <{tag}>")
+        inner = card[match.end():close]
+        if f"<{tag}" in inner:
+            raise CardMarkupError(f"nested <{tag}>")
+        return attrs, inner
+
+    raise CardMarkupError(f"no <{tag} class={css_class}>")
+
+
+def _text(inner):
+    if "<" in inner:
+        inner = _INNER_TAG_RE.sub("", inner)
+    return unescape(inner).strip()
+
+
+def parse_cards_fast(html_text):
+    """
+    Extract job cards with a tokenizer for the known guest API card markup.
+
+    Only handles pages where every <li> is a complete card; anything else
+    raises CardMarkupError so the caller can fall back to BeautifulSoup.
+    """
+    if any(marker in html_text for marker in _UNSUPPORTED):
+        raise CardMarkupError("unsupported markup")
+
+    opens = [m.start() for m in _LI_OPEN_RE.finditer(html_text)]
+    closes = [(m.start(), m.end()) for m in _LI_CLOSE_RE.finditer(html_text)]
+    if len(opens) != len(closes):
+        raise CardMarkupError("unbalanced <li> tags")
+
+    jobs = []
+    for i, (start, (close_start, close_end)) in enumerate(zip(opens, closes)):
+        next_open = opens[i + 1] if i + 1 < len(opens) else len(html_text)
+        if not start < close_start < next_open:
+            raise CardMarkupError("nested <li> tags")
+
+        card = html_text[start:close_end]
+        title = _text(_find(card, "h3", "base-search-card__title")[1])
+        company = _text(_find(card, "h4", "base-search-card__subtitle")[1])
+        location = _text(_find(card, "span", "job-search-card__location")[1])
+
+        href_match = _HREF_RE.search(_find(card, "a", "base-card__full-link")[0])
+        if not href_match or not href_match.group(1):
+            raise CardMarkupError("card link without href")
+
+        jobs.append({
+            "title": title,
+            "company": company,
+            "location": location,
+            "link": normalize_linkedin_url(unescape(href_match.group(1))),
+        })
+
+    return jobs
+
+
+def count_cards(html_text):
+    """Number of <li> cards on a search page as served, whether or not they parse."""
+    return len(_LI_OPEN_RE.findall(html_text))
+
+
+def parse_cards_bs4(html_text):
+    """Extract job cards with BeautifulSoup (slow, tolerant of any markup)."""
+    jobs = []
+    soup = BeautifulSoup(html_text, "html.parser")
+    cards = soup.find_all("li")
+
+    for card in cards:
+        try:
+            title = card.find("h3", class_="base-search-card__title").text.strip()
+            company = card.find("h4", class_="base-search-card__subtitle").text.strip()
+            location_tag = card.find("span", class_="job-search-card__location").text.strip()
+            link_tag = card.find("a", class_="base-card__full-link")
+            raw_link = link_tag["href"] if link_tag else None
+
+            if raw_link:
+                normalized_link = normalize_linkedin_url(raw_link)
+                jobs.append({
+                    "title": title,
+                    "company": company,
+                    "location": location_tag,
+                    "link": normalized_link,
+                })
+        except (AttributeError, TypeError):
+            continue
+
+    return jobs
+
+
+BACKENDS = {
+    "fast": parse_cards_fast,
+    "bs4": parse_cards_bs4,
+}
+
+_backend = "fast"
+stats = {"pages": 0, "fallbacks": 0}
+
+
+def configure_card_parser(backend):
+    """Select the process-wide card parser backend ("fast" or "bs4")."""
+    global _backend
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown card parser backend: {backend}")
+    _backend = backend
+
+
+def get_card_parser():
+    """Return the name of the process-wide card parser backend."""
+    return _backend
+
+
+def parse_cards(html_text):
+    """
+    Extract the job cards of one search page with the configured backend.
+
+    The fast backend falls back to BeautifulSoup on any page it can't parse
+    with certainty, so both backends return the same jobs.
+
+    Returns:
+        List of dicts with title, company, location, the canonical link
+        and the integer job_id
+    """
+    stats["pages"] += 1
+    if _backend == "fast":
+        try:
+            return canonicalize_jobs(parse_cards_fast(html_text))
+        except CardMarkupError:
+            stats["fallbacks"] += 1
+    return canonicalize_jobs(parse_cards_bs4(html_text))
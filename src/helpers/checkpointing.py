@@ -20,4 +20,201 @@ def save_checkpoint(ci, ji):
             {"country_index": ci, "job_index": ji},
             f,
             indent=2
-        )
\ No newline at end of file
+        )
+
+def _fsync_path(path):
+    """Flush a file that was written (and closed) elsewhere down to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def journal_pending(path):
+    """True if the journal at `path` belongs to a crawl that could still resume."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return False
+    with open(path, "rb") as f:
+        f.seek(max(0, os.path.getsize(path) - 4096))
+        last = f.read().splitlines()[-1]
+    try:
+        return json.loads(last).get("e") != "complete"
+    except ValueError:
+        return True
+
+
+class CrawlJournal:
+    """
+    Append-only, fsync'd journal of a crawl at page granularity.
+
+    Every line is one JSON event about a unit (country, category, keyword):
+
+        {"e": "write", ...unit, "s": start, "csv": path, "offset": size}
+            rows of page `s` are about to be appended to `csv`, which is
+            `offset` bytes long right now
+        {"e": "page", ...unit, "s": start, "n": cards}
+            those rows are on disk
+        {"e": "done", ...unit}
+            the keyword was paginated to its end
+        {"e": "complete"}
+            the whole run finished
+
+    On open, a "write" without its "page" (a crash mid-append) is rolled
+    back by truncating the CSV to the recorded offset, so a resumed run
+    never duplicates rows. A journal whose run completed is rotated away and
+    a new run starts.
+
+    With a buffered CsvWriter attached, pages are committed in groups: the
+    "write" events are fsync'd once before the writer flushes, and the
+    "page" (and "done") events of everything it flushed follow in one
+    fsync'd append. Rows still buffered at a crash simply aren't on disk.
+
+    Args:
+        path: Journal file (absolute path)
+        fresh: Start a new run even if the last one was interrupted
+    """
+
+    def __init__(self, path, fresh=False):
+        self.path = path
+        self.done = set()
+        self.pages = {}
+        self.first_offsets = {}  # csv path -> its size before this run's first write
+        self.resumed = False
+        self._uncommitted = []  # events waiting for the writer's next flush
+        self._buffered = False
+
+        if os.path.exists(path):
+            if fresh or self._load():
+                os.replace(path, f"{path}.{int(os.path.getmtime(path))}")
+                self.done.clear()
+                self.pages.clear()
+                self.first_offsets.clear()
+            else:
+                self.resumed = True
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    @staticmethod
+    def _unit(entry):
+        return (entry["country"], entry["category"], entry["keyword"])
+
+    def _load(self):
+        """Rebuild state from the journal; returns True if that run completed."""
+        pending = {}
+        completed = False
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash mid-write
+                    continue
+
+                kind = event["e"]
+                if kind == "complete":
+                    completed = True
+                    continue
+
+                unit = (event["c"], event["g"], event["k"])
+                if kind == "write":
+                    pending[(unit, event["s"])] = event
+                    self.first_offsets.setdefault(event["csv"], event["offset"])
+                elif kind == "page":
+                    pending.pop((unit, event["s"]), None)
+                    self.pages.setdefault(unit, {})[event["s"]] = event["n"]
+                elif kind == "done":
+                    self.done.add(unit)
+
+        for event in pending.values():
+            self._roll_back(event)
+        return completed
+
+    @staticmethod
+    def _roll_back(event):
+        csv_path = event["csv"]
+        if os.path.exists(csv_path) and os.path.getsize(csv_path) > event["offset"]:
+            print(f"Rolling back partial write to {csv_path} (page {event['s']} of {event['k']})")
+            with open(csv_path, "r+b") as f:
+                f.truncate(event["offset"])
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _append(self, event, sync=True):
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def attach(self, writer):
+        """Commit pages around the flushes of a buffered CsvWriter instead of one by one."""
+        self._buffered = True
+        writer.fsync = True
+        writer.before_flush = self.sync
+        writer.after_flush = self.commit
+
+    def sync(self):
+        os.fsync(self._file.fileno())
+
+    def commit(self, csv_paths=None):
+        """Record the waiting events; the writer just put every buffered row on disk."""
+        events, self._uncommitted = self._uncommitted, []
+        if not events:
+            return
+        self._file.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        for event in events:
+            unit = (event["c"], event["g"], event["k"])
+            if event["e"] == "page":
+                self.pages.setdefault(unit, {})[event["s"]] = event["n"]
+            else:
+                self.done.add(unit)
+
+    def _event(self, kind, entry, **fields):
+        country, category, keyword = self._unit(entry)
+        return {"e": kind, "c": country, "g": category, "k": keyword, **fields}
+
+    def is_done(self, entry):
+        return self._unit(entry) in self.done
+
+    def completed_pages(self, entry):
+        """{start_index: cards} of the pages of `entry` already persisted."""
+        return dict(self.pages.get(self._unit(entry), {}))
+
+    def persist(self, entry, start_index, cards, csv_path, write):
+        """
+        Run `write()` (which appends the page's rows to `csv_path`) between a
+        "write" and a "page" event, fsyncing the CSV in between.
+        """
+        offset = os.path.getsize(csv_path) if os.path.exists(csv_path) else 0
+        self.first_offsets.setdefault(csv_path, offset)
+        self._append(self._event("write", entry, s=start_index, csv=csv_path, offset=offset),
+                     sync=not self._buffered)
+        if self._buffered:
+            # Queued before write(): a flush that write() triggers puts this page's
+            # rows on disk too, so its commit must include this "page" event
+            self._uncommitted.append(self._event("page", entry, s=start_index, n=cards))
+            write()
+            return
+        write()
+        if os.path.exists(csv_path):
+            _fsync_path(csv_path)
+        self._append(self._event("page", entry, s=start_index, n=cards))
+        self.pages.setdefault(self._unit(entry), {})[start_index] = cards
+
+    def keyword_done(self, entry):
+        # A keyword is only done once its last pages are committed
+        if self._uncommitted:
+            self._uncommitted.append(self._event("done", entry))
+            return
+        self._append(self._event("done", entry))
+        self.done.add(self._unit(entry))
+
+    def run_complete(self):
+        self._append({"e": "complete"})
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,161 @@
+import os
+import uuid
+from urllib.parse import quote
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only the Parquet dataset needs it
+    pa = None
+
+# Columns of a scraped job row, as in the Data/Scraped CSVs
+COLUMNS = ["title", "company", "location", "link", "job_id", "search_keyword"]
+
+# Few distinct values, so stored and loaded as dictionaries (categoricals in pandas);
+# links are unique per row and gain nothing from a dictionary
+DICTIONARY_COLUMNS = ["title", "company", "location", "search_keyword"]
+
+PARTITION_KEYS = ["country", "category"]
+DEFAULT_COMPRESSION = "zstd"
+
+
+def require_pyarrow():
+    if pa is None:
+        raise RuntimeError("The Parquet dataset needs pyarrow: pip install pyarrow")
+
+
+def partition_dir(root, country, category):
+    """Hive-style directory of one (country, category) partition."""
+    # Category names may contain "/"; readers decode the URI escapes
+    return os.path.join(root, f"country={quote(country, safe=' &')}", f"category={quote(category, safe=' &')}")
+
+
+def _schema():
+    types = {"job_id": pa.int64()}
+    fields = [
+        (name, pa.dictionary(pa.int32(), pa.string()) if name in DICTIONARY_COLUMNS else types.get(name, pa.string()))
+        for name in COLUMNS
+    ]
+    return pa.schema(fields)
+
+
+class DatasetWriter:
+    """
+    Buffered writer of the scraped rows as a Hive-partitioned Parquet
+    dataset: <root>/country=<Country>/category=<Category>/part-*.parquet.
+
+    Rows are buffered per partition and written as one file once
+    `rows_per_file` accumulate, or on close(). Every writer names its files
+    with its own random prefix, so shard processes can share a root.
+    Files are written under a hidden name and renamed when complete, so
+    readers never see a partial one.
+
+    Args:
+        root: Dataset directory
+        rows_per_file: Rows buffered per partition before a file is written
+        compression: Parquet compression codec
+    """
+
+    def __init__(self, root, rows_per_file=50_000, compression=DEFAULT_COMPRESSION):
+        require_pyarrow()
+        self.root = root
+        self.rows_per_file = rows_per_file
+        self.compression = compression
+        self.schema = _schema()
+        self.stats = {"rows": 0, "files": 0, "bytes": 0}
+        self._buffers = {}
+        self._prefix = uuid.uuid4().hex[:12]
+        self._sequence = 0
+
+    def write(self, rows, country, category):
+        """Buffer `rows` (dicts with the COLUMNS keys) for one partition."""
+        if not rows:
+            return
+        buffer = self._buffers.setdefault((country, category), [])
+        buffer.extend(rows)
+        if len(buffer) >= self.rows_per_file:
+            self._flush(country, category)
+
+    def _flush(self, country, category):
+        rows = self._buffers.pop((country, category), None)
+        if not rows:
+            return
+
+        columns = {name: [row.get(name) for row in rows] for name in COLUMNS}
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+
+        directory = partition_dir(self.root, country, category)
+        os.makedirs(directory, exist_ok=True)
+        self._sequence += 1
+        name = f"part-{self._prefix}-{self._sequence:05d}.parquet"
+        tmp_path = os.path.join(directory, f".{name}.tmp")
+        pq.write_table(table, tmp_path, compression=self.compression, use_dictionary=DICTIONARY_COLUMNS)
+        os.replace(tmp_path, os.path.join(directory, name))
+
+        self.stats["rows"] += len(rows)
+        self.stats["files"] += 1
+        self.stats["bytes"] += os.path.getsize(os.path.join(directory, name))
+
+    def flush(self):
+        for country, category in list(self._buffers):
+            self._flush(country, category)
+
+    def close(self):
+        self.flush()
+
+
+def load_dataset(root, columns=None, **partitions):
+    """
+    Load the dataset (or some partitions of it) into a DataFrame.
+
+    Args:
+        root: Dataset directory
+        columns: Columns to load (default: all, plus country and category)
+        **partitions: Partition filters, e.g. country="Egypt"
+
+    Returns:
+        pandas DataFrame; dictionary columns come back as categoricals
+    """
+    return dataset_table(root, columns, **partitions).to_pandas()
+
+
+def dataset_table(root, columns=None, **partitions):
+    """Same as load_dataset(), as an Arrow table."""
+    require_pyarrow()
+    partitioning = ds.partitioning(
+        pa.schema([(key, pa.string()) for key in PARTITION_KEYS]), flavor="hive"
+    )
+    dataset = ds.dataset(root, format="parquet", partitioning=partitioning)
+
+    condition = None
+    for key, value in partitions.items():
+        term = ds.field(key) == value
+        condition = term if condition is None else condition & term
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+_writer = None
+
+
+def configure_dataset_writer(root, **kwargs):
+    """Also write every saved batch to the Parquet dataset at `root` (None = CSV only)."""
+    global _writer
+
+    close_dataset_writer()
+    if root:
+        _writer = DatasetWriter(root, **kwargs)
+    return _writer
+
+
+def get_dataset_writer():
+    """Return the process-wide dataset writer, or None when only CSVs are written."""
+    return _writer
+
+
+def close_dataset_writer():
+    global _writer
+
+    if _writer is not None:
+        _writer.close()
+        _writer = None
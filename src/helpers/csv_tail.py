@@ -0,0 +1,56 @@
+import os
+import hashlib
+
+# Bytes before a file's recorded offset that must be unchanged for it to count as appended to
+TAIL_BYTES = 64
+
+
+def scan_csvs(base_path):
+    """{path relative to base_path: (size, mtime_ns)} of every CSV below it."""
+    found = {}
+    for folder, _, names in os.walk(base_path):
+        for name in names:
+            if name.endswith(".csv"):
+                path = os.path.join(folder, name)
+                stat = os.stat(path)
+                found[os.path.relpath(path, base_path)] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+
+def _tail_hash(data):
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def read_appended(path, entry=None):
+    """
+    Complete lines appended to a CSV since `entry`, the entry a previous
+    call returned for it (None = read the whole file).
+
+    When the header or the bytes just before the recorded offset differ,
+    the file was rewritten rather than appended to (compacted, migrated)
+    and it is read again from the start; callers tell by `start` not being
+    the offset they had.
+
+    Returns:
+        (new entry, header line, byte offset of data in the file, data)
+    """
+    offset = entry["offset"] if entry else 0
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        if entry and (header_line.decode("utf-8") != entry["header"] or offset > os.fstat(f.fileno()).st_size):
+            offset = 0
+
+        start = max(offset - TAIL_BYTES, len(header_line)) if offset else len(header_line)
+        f.seek(start)
+        data = f.read()
+
+    if offset and _tail_hash(data[:offset - start]) != entry["tail"]:
+        return read_appended(path)
+
+    complete = data.rfind(b"\n") + 1
+    end = start + complete
+    tail_start = max(end - TAIL_BYTES, len(header_line))
+    new_entry = {"offset": end, "header": header_line.decode("utf-8"),
+                 "tail": _tail_hash(data[tail_start - start:complete])}
+    data_start = max(offset, start)
+    return new_entry, header_line.decode("utf-8"), data_start, data[data_start - start:complete]
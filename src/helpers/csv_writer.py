@@ -0,0 +1,150 @@
+import os
+import csv
+import time
+import atexit
+import signal
+import threading
+
+
+def sanitize_rows(rows, fieldnames):
+    """
+    Rows as lists in `fieldnames` order, with the newlines of every string
+    replaced (so each record stays on one line) and surrounding whitespace
+    stripped, like append_to_csv does.
+    """
+    return [
+        [value.replace("\n", " ").replace("\r", "").strip() if isinstance(value, str) else value
+         for value in map(row.get, fieldnames)]
+        for row in rows
+    ]
+
+
+class CsvWriter:
+    """
+    Buffered writer of dict rows to many CSV files.
+
+    Each file is opened once and kept open. An empty file gets the keys of
+    its first row as header; a file that already has one keeps it, and
+    keys it lacks (e.g. job_id in a CSV older than that column) are left
+    out of its rows. Rows are held in memory
+    and only reach the files on flush(), which runs once `max_rows` rows
+    are buffered, once `flush_interval` seconds passed since the last one,
+    and on close().
+
+    Hooks let a journal wrap every flush: `before_flush()` runs before any
+    row is written, `after_flush(paths)` after the rows of `paths` are on
+    disk (fsync'd when `fsync` is set).
+
+    Args:
+        max_rows: Buffered rows (all files together) that trigger a flush
+        flush_interval: Seconds after which a write triggers a flush
+        fsync: fsync every file written by a flush
+    """
+
+    def __init__(self, max_rows=5000, flush_interval=5.0, fsync=False, before_flush=None, after_flush=None):
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.before_flush = before_flush
+        self.after_flush = after_flush
+        self.stats = {"rows": 0, "flushes": 0, "files": 0}
+        self._files = {}    # path -> (file, csv writer, fieldnames)
+        self._buffers = {}  # path -> [rows]
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, path, rows):
+        """Buffer `rows` (dicts) for the CSV at `path`."""
+        if not rows:
+            return
+        self._buffers.setdefault(path, []).extend(rows)
+        self._buffered += len(rows)
+
+        if self._buffered >= self.max_rows or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _open(self, path, first_row):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        f = open(path, "a", newline="", encoding="utf-8")
+        fieldnames = list(first_row)
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(fieldnames)
+        else:
+            with open(path, "r", newline="", encoding="utf-8") as existing:
+                header = next(csv.reader(existing), None)
+            if header and header != fieldnames:
+                print(f"{path} has columns {header}; writing its rows with those")
+                fieldnames = header
+        self._files[path] = (f, writer, fieldnames)
+        self.stats["files"] += 1
+        return self._files[path]
+
+    def flush(self):
+        """Write every buffered row to its file."""
+        self._last_flush = time.monotonic()
+        if self.before_flush is not None:
+            self.before_flush()
+
+        buffers, self._buffers, self._buffered = self._buffers, {}, 0
+        for path, rows in buffers.items():
+            f, writer, fieldnames = self._files.get(path) or self._open(path, rows[0])
+            writer.writerows(sanitize_rows(rows, fieldnames))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            self.stats["rows"] += len(rows)
+        self.stats["flushes"] += bool(buffers)
+
+        if self.after_flush is not None:
+            self.after_flush(list(buffers))
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            for f, _, _ in self._files.values():
+                f.close()
+            self._files.clear()
+
+
+_writer = None
+_hooks_installed = False
+
+
+def _terminate(signum, frame):
+    # Unwind like Ctrl-C does, so `finally` blocks flush and close the writer
+    raise SystemExit(128 + signum)
+
+
+def configure_csv_writer(**kwargs):
+    """
+    Create the process-wide CSV writer (closing the previous one).
+
+    The writer is also closed at interpreter exit, and SIGTERM is turned
+    into SystemExit so a terminated crawl flushes its buffered rows.
+    """
+    global _writer, _hooks_installed
+
+    close_csv_writer()
+    _writer = CsvWriter(**kwargs)
+
+    if not _hooks_installed:
+        atexit.register(close_csv_writer)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, _terminate)
+        _hooks_installed = True
+    return _writer
+
+
+def get_csv_writer():
+    """Return the process-wide CSV writer, or None if none is configured."""
+    return _writer
+
+
+def close_csv_writer():
+    global _writer
+
+    if _writer is not None:
+        writer, _writer = _writer, None
+        writer.close()
@@ -0,0 +1,266 @@
+import os
+import csv
+import sqlite3
+import hashlib
+import tempfile
+from collections import Counter
+
+from helpers.normalize import extract_job_id
+
+# How a duplicate row relates to the first row of its posting
+WITHIN_KEYWORD = "within_keyword"        # same file, same search keyword
+ACROSS_KEYWORDS = "across_keywords"      # same file, another keyword
+ACROSS_CATEGORIES = "across_categories"  # same country, another category
+ACROSS_COUNTRIES = "across_countries"
+KINDS = [WITHIN_KEYWORD, ACROSS_KEYWORDS, ACROSS_CATEGORIES, ACROSS_COUNTRIES]
+
+# Which duplicates a compaction removes, widest last
+SCOPES = {
+    "file": {WITHIN_KEYWORD, ACROSS_KEYWORDS},
+    "country": {WITHIN_KEYWORD, ACROSS_KEYWORDS, ACROSS_CATEGORIES},
+    "global": set(KINDS),
+}
+
+_KEYWORD_BITS = 24
+
+# Index scopes: a posting's first origin is kept per file, per country and
+# over the whole tree, so every repeat is classified against the narrowest
+# scope that already holds the posting
+GLOBAL = 0
+
+
+def file_scope(file_id):
+    return file_id + 1
+
+
+def country_scope(country_id):
+    return -(country_id + 1)
+
+
+def row_key(link):
+    """
+    Dedup key of a row: its job ID, or for links without one a (negative)
+    64-bit hash of the stripped link.
+    """
+    job_id = extract_job_id(link)
+    if job_id is not None:
+        return job_id
+    digest = hashlib.blake2b((link or "").strip().encode("utf-8"), digest_size=8).digest()
+    return -(int.from_bytes(digest, "little") >> 1) - 1
+
+
+class MemoryIndex:
+    """(scope, key) -> origin of its first row, in a dict per scope."""
+
+    def __init__(self):
+        self._origins = {}
+
+    def first_origins(self, scope, keys, origins):
+        """
+        For every (key, origin), return the origin the key was first seen
+        at within `scope`, or None if it is new there (then `origin` is
+        recorded for it).
+        """
+        known = self._origins.setdefault(scope, {})
+        result = []
+        for key, origin in zip(keys, origins):
+            previous = known.get(key)
+            if previous is None:
+                known[key] = origin
+            result.append(previous)
+        return result
+
+    def drop(self, scope):
+        """Forget the keys of a scope that won't be looked up again."""
+        self._origins.pop(scope, None)
+
+    def __len__(self):
+        """Distinct keys over the whole tree."""
+        return len(self._origins.get(GLOBAL, {}))
+
+    def close(self):
+        self._origins.clear()
+
+
+class DiskIndex:
+    """
+    (scope, key) -> origin in a temporary SQLite table, for trees whose keys
+    don't fit in memory. Lookups are batched, one query per chunk of rows.
+    """
+
+    def __init__(self, directory=None, cache_pages=2000):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(suffix=".sqlite", dir=directory)
+        os.close(fd)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=OFF")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        self.connection.execute(f"PRAGMA cache_size={cache_pages}")
+        self.connection.execute("CREATE TABLE origins (scope INTEGER, key INTEGER, origin INTEGER, "
+                                "PRIMARY KEY (scope, key)) WITHOUT ROWID")
+        self._count = 0
+
+    def first_origins(self, scope, keys, origins):
+        known = {}
+        unique = list(set(keys))
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            known.update(self.connection.execute(
+                f"SELECT key, origin FROM origins WHERE scope = ? AND key IN ({placeholders})", [scope, *batch]
+            ))
+
+        result, new = [], []
+        for key, origin in zip(keys, origins):
+            previous = known.get(key)
+            if previous is None:
+                known[key] = origin
+                new.append((scope, key, origin))
+            result.append(previous)
+
+        with self.connection:
+            self.connection.executemany("INSERT INTO origins VALUES (?, ?, ?)", new)
+        if scope == GLOBAL:
+            self._count += len(new)
+        return result
+
+    def drop(self, scope):
+        with self.connection:
+            self.connection.execute("DELETE FROM origins WHERE scope = ?", (scope,))
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self.connection.close()
+        os.remove(self.path)
+
+
+def classify(index, keys, origins, file_id, country_id):
+    """
+    Kind of duplicate every row of one file is (None for a posting's first
+    row), against the narrowest scope that already holds its key: the file
+    itself, then its country, then the whole tree. A key is recorded in
+    every scope it is new to.
+    """
+    kinds = [None] * len(keys)
+    pending = range(len(keys))
+    for scope, kind in ((file_scope(file_id), None), (country_scope(country_id), ACROSS_CATEGORIES),
+                        (GLOBAL, ACROSS_COUNTRIES)):
+        previous = index.first_origins(scope, [keys[i] for i in pending], [origins[i] for i in pending])
+        still_new = []
+        for i, first in zip(pending, previous):
+            if first is None:
+                still_new.append(i)
+            elif kind is None:
+                same_keyword = (first ^ origins[i]) & ((1 << _KEYWORD_BITS) - 1) == 0
+                kinds[i] = WITHIN_KEYWORD if same_keyword else ACROSS_KEYWORDS
+            else:
+                kinds[i] = kind
+        pending = still_new
+    return kinds
+
+
+def dedup_tree(files, scope="file", dry_run=True, index=None, chunk_rows=20_000):
+    """
+    Find (and unless `dry_run`, remove) duplicate postings across CSVs in one pass.
+
+    Files are streamed in the given order. A repeated posting is
+    classified against the narrowest scope (its file, its country, the
+    tree) that already holds it, and removed when that kind of duplicate is
+    in SCOPES[scope]: the first row of a posting is kept per file, per
+    country or once, by scope. A file with rows to remove is rewritten next
+    to itself and renamed over the original, so it is never left
+    half-written.
+
+    Args:
+        files: [(country, category, csv path)]
+        scope: "file", "country" or "global"
+        dry_run: Only report
+        index: MemoryIndex (default) or DiskIndex
+
+    Returns:
+        Dict with rows, unique postings, duplicates per kind, rows removed
+        and {path: rows removed} of the files changed
+    """
+    remove_kinds = SCOPES[scope]
+    index = MemoryIndex() if index is None else index
+    files = list(files)
+    report = {"files": len(files), "rows": 0, "unique": 0, "duplicates": Counter(),
+              "removed": 0, "changed_files": {}}
+
+    countries = {}
+    try:
+        for file_id, (country, _, path) in enumerate(files):
+            country_id = countries.setdefault(country, len(countries))
+            removed = _dedup_file(path, file_id, country_id, index, remove_kinds, dry_run, chunk_rows, report)
+            index.drop(file_scope(file_id))
+            if removed:
+                report["changed_files"][path] = removed
+                report["removed"] += removed
+        report["unique"] = len(index)
+    finally:
+        index.close()
+
+    report["duplicates"] = {kind: report["duplicates"][kind] for kind in KINDS}
+    return report
+
+
+def _dedup_file(path, file_id, country_id, index, remove_kinds, dry_run, chunk_rows, report):
+    tmp_path = f"{path}.dedup"
+    keywords = {}
+    removed = 0
+
+    with open(path, "r", newline="", encoding="utf-8") as src:
+        reader = csv.reader(src)
+        header = next(reader, None)
+        if not header or "link" not in header:
+            return 0
+        link_col = header.index("link")
+        keyword_col = header.index("search_keyword") if "search_keyword" in header else None
+
+        dst = None if dry_run else open(tmp_path, "w", newline="", encoding="utf-8")
+        try:
+            writer = csv.writer(dst) if dst is not None else None
+            if writer is not None:
+                writer.writerow(header)
+
+            while True:
+                rows = [row for _, row in zip(range(chunk_rows), reader) if row]
+                if not rows:
+                    break
+
+                keys, origins = [], []
+                for row in rows:
+                    keyword = row[keyword_col] if keyword_col is not None and len(row) > keyword_col else ""
+                    keyword_id = keywords.setdefault(keyword, len(keywords))
+                    keys.append(row_key(row[link_col] if len(row) > link_col else ""))
+                    origins.append((file_id << _KEYWORD_BITS) | keyword_id)
+
+                kept = []
+                for row, kind in zip(rows, classify(index, keys, origins, file_id, country_id)):
+                    if kind is not None:
+                        report["duplicates"][kind] += 1
+                        if kind in remove_kinds:
+                            removed += 1
+                            continue
+                    kept.append(row)
+
+                report["rows"] += len(rows)
+                if writer is not None:
+                    writer.writerows(kept)
+
+            if dst is not None:
+                dst.flush()
+                os.fsync(dst.fileno())
+        finally:
+            if dst is not None:
+                dst.close()
+
+    if dst is not None:
+        if removed:
+            os.replace(tmp_path, path)
+        else:
+            os.remove(tmp_path)
+    return removed
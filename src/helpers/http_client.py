@@ -0,0 +1,235 @@
+import asyncio
+import statistics
+import time
+from collections import deque
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Connection pool tuning shared by the sync and async clients
+POOL_SIZE = 100             # total pooled connections
+KEEPALIVE_TIMEOUT = 60      # seconds an idle connection is kept open
+DNS_CACHE_TTL = 600         # seconds a resolved host is cached
+REQUEST_TIMEOUT = 10        # seconds, total per request
+LATENCY_SAMPLES = 100_000   # most recent request latencies kept for percentiles
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_stats = {
+    kind: {
+        "requests": 0,
+        "new_connections": 0,
+        "connect_time_s": 0.0,
+        "dns_cache_hits": 0,
+        "dns_cache_misses": 0,
+    }
+    for kind in ("async", "sync")
+}
+
+_latencies = {kind: deque(maxlen=LATENCY_SAMPLES) for kind in ("async", "sync")}
+
+_async_session = None
+_async_session_loop = None
+_sync_session = None
+
+
+def _record_connect(kind, seconds):
+    _stats[kind]["new_connections"] += 1
+    _stats[kind]["connect_time_s"] += seconds
+
+
+# --------------------------------------------------------------------------
+# Async client (aiohttp)
+# --------------------------------------------------------------------------
+
+def _make_trace_config():
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        _stats["async"]["requests"] += 1
+        ctx.request_started = time.perf_counter()
+
+    async def on_request_end(session, ctx, params):
+        _latencies["async"].append(time.perf_counter() - ctx.request_started)
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.connect_started = time.perf_counter()
+
+    async def on_connection_create_end(session, ctx, params):
+        _record_connect("async", time.perf_counter() - ctx.connect_started)
+
+    async def on_dns_cache_hit(session, ctx, params):
+        _stats["async"]["dns_cache_hits"] += 1
+
+    async def on_dns_cache_miss(session, ctx, params):
+        _stats["async"]["dns_cache_misses"] += 1
+
+    trace.on_request_start.append(on_request_start)
+    trace.on_request_end.append(on_request_end)
+    trace.on_connection_create_start.append(on_connection_create_start)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    trace.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace.on_dns_cache_miss.append(on_dns_cache_miss)
+    return trace
+
+
+async def get_async_session():
+    """
+    Return the process-wide aiohttp session, creating it on first use.
+
+    The session is bound to the running event loop; if it was created on a
+    loop that has since finished (or was closed), a fresh one is made.
+    """
+    global _async_session, _async_session_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_session is None or _async_session.closed or _async_session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_SIZE,
+            limit_per_host=0,  # per-host concurrency is enforced by the scheduler
+            ttl_dns_cache=DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        )
+        _async_session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            trace_configs=[_make_trace_config()],
+            auto_decompress=True,
+        )
+        _async_session_loop = loop
+    return _async_session
+
+
+async def close_async_session():
+    """Close the process-wide aiohttp session (call before the loop ends)."""
+    global _async_session, _async_session_loop
+
+    if _async_session is not None and not _async_session.closed:
+        await _async_session.close()
+    _async_session = None
+    _async_session_loop = None
+
+
+# --------------------------------------------------------------------------
+# Sync client (requests)
+# --------------------------------------------------------------------------
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _record_connect("sync", time.perf_counter() - started)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _record_connect("sync", time.perf_counter() - started)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools time every new TCP+TLS connection."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def _count_sync_request(response, *args, **kwargs):
+    _stats["sync"]["requests"] += 1
+    _latencies["sync"].append(response.elapsed.total_seconds())
+
+
+def get_sync_session():
+    """Return the process-wide requests.Session with a keep-alive connection pool."""
+    global _sync_session
+
+    if _sync_session is None:
+        session = requests.Session()
+        adapter = _PooledAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            pool_block=False,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        session.hooks["response"].append(_count_sync_request)
+        _sync_session = session
+    return _sync_session
+
+
+def close_sync_session():
+    """Close the process-wide requests.Session and its pooled connections."""
+    global _sync_session
+
+    if _sync_session is not None:
+        _sync_session.close()
+    _sync_session = None
+
+
+# --------------------------------------------------------------------------
+# Counters
+# --------------------------------------------------------------------------
+
+def client_stats():
+    """
+    Summarize connection reuse for both clients.
+
+    Returns:
+        Dict keyed by "async"/"sync" with request and connection counts,
+        the connection reuse ratio (share of requests that did not open a
+        new connection), the mean handshake (connect) time and the p50/p99
+        request latency in ms.
+    """
+    summary = {}
+    for kind, counters in _stats.items():
+        n_requests = counters["requests"]
+        n_new = counters["new_connections"]
+        summary[kind] = {
+            **counters,
+            "connect_time_s": round(counters["connect_time_s"], 3),
+            "reuse_ratio": round(1 - n_new / n_requests, 3) if n_requests else 0.0,
+            "avg_handshake_ms": (
+                round(1000 * counters["connect_time_s"] / n_new, 1) if n_new else 0.0
+            ),
+            **_latency_percentiles(_latencies[kind]),
+        }
+    return summary
+
+
+def _latency_percentiles(samples):
+    if len(samples) < 2:
+        return {"p50_ms": 0.0, "p99_ms": 0.0}
+    cuts = statistics.quantiles(samples, n=100)
+    return {"p50_ms": round(1000 * cuts[49], 1), "p99_ms": round(1000 * cuts[98], 1)}
+
+
+def reset_client_stats():
+    """Zero all counters (handy between benchmark runs)."""
+    for counters in _stats.values():
+        for key in counters:
+            counters[key] = 0.0 if key == "connect_time_s" else 0
+    for samples in _latencies.values():
+        samples.clear()
@@ -0,0 +1,180 @@
+import os
+import gzip
+import json
+import time
+import asyncio
+
+from helpers.LinkedinAPI2 import fetch_with_retries
+from helpers.normalize import extract_job_id
+from helpers.job_page import extract_job_page, job_record
+from helpers.http_client import get_async_session, close_async_session, client_stats
+from helpers.parse_pool import parse_off_loop
+from helpers.resilience import OK, CLIENT_ERROR, get_circuit_breaker
+from helpers.page_archive import get_page_archive
+from helpers.scheduler import RequestBudget
+
+# LINKEDIN_DETAIL_URL points the detail crawl at a stand-in server (see Benchmarks/mock_linkedin_server.py)
+DETAIL_URL = os.environ.get("LINKEDIN_DETAIL_URL", "https://www.linkedin.com/jobs/view/{job_id}")
+
+# Outcomes that mean the posting is gone (404/410 and the like); they are
+# recorded and not fetched again. An empty 200 body is often throttling, so
+# it counts as failed and is retried by the next run
+GONE = {CLIENT_ERROR}
+
+
+def detail_url(job_id):
+    return DETAIL_URL.format(job_id=job_id)
+
+
+def read_job_ids(path):
+    """
+    Read job IDs from a file of links (urls_only.txt) or bare IDs, one per line
+    (gzip-compressed if its name ends in .gz).
+
+    Returns:
+        List of unique job IDs in file order
+    """
+    job_ids = []
+    seen = set()
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            job_id = int(line) if line.isdigit() else extract_job_id(line)
+            if job_id is not None and job_id not in seen:
+                seen.add(job_id)
+                job_ids.append(job_id)
+    return job_ids
+
+
+def parse_job_page(html_text):
+    """Extract the structured fields of one job page (see helpers/job_page.py)."""
+    return job_record(extract_job_page(html_text))
+
+
+class JobDetailStore:
+    """
+    Append-only JSONL file of job detail records, one per job ID.
+
+    The IDs already in the file are loaded on open, so a rerun only fetches
+    jobs it hasn't recorded yet (a later record of a job replaces an
+    earlier one). A record torn by a crash (a last line
+    without its newline) is cut off.
+
+    Args:
+        path: JSONL file to append to
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._load()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+            print(f"Dropped a torn record at the end of {self.path}")
+
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            # Older runs also recorded empty pages as gone; those are fetched again
+            if "job_id" in record and record.get("status", OK) in {OK} | GONE:
+                self.done.add(record["job_id"])
+
+    def __contains__(self, job_id):
+        return job_id in self.done
+
+    def append(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.done.add(record["job_id"])
+
+    def close(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+
+async def crawl_job_details(job_ids, store, max_concurrent=8, per_host=6, workers=32):
+    """
+    Fetch and parse the detail page of every job ID not yet in `store`.
+
+    Requests go through the same rate controller, circuit breaker and
+    retry policy as the search crawl; pages are parsed on the parse pool
+    when one is configured, and archived under their job ID when the page
+    archive is enabled. Jobs that failed transiently aren't recorded, so
+    the next run retries them.
+
+    Returns:
+        Dict of run statistics
+    """
+    stats = {"jobs": 0, "skipped": 0, "recorded": 0, "gone": 0, "failed": 0}
+    queue = asyncio.Queue()
+    for job_id in job_ids:
+        if job_id in store:
+            stats["skipped"] += 1
+        else:
+            queue.put_nowait(job_id)
+    stats["jobs"] = queue.qsize()
+
+    budget = RequestBudget(max_concurrent, per_host)
+    semaphore = budget.for_url(detail_url(0))
+    started = time.perf_counter()
+    session = await get_async_session()
+
+    async def worker():
+        while True:
+            try:
+                job_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            url = detail_url(job_id)
+            html_text, outcome = await fetch_with_retries(
+                session, url, None, semaphore, None, f"job {job_id}"
+            )
+            record = {"job_id": job_id, "url": url, "status": outcome, "fetched_at": int(time.time())}
+
+            if outcome == OK:
+                archive = get_page_archive()
+                if archive is not None:
+                    archive.put(job_id, html_text)
+                try:
+                    record.update(await parse_off_loop(parse_job_page, html_text))
+                except Exception as e:
+                    print(f"Error parsing job {job_id}: {e}")
+                    stats["failed"] += 1
+                    continue
+                stats["recorded"] += 1
+            elif outcome in GONE:
+                stats["gone"] += 1
+            else:
+                stats["failed"] += 1
+                continue
+
+            store.append(record)
+            if (stats["recorded"] + stats["gone"]) % 100 == 0:
+                print(f"Recorded {stats['recorded'] + stats['gone']}/{stats['jobs']} jobs")
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await close_async_session()
+
+    stats["elapsed_s"] = round(time.perf_counter() - started, 2)
+    stats["breaker_trips"] = get_circuit_breaker().trips
+    stats["http"] = client_stats()["async"]
+    return stats
@@ -0,0 +1,233 @@
+import io
+import os
+import csv
+import json
+import mmap
+import struct
+from itertools import accumulate
+
+import numpy as np
+
+from helpers.csv_tail import scan_csvs, read_appended
+from helpers.normalize import extract_job_id
+
+INDEX_VERSION = 1
+INDEX_FILE = "job_index.bin"
+MANIFEST_FILE = "job_index.json"
+
+# One entry per row: job ID, file id (position in the manifest's file list), byte offset of the row
+ENTRY = struct.Struct("<QIQ")
+ENTRY_DTYPE = np.dtype([("job_id", "<u8"), ("file_id", "<u4"), ("offset", "<u8")])
+_JOB_ID = struct.Struct("<Q")
+
+
+def index_csv(path, entry=None):
+    """
+    (job ID, byte offset) of every row appended to one CSV since `entry`.
+
+    Rows are one line each (the scraper strips newlines from every field),
+    so offsets are counted per line. Rows without a job ID are skipped.
+
+    Returns:
+        (new manifest entry, job IDs, offsets, whether the file was rewritten)
+    """
+    new_entry, header_line, start, data = read_appended(path, entry)
+    rewritten = entry is not None and start != entry["offset"]
+
+    header = next(csv.reader([header_line]), [])
+    id_col = header.index("job_id") if "job_id" in header else None
+    link_col = header.index("link") if "link" in header else None
+
+    lines = data.splitlines(keepends=True)
+    offsets = accumulate((len(line) for line in lines), initial=start)
+    job_ids, row_offsets = [], []
+    for row, offset in zip(csv.reader(io.StringIO(data.decode("utf-8"))), offsets):
+        job_id = None
+        if id_col is not None and len(row) > id_col and row[id_col].isdigit():
+            job_id = int(row[id_col])
+        elif link_col is not None and len(row) > link_col:
+            job_id = extract_job_id(row[link_col])
+        if job_id is not None:
+            job_ids.append(job_id)
+            row_offsets.append(offset)
+    return new_entry, job_ids, row_offsets, rewritten
+
+
+def _load_manifest(index_dir, scraped_dir):
+    """Manifest of the index in `index_dir`, or a blank one if it's missing or out of step."""
+    blank = {"version": INDEX_VERSION, "root": scraped_dir, "entries": 0, "files": []}
+    try:
+        with open(os.path.join(index_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        size = os.path.getsize(os.path.join(index_dir, INDEX_FILE))
+    except (OSError, ValueError):
+        return blank
+
+    # Interrupted between writing the index and its manifest: rebuild
+    if (manifest.get("version") != INDEX_VERSION or manifest.get("root") != scraped_dir
+            or size != manifest["entries"] * ENTRY.size):
+        return blank
+    return manifest
+
+
+def _replace(path, write):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def update_job_index(scraped_dir, index_dir):
+    """
+    Bring the job index in `index_dir` up to date with the CSVs of `scraped_dir`.
+
+    Unchanged CSVs are skipped by their size and mtime, grown ones are only
+    read past the offset indexed last time, and rewritten or deleted ones
+    have their entries dropped (and rewritten ones are indexed again). The
+    new entries are merged into the sorted index, which is replaced
+    atomically.
+
+    Returns:
+        Dict with the number of CSVs, CSVs read, entries added and entries in the index
+    """
+    scraped_dir = os.path.abspath(scraped_dir)
+    manifest = _load_manifest(index_dir, scraped_dir)
+    files = manifest["files"]
+    file_ids = {entry["path"]: file_id for file_id, entry in enumerate(files) if entry}
+
+    found = scan_csvs(scraped_dir)
+    changed = sorted(name for name, stat in found.items()
+                     if name not in file_ids or (files[file_ids[name]]["size"], files[file_ids[name]]["mtime_ns"]) != stat)
+    dropped = {file_ids[name] for name in file_ids if name not in found}
+    stats = {"files": len(found), "read": len(changed), "added": 0, "entries": manifest["entries"]}
+    if not changed and not dropped:
+        return stats
+
+    new_ids, new_files, new_offsets = [], [], []
+    for name in changed:
+        file_id = file_ids.get(name)
+        if file_id is None:
+            file_id = file_ids[name] = len(files)
+            files.append(None)
+
+        entry, job_ids, offsets, rewritten = index_csv(os.path.join(scraped_dir, name), files[file_id])
+        if rewritten:
+            dropped.add(file_id)
+        entry["path"] = name
+        entry["size"], entry["mtime_ns"] = found[name]
+        files[file_id] = entry
+
+        new_ids.extend(job_ids)
+        new_files.extend([file_id] * len(job_ids))
+        new_offsets.extend(offsets)
+
+    # Deleted files keep their slot (file ids are positions) but lose their entries
+    for file_id in dropped:
+        if files[file_id]["path"] not in found:
+            files[file_id] = None
+
+    index_path = os.path.join(index_dir, INDEX_FILE)
+    os.makedirs(index_dir, exist_ok=True)
+    old = np.fromfile(index_path, dtype=ENTRY_DTYPE) if manifest["entries"] else np.empty(0, ENTRY_DTYPE)
+    if dropped:
+        old = old[~np.isin(old["file_id"], list(dropped))]
+
+    new = np.empty(len(new_ids), ENTRY_DTYPE)
+    new["job_id"], new["file_id"], new["offset"] = new_ids, new_files, new_offsets
+    merged = np.concatenate([old, new])
+    # A job's rows by file, then offset: the same order however the index was built up
+    merged = merged[np.lexsort((merged["offset"], merged["file_id"], merged["job_id"]))]
+
+    _replace(index_path, lambda f: f.write(merged.tobytes()))
+    manifest["entries"] = stats["entries"] = len(merged)
+    stats["added"] = len(new)
+    _replace(os.path.join(index_dir, MANIFEST_FILE), lambda f: f.write(json.dumps(manifest).encode("utf-8")))
+    return stats
+
+
+class JobIndex:
+    """
+    Read-only view of a job index: the sorted entries are memory-mapped and
+    binary-searched, and matching rows are read from their CSVs by offset,
+    so a lookup touches a few pages of the index and one line per row.
+
+    Run update_job_index() first; an index older than a rewrite of its
+    CSVs points at the wrong bytes.
+
+    Args:
+        index_dir: Directory holding job_index.bin and job_index.json
+    """
+
+    def __init__(self, index_dir):
+        with open(os.path.join(index_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.root = manifest["root"]
+        self.files = manifest["files"]
+        self.headers = [next(csv.reader([entry["header"]]), []) if entry else None for entry in self.files]
+        self.count = manifest["entries"]
+
+        self._file = open(os.path.join(index_dir, INDEX_FILE), "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.count else None
+        self._fds = {}
+
+    def __len__(self):
+        return self.count
+
+    def _job_id_at(self, position):
+        return _JOB_ID.unpack_from(self._mmap, position * ENTRY.size)[0]
+
+    def lookup(self, job_id):
+        """[(file id, byte offset)] of every row of `job_id`, in file order."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._job_id_at(mid) < job_id:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        matches = []
+        while lo < self.count:
+            entry_job_id, file_id, offset = ENTRY.unpack_from(self._mmap, lo * ENTRY.size)
+            if entry_job_id != job_id:
+                break
+            matches.append((file_id, offset))
+            lo += 1
+        return matches
+
+    def _read_line(self, file_id, offset):
+        fd = self._fds.get(file_id)
+        if fd is None:
+            fd = self._fds[file_id] = os.open(os.path.join(self.root, self.files[file_id]["path"]), os.O_RDONLY)
+        data = os.pread(fd, 4096, offset)
+        while b"\n" not in data:
+            more = os.pread(fd, 4096, offset + len(data))
+            if not more:
+                break
+            data += more
+        return data.split(b"\n", 1)[0].decode("utf-8")
+
+    def rows(self, job_id):
+        """
+        Rows of `job_id` as dicts (their CSV columns plus country and
+        category, taken from the <Country>/<Category>/ path), in file order.
+        """
+        rows = []
+        for file_id, offset in self.lookup(job_id):
+            values = next(csv.reader([self._read_line(file_id, offset)]), [])
+            parts = self.files[file_id]["path"].split(os.sep)
+            row = {"country": parts[0] if len(parts) > 2 else None,
+                   "category": parts[1] if len(parts) > 2 else None}
+            row.update(zip(self.headers[file_id], values))
+            rows.append(row)
+        return rows
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds = {}
@@ -0,0 +1,338 @@
+import json
+from html import unescape
+from html.parser import HTMLParser
+
+# Where a job page keeps the data worth collecting (see Data/HTML_example_parsing_issues/Conclusion.md)
+LD_JSON_TYPE = "application/ld+json"
+SALARY_CLASS = "compensation__salary"
+DESCRIPTION_SECTION_CLASS = "show-more-less-html"
+DESCRIPTION_MARKUP_CLASS = "show-more-less-html__markup"
+CRITERIA_ITEM_CLASS = "description__job-criteria-item"
+CRITERIA_NAME_CLASS = "description__job-criteria-subheader"
+CRITERIA_VALUE_CLASS = "description__job-criteria-text"
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class _Collector:
+    """Stripped text pieces of one element, joined like get_text(strip=True)."""
+
+    def __init__(self):
+        self.pieces = []
+
+    def add(self, data):
+        data = data.strip()
+        if data:
+            self.pieces.append(data)
+
+    @property
+    def text(self):
+        return "".join(self.pieces)
+
+
+class _DescriptionText:
+    """
+    Plain text of description markup: <br> becomes a newline and every <li>
+    becomes a "- " bullet line.
+    """
+
+    def __init__(self):
+        self.parts = []
+
+    def start(self, tag):
+        if tag == "br":
+            self.parts.append("\n")
+        elif tag == "li":
+            self.parts.append("- ")
+
+    def end(self, tag):
+        if tag == "li":
+            self.parts.append("\n")
+
+    def data(self, data):
+        # Whitespace-only text collapses to one newline or space, as in BeautifulSoup
+        if not data.strip():
+            data = "\n" if "\n" in data else " "
+        self.parts.append(data)
+
+    @property
+    def text(self):
+        return "".join(self.parts).strip()
+
+
+class _SectionLines:
+    """
+    Block-structured text of one show-more-less-html section: paragraphs
+    separated by blank lines, list items as "• " bullets.
+
+    Lines are resolved when the section closes, because whether a list
+    adds a separating blank line depends on the text of earlier elements.
+    """
+
+    def __init__(self):
+        self.tokens = []  # ("text" or "bullet", collector, blank_after) / ("blank",) / ("sep",)
+        self.open = []    # collectors of the <p>/<li> elements still open
+
+    def start(self, tag):
+        if tag == "p":
+            collector = _Collector()
+            self.tokens.append(("text", collector, True))
+            self.open.append((tag, collector))
+        elif tag == "li":
+            collector = _Collector()
+            self.tokens.append(("bullet", collector, False))
+            self.open.append((tag, collector))
+        elif tag == "br":
+            self.tokens.append(("blank",))
+        elif tag in ("ul", "ol"):
+            self.tokens.append(("sep",))
+
+    def end(self, tag):
+        for i in range(len(self.open) - 1, -1, -1):
+            if self.open[i][0] == tag:
+                del self.open[i:]
+                break
+
+    def data(self, data):
+        for _, collector in self.open:
+            collector.add(data)
+
+    @property
+    def text(self):
+        lines = []
+        for token in self.tokens:
+            if token[0] in ("text", "bullet"):
+                text = token[1].text
+                if text:
+                    lines.append(f"• {text}" if token[0] == "bullet" else text)
+                    if token[2]:
+                        lines.append("")
+            elif token[0] == "blank":
+                lines.append("")
+            elif lines and lines[-1] != "":
+                lines.append("")
+
+        # Collapse runs of blank lines
+        cleaned = []
+        for line in lines:
+            if line or not cleaned or cleaned[-1]:
+                cleaned.append(line)
+        return "\n".join(cleaned).strip()
+
+
+# Marks the element closing a show-more-less-html section
+_SECTION_END = object()
+
+
+class _JobPageParser(HTMLParser):
+    """Single pass over a job page feeding every extractor at once."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []          # (tag, [handlers closed with this element])
+        self.ld_scripts = []
+        self.sections = []       # _SectionLines of every show-more-less-html section
+        self.salary = None
+        self.criteria = []
+        self.description = None  # _DescriptionText of the first section's markup
+        self._active = []        # handlers receiving tags and data
+        self._in_section = False
+        self._markup_seen = False
+        self._criteria_item = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        handlers = []
+
+        for handler in self._active:
+            if not isinstance(handler, _Collector):
+                handler.start(tag)
+
+        if tag == "script" and attrs.get("type") == LD_JSON_TYPE:
+            script = []
+            self.ld_scripts.append(script)
+            handlers.append(script)
+        elif tag == "section" and DESCRIPTION_SECTION_CLASS in classes and not self._in_section:
+            self._in_section = True
+            self._markup_seen = False
+            self.sections.append(_SectionLines())
+            handlers += [self.sections[-1], _SECTION_END]
+        elif (tag == "div" and self._in_section and not self._markup_seen
+              and any(DESCRIPTION_MARKUP_CLASS in c for c in classes)):
+            # Once a section has a markup div, only the div's content counts
+            self._markup_seen = True
+            if self.sections[-1] in self._active:
+                self._active.remove(self.sections[-1])
+            self.sections[-1] = _SectionLines()
+            handlers.append(self.sections[-1])
+            if self.description is None:
+                self.description = _DescriptionText()
+                handlers.append(self.description)
+        elif tag == "div" and SALARY_CLASS in classes and self.salary is None:
+            self.salary = _Collector()
+            handlers.append(self.salary)
+        elif tag == "li" and CRITERIA_ITEM_CLASS in classes:
+            self._criteria_item = [None, None]
+            handlers.append(self._criteria_item)
+        elif self._criteria_item is not None and tag in ("h3", "span"):
+            index = 0 if CRITERIA_NAME_CLASS in classes else 1 if CRITERIA_VALUE_CLASS in classes else None
+            if index is not None and self._criteria_item[index] is None:
+                self._criteria_item[index] = _Collector()
+                handlers.append(self._criteria_item[index])
+
+        self._active += [h for h in handlers if isinstance(h, (_Collector, _SectionLines, _DescriptionText))]
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, handlers))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element (unclosed children end with it)
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                break
+        else:
+            return
+
+        while len(self.stack) > i:
+            closed_tag, handlers = self.stack.pop()
+            for handler in self._active:
+                if not isinstance(handler, _Collector):
+                    handler.end(closed_tag)
+            for handler in handlers:
+                self._close(handler)
+
+    def _close(self, handler):
+        if handler is _SECTION_END:
+            self._in_section = False
+        elif handler is self._criteria_item:
+            name, value = handler
+            if name is not None and value is not None:
+                self.criteria.append((name.text, value.text))
+            self._criteria_item = None
+        elif not isinstance(handler, list) and handler in self._active:
+            self._active.remove(handler)
+
+    def handle_data(self, data):
+        if self.stack and self.stack[-1][0] == "script":
+            # Script bodies only ever feed the LD+JSON extractor
+            for handler in self.stack[-1][1]:
+                handler.append(data)
+            return
+
+        for handler in self._active:
+            if isinstance(handler, _Collector):
+                handler.add(data)
+            else:
+                handler.data(data)
+
+
+def description_text(fragment):
+    """Plain text of a description HTML fragment (e.g. a schema.org description)."""
+    parser = _FragmentParser()
+    parser.feed(fragment)
+    parser.close()
+    return parser.text.text
+
+
+class _FragmentParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = _DescriptionText()
+
+    def handle_starttag(self, tag, attrs):
+        self.text.start(tag)
+
+    def handle_endtag(self, tag):
+        self.text.end(tag)
+
+    def handle_data(self, data):
+        self.text.data(data)
+
+
+def extract_job_page(html_text):
+    """
+    Extract everything worth keeping from a job page in one pass.
+
+    Returns:
+        Dict with
+          ld_json: every parseable LD+JSON object on the page
+          show_more_less: text of every show-more-less-html section
+          salary_text: text of the compensation__salary div, or None
+          criteria: {criteria name: value} of the job criteria list
+          description: clean description text, from the LD+JSON JobPosting
+                       when it has one, otherwise from the page markup
+    """
+    parser = _JobPageParser()
+    parser.feed(html_text)
+    parser.close()
+
+    ld_json = []
+    for script in parser.ld_scripts:
+        try:
+            ld_json.append(json.loads("".join(script)))
+        except json.JSONDecodeError:
+            continue
+
+    posting = next((d for d in ld_json if isinstance(d, dict) and d.get("@type") == "JobPosting"), {})
+    if posting.get("description"):
+        description = description_text(unescape(posting["description"]))
+    elif parser.description is not None:
+        description = parser.description.text
+    else:
+        description = None
+
+    return {
+        "ld_json": ld_json,
+        "show_more_less": [text for text in (s.text for s in parser.sections) if text],
+        "salary_text": parser.salary.text if parser.salary is not None else None,
+        "criteria": dict(parser.criteria),
+        "description": description,
+    }
+
+
+def _first_object(value):
+    """A schema.org property as one dict: the first of a list, {} for anything else."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value if isinstance(value, dict) else {}
+
+
+def job_record(extracted):
+    """
+    Flatten extract_job_page() output into one job record.
+
+    Returns:
+        Dict of fields; missing ones are None
+    """
+    posting = next(
+        (d for d in extracted["ld_json"] if isinstance(d, dict) and d.get("@type") == "JobPosting"), {}
+    )
+    criteria = extracted["criteria"]
+    organization = _first_object(posting.get("hiringOrganization"))
+    address = _first_object(_first_object(posting.get("jobLocation")).get("address"))
+    base_salary = _first_object(posting.get("baseSalary"))
+    salary_value = _first_object(base_salary.get("value"))
+
+    return {
+        "title": posting.get("title"),
+        "company": organization.get("name"),
+        "locality": address.get("addressLocality"),
+        "region": address.get("addressRegion"),
+        "country": address.get("addressCountry"),
+        "date_posted": posting.get("datePosted"),
+        "valid_through": posting.get("validThrough"),
+        "employment_type": posting.get("employmentType") or criteria.get("Employment type"),
+        "seniority_level": criteria.get("Seniority level"),
+        "job_function": criteria.get("Job function"),
+        "industries": posting.get("industry") or criteria.get("Industries"),
+        "salary_text": extracted["salary_text"] or None,
+        "salary_min": salary_value.get("minValue"),
+        "salary_max": salary_value.get("maxValue"),
+        "salary_currency": base_salary.get("currency"),
+        "salary_unit": salary_value.get("unitText"),
+        "has_ld_json": bool(posting),
+        "description": extracted["description"],
+    }
@@ -1,9 +1,59 @@
 import re
 
+# Numeric posting ID at the end of a /jobs/view/<slug>-<id> path
+_JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/?#]*?-)?(\d{6,})(?:[/?#]|$)")
+
 
 def normalize_linkedin_url(url: str) -> str:
     return re.sub(
         r"https://[a-z]{2}\.linkedin\.com",
         "https://www.linkedin.com",
         url
-    )
\ No newline at end of file
+    )
+
+
+def extract_job_id(url: str) -> int | None:
+    """Return the numeric LinkedIn job ID of a /jobs/view/ link, or None."""
+    match = _JOB_ID_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+# Canonical form of a posting's link: no slug, no position/pageNum/refId/trackingId
+CANONICAL_JOB_URL = "https://www.linkedin.com/jobs/view/{job_id}"
+
+
+def canonical_job_url(job_id: int) -> str:
+    return CANONICAL_JOB_URL.format(job_id=job_id)
+
+
+def canonicalize_jobs(jobs: list[dict]) -> list[dict]:
+    """
+    Give every scraped job its integer `job_id` and canonical link, in place.
+
+    Links without a job ID are kept as they are and get job_id None. The
+    job_id key is placed right after link.
+
+    Returns:
+        The same list
+    """
+    search = _JOB_ID_RE.search
+    for i, job in enumerate(jobs):
+        link = job.get("link")
+        match = search(link) if link else None
+        if match:
+            job_id = int(match.group(1))
+            link = CANONICAL_JOB_URL.format(job_id=job_id)
+        else:
+            job_id = None
+
+        # Rebuild the dict so the column order is title, company, location, link, job_id, ...
+        canonical = {}
+        for key, value in job.items():
+            if key == "job_id":
+                continue
+            canonical[key] = value
+            if key == "link":
+                canonical["link"] = link
+                canonical["job_id"] = job_id
+        jobs[i] = canonical
+    return jobs
@@ -0,0 +1,453 @@
+import os
+import re
+import json
+import time
+import zlib
+import struct
+import hashlib
+from collections import Counter
+
+try:
+    import zstandard
+except ImportError:  # optional: without it pages are zlib-compressed with a preset dictionary
+    zstandard = None
+
+from helpers.response_cache import ResponseCache
+
+ARCHIVE_VERSION = 1
+META_FILE = "archive.json"
+BLOBS_FILE = "blobs.idx"
+KEYS_FILE = "keys.idx"
+
+# Segment record: content hash, dictionary id (0 = none), compressed length; then the data
+RECORD = struct.Struct("<16sHI")
+# blobs.idx: content hash -> segment, offset and length of its record
+BLOB_ENTRY = struct.Struct("<16sIII")
+# keys.idx: key -> content hash, fetch time; a later entry of the same key replaces the earlier
+KEY_ENTRY = struct.Struct("<Q16sI")
+
+# zlib only looks back 32 KB, so a longer preset dictionary would be wasted
+ZLIB_DICT_SIZE = 32 * 1024
+ZSTD_DICT_SIZE = 112 * 1024
+# Pieces of markup the zlib dictionary is built from: lines, and tags within minified lines
+_FRAGMENT_RE = re.compile(rb"[\r\n]+|(?=<)")
+
+
+def request_key(endpoint, params):
+    """Archive key of a guest API request (same fields as the response cache key)."""
+    return json.dumps(ResponseCache.make_key(endpoint, params), sort_keys=True, ensure_ascii=False)
+
+
+def encode_key(key):
+    """
+    64-bit index key: a job ID as is, any other key (a request key) hashed
+    with the top bit set, so the two never collide.
+    """
+    if isinstance(key, int):
+        return key
+    digest = hashlib.blake2b(str(key).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") | (1 << 63)
+
+
+def content_hash(body):
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def train_zlib_dictionary(samples, size=ZLIB_DICT_SIZE):
+    """
+    Preset dictionary for zlib from sample pages (bytes): the markup
+    fragments (tags, script and style lines) that recur in at least half of
+    them, most frequent last since zlib finds the nearest matches cheapest.
+    """
+    counts = Counter()
+    for body in samples:
+        counts.update({piece.strip() for piece in _FRAGMENT_RE.split(body) if len(piece.strip()) >= 8})
+
+    threshold = max(2, len(samples) // 2)
+    common = sorted((piece for piece, n in counts.items() if n >= threshold), key=lambda piece: (counts[piece], piece))
+
+    parts, total = [], 0
+    for piece in reversed(common):
+        if total + len(piece) + 1 > size:
+            break
+        parts.append(piece)
+        total += len(piece) + 1
+    return b"\n".join(reversed(parts))
+
+
+class _Codec:
+    """Compression of one archive: zstd when installed (and chosen), else zlib."""
+
+    def __init__(self, name, level):
+        if name == "zstd" and zstandard is None:
+            raise RuntimeError("This archive is zstd-compressed: pip install zstandard")
+        self.name = name
+        self.level = level
+        self.dictionaries = {0: None}
+        self._compressors = {}
+        self._decompressors = {}
+
+    def add_dictionary(self, dict_id, data):
+        self.dictionaries[dict_id] = data
+
+    def train(self, samples):
+        """Dictionary bytes trained on `samples` (bytes), or None if there is too little to learn from."""
+        if self.name == "zstd":
+            try:
+                return zstandard.train_dictionary(ZSTD_DICT_SIZE, samples).as_bytes()
+            except zstandard.ZstdError:
+                return None
+        return train_zlib_dictionary(samples) or None
+
+    def compress(self, body, dict_id):
+        data = self.dictionaries[dict_id]
+        if self.name == "zstd":
+            if dict_id not in self._compressors:
+                zdict = zstandard.ZstdCompressionDict(data) if data else None
+                self._compressors[dict_id] = zstandard.ZstdCompressor(level=self.level, dict_data=zdict)
+            return self._compressors[dict_id].compress(body)
+        compressor = zlib.compressobj(self.level, zdict=data) if data else zlib.compressobj(self.level)
+        return compressor.compress(body) + compressor.flush()
+
+    def decompress(self, blob, dict_id):
+        data = self.dictionaries[dict_id]
+        if self.name == "zstd":
+            if dict_id not in self._decompressors:
+                zdict = zstandard.ZstdCompressionDict(data) if data else None
+                self._decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=zdict)
+            return self._decompressors[dict_id].decompress(blob)
+        decompressor = zlib.decompressobj(zdict=data) if data else zlib.decompressobj()
+        return decompressor.decompress(blob) + decompressor.flush()
+
+
+def is_page_archive(path):
+    return os.path.isfile(os.path.join(path, META_FILE))
+
+
+class PageArchive:
+    """
+    Append-only archive of raw fetched pages (search pages and job pages).
+
+    Pages are compressed into segment files (seg-000001.bin, ...) that are
+    only ever appended to. Identical bodies are stored once, found by their
+    content hash. Two fixed-width index files map a content hash to its
+    (segment, offset, length) and a key (job ID or request key) to a content
+    hash; both are loaded into memory on open, so a page is read back with
+    one positioned read and one decompression. Index entries are written
+    through after every put (behind the segment record they point to), so
+    an archive opened while a crawl is still archiving sees every page put
+    so far.
+
+    The first `train_after` pages are stored without a dictionary and kept
+    as samples; a dictionary trained on them (zstd's trainer, or the shared
+    markup lines for zlib) then compresses every later page.
+
+    Args:
+        root: Archive directory
+        codec: "zstd" or "zlib" for a new archive (default: zstd if installed)
+        level: Compression level
+        segment_bytes: Size after which a new segment is started
+        train_after: Pages sampled before the dictionary is trained (0 = no dictionary)
+        readonly: Only read an existing archive: nothing is created, opened
+                  for writing or repaired, so it is safe next to a live writer
+    """
+
+    def __init__(self, root, codec=None, level=None, segment_bytes=64 * 1024 * 1024, train_after=64,
+                 readonly=False):
+        self.root = root
+        self.segment_bytes = segment_bytes
+        self.train_after = train_after
+        self.readonly = readonly
+
+        meta_path = os.path.join(root, META_FILE)
+        if readonly and not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No page archive in {root}")
+        if not readonly:
+            os.makedirs(root, exist_ok=True)
+
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                self.meta = json.load(f)
+        else:
+            codec = codec or ("zstd" if zstandard is not None else "zlib")
+            self.meta = {"version": ARCHIVE_VERSION, "codec": codec,
+                         "level": level or (10 if codec == "zstd" else 6), "dictionaries": []}
+            self._save_meta()
+
+        self.codec = _Codec(self.meta["codec"], self.meta["level"])
+        for dict_id in self.meta["dictionaries"]:
+            self._load_dictionary(dict_id)
+        self._samples = []
+
+        self.blobs = {}
+        self.keys = {}
+        self._segment_sizes = {}
+        self._load_indexes()
+
+        self._read_fds = {}
+        self._segment = max(self._segment_sizes, default=1)
+        self._write_fd = None
+        self._blobs_file = None if readonly else open(os.path.join(root, BLOBS_FILE), "ab")
+        self._keys_file = None if readonly else open(os.path.join(root, KEYS_FILE), "ab")
+        self.stats = {"puts": 0, "stored": 0, "duplicates": 0, "raw_bytes": 0, "stored_bytes": 0}
+
+    def _save_meta(self):
+        path = os.path.join(self.root, META_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+        os.replace(f"{path}.tmp", path)
+
+    def _load_dictionary(self, dict_id):
+        with open(os.path.join(self.root, f"dict-{dict_id}.bin"), "rb") as f:
+            self.codec.add_dictionary(dict_id, f.read())
+
+    def _segment_path(self, segment):
+        return os.path.join(self.root, f"seg-{segment:06d}.bin")
+
+    def _read_entries(self, path, entry):
+        """Entries of an index file; a torn last entry (crash mid-write) is cut off."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        whole = len(data) - len(data) % entry.size
+        # A reader only skips it: the entry may be a live writer's, still being written
+        if whole != len(data) and not self.readonly:
+            with open(path, "r+b") as f:
+                f.truncate(whole)
+        return entry.iter_unpack(data[:whole])
+
+    def _load_indexes(self):
+        for name in os.listdir(self.root):
+            if name.startswith("seg-") and name.endswith(".bin"):
+                self._segment_sizes[int(name[4:-4])] = os.path.getsize(os.path.join(self.root, name))
+
+        for digest, segment, offset, length in self._read_entries(os.path.join(self.root, BLOBS_FILE), BLOB_ENTRY):
+            # Skip entries whose record didn't reach the segment before a crash
+            if offset + length <= self._segment_sizes.get(segment, 0):
+                self.blobs[digest] = (segment, offset, length)
+
+        for key, digest, fetched_at in self._read_entries(os.path.join(self.root, KEYS_FILE), KEY_ENTRY):
+            if digest in self.blobs:
+                self.keys[key] = (digest, fetched_at)
+
+    def _train(self):
+        data = self.codec.train(self._samples)
+        self._samples = []
+        if data is None:
+            return
+        dict_id = max(self.meta["dictionaries"], default=0) + 1
+        with open(os.path.join(self.root, f"dict-{dict_id}.bin"), "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.codec.add_dictionary(dict_id, data)
+        self.meta["dictionaries"].append(dict_id)
+        self._save_meta()
+
+    def _append_record(self, digest, blob, dict_id):
+        record = RECORD.pack(digest, dict_id, len(blob)) + blob
+        size = self._segment_sizes.get(self._segment, 0)
+        if size and size + len(record) > self.segment_bytes:
+            self._close_writer()
+            self._segment += 1
+            size = 0
+        if self._write_fd is None:
+            self._write_fd = os.open(self._segment_path(self._segment), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+        os.write(self._write_fd, record)
+        self._segment_sizes[self._segment] = size + len(record)
+        return self._segment, size, len(record)
+
+    def put(self, key, body, fetched_at=None):
+        """
+        Archive one page under `key` (a job ID or request key).
+
+        Returns:
+            True if the body was stored, False if an identical one already was
+        """
+        if self.readonly:
+            raise PermissionError(f"{self.root} is open read-only")
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = content_hash(body)
+        self.stats["puts"] += 1
+
+        if digest in self.blobs:
+            self.stats["duplicates"] += 1
+            stored = False
+        else:
+            dict_id = max(self.meta["dictionaries"], default=0)
+            location = self._append_record(digest, self.codec.compress(body, dict_id), dict_id)
+            self.blobs[digest] = location
+            self._blobs_file.write(BLOB_ENTRY.pack(digest, *location))
+            self.stats["stored"] += 1
+            self.stats["raw_bytes"] += len(body)
+            self.stats["stored_bytes"] += location[2]
+            stored = True
+
+            if self.train_after and not self.meta["dictionaries"]:
+                self._samples.append(body)
+                if len(self._samples) >= self.train_after:
+                    self._train()
+
+        fetched_at = int(fetched_at or time.time())
+        key = encode_key(key)
+        self.keys[key] = (digest, fetched_at)
+        self._keys_file.write(KEY_ENTRY.pack(key, digest, fetched_at))
+        # The record is already written, so readers opening the archive now can find it
+        self.flush(fsync=False)
+        return stored
+
+    def __contains__(self, key):
+        return encode_key(key) in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _read_blob(self, digest):
+        segment, offset, length = self.blobs[digest]
+        fd = self._read_fds.get(segment)
+        if fd is None:
+            fd = self._read_fds[segment] = os.open(self._segment_path(segment), os.O_RDONLY)
+        record = os.pread(fd, length, offset)
+        _, dict_id, size = RECORD.unpack_from(record)
+        if dict_id not in self.codec.dictionaries:
+            # Trained by a live writer after this archive was opened
+            self._load_dictionary(dict_id)
+        return self.codec.decompress(record[RECORD.size:RECORD.size + size], dict_id)
+
+    def get_bytes(self, key):
+        """Raw body archived under `key`, or None."""
+        entry = self.keys.get(encode_key(key))
+        return None if entry is None else self._read_blob(entry[0])
+
+    def get(self, key):
+        """Body archived under `key` as text, or None."""
+        body = self.get_bytes(key)
+        return None if body is None else body.decode("utf-8", "replace")
+
+    def fetched_at(self, key):
+        entry = self.keys.get(encode_key(key))
+        return None if entry is None else entry[1]
+
+    def job_ids(self):
+        """Job IDs with an archived page, in storage order."""
+        return sorted((key for key in self.keys if key < (1 << 63)), key=lambda key: self.blobs[self.keys[key][0]])
+
+    def iter_pages(self, keys=None):
+        """Yield (encoded key, raw body) of `keys` (default: all), reading the segments in order."""
+        keys = self.keys if keys is None else [encode_key(key) for key in keys]
+        for key in sorted(keys, key=lambda key: self.blobs[self.keys[key][0]]):
+            yield key, self._read_blob(self.keys[key][0])
+
+    def flush(self, fsync=True):
+        """Push the indexes (and with `fsync`, the segment and indexes) to disk."""
+        if self.readonly:
+            return
+        self._blobs_file.flush()
+        self._keys_file.flush()
+        if fsync:
+            if self._write_fd is not None:
+                os.fsync(self._write_fd)
+            os.fsync(self._blobs_file.fileno())
+            os.fsync(self._keys_file.fileno())
+
+    def _close_writer(self):
+        if self._write_fd is not None:
+            os.fsync(self._write_fd)
+            os.close(self._write_fd)
+            self._write_fd = None
+
+    def close(self):
+        if self.readonly:
+            self._close_readers()
+            return
+        # A short first session still trains on what it sampled, unless that's too little to learn from
+        if self._samples and len(self._samples) >= self.train_after // 4:
+            self._train()
+        self._samples = []
+        # Segment first: an index entry must never point past the data on disk
+        self._close_writer()
+        self.flush()
+        self._blobs_file.close()
+        self._keys_file.close()
+        self._close_readers()
+
+    def _close_readers(self):
+        for fd in self._read_fds.values():
+            os.close(fd)
+        self._read_fds = {}
+
+
+_archive = None
+
+
+def configure_page_archive(root, **kwargs):
+    """Also archive every fetched page in `root` (None = off)."""
+    global _archive
+
+    close_page_archive()
+    if root:
+        _archive = PageArchive(root, **kwargs)
+    return _archive
+
+
+def get_page_archive():
+    """Return the process-wide page archive, or None when pages aren't archived."""
+    return _archive
+
+
+def close_page_archive():
+    global _archive
+
+    if _archive is not None:
+        _archive.close()
+        _archive = None
+
+
+def _archive_source(source):
+    """(archive dir, key) of an <archive dir>:<key> page source, or None for a file path."""
+    root, sep, key = source.rpartition(":")
+    if sep and root and is_page_archive(root):
+        return root, key
+    return None
+
+
+def page_stem(source):
+    """
+    Base path for files derived from a page: a file path without its
+    extension, or for an archived page its job ID (a request key by its
+    index hash), in the current directory.
+    """
+    archived = _archive_source(source)
+    if archived is None:
+        return os.path.splitext(source)[0]
+    key = archived[1]
+    return key if key.isdigit() else f"{encode_key(key):016x}"
+
+
+def read_page(source):
+    """
+    Text of a page given as a file path or as <archive dir>:<job ID or request key>.
+    """
+    archived = _archive_source(source)
+    if archived is not None:
+        root, key = archived
+        archive = PageArchive(root, readonly=True)
+        try:
+            body = archive.get(int(key) if key.isdigit() else key)
+        finally:
+            archive.close()
+        if body is None:
+            raise KeyError(f"No page {key} in {root}")
+        return body
+
+    try:
+        with open(source, "r", encoding="utf-8") as f:
+            return f.read()
+    except UnicodeDecodeError:
+        # Fallback for files with different encoding
+        with open(source, "r", encoding="latin-1") as f:
+            return f.read()
@@ -0,0 +1,197 @@
+import csv
+import json
+import math
+import os
+from collections import defaultdict
+from pathlib import Path
+
+# The guest search API returns this many cards per page; a shorter page is the last one
+PAGE_SIZE = 10
+
+# Window the old fixed-batch pagination always requested, used as the savings baseline
+FIXED_BATCH_SIZE = 5
+
+
+def fixed_batch_requests(last_nonempty_page):
+    """
+    Requests the old pagination (5 pages per batch, stop once 70% of a batch
+    is empty) spends on a keyword whose last page with cards is
+    `last_nonempty_page` (1-based, 0 = no results at all).
+    """
+    batches = 0
+    while True:
+        first_page = batches * FIXED_BATCH_SIZE + 1
+        batches += 1
+        nonempty = max(0, min(last_nonempty_page, first_page + FIXED_BATCH_SIZE - 1) - first_page + 1)
+        if nonempty == 0 or FIXED_BATCH_SIZE - nonempty >= FIXED_BATCH_SIZE * 0.7:
+            return batches * FIXED_BATCH_SIZE
+
+
+class PaginationPlanner:
+    """
+    Decides how many result pages of a keyword to request at once.
+
+    The first window comes from the keyword's historical result count when
+    one is known, otherwise from `initial_window`. After every window the
+    fill of the returned pages decides the next one: a page with fewer than
+    PAGE_SIZE cards (or an empty page) ends the keyword, a window of full
+    pages grows the next window by one page (or sizes it to the remaining
+    expected pages). Growth is additive because the scheduler already keeps
+    many keywords in flight; a wide window only adds waste at the tail.
+
+    Args:
+        history: Optional {country: {keyword: result_count}} from earlier runs;
+                 updated in place with this run's counts
+        initial_window: Pages requested first when no history is known
+        min_window: Smallest window ever requested
+        max_window: Largest window ever requested
+    """
+
+    def __init__(self, history=None, initial_window=2, min_window=1, max_window=8):
+        self.history = history if history is not None else {}
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self._keywords = {}
+        self.totals = {"keywords": 0, "requests": 0, "baseline_requests": 0, "wasted_pages": 0}
+
+    def _clamp(self, window):
+        return max(self.min_window, min(self.max_window, window))
+
+    def _expected(self, keyword, location):
+        return self.history.get(location, {}).get(keyword)
+
+    def _pages_for(self, remaining_jobs):
+        # One extra page so the short/empty page that ends the keyword is included
+        return math.ceil(max(remaining_jobs, 0) / PAGE_SIZE) + 1
+
+    def first_window(self, keyword, location):
+        """Size of the first window of (keyword, location)."""
+        expected = self._expected(keyword, location)
+        window = self.initial_window if expected is None else self._pages_for(expected)
+        window = self._clamp(window)
+        self._keywords[(keyword, location)] = {"requests": window, "last_nonempty": None}
+        return window
+
+    def next_window(self, keyword, location, window_start, page_fills, window, fetched_jobs):
+        """
+        Size of the next window, or 0 once the end of the results was seen.
+
+        Args:
+            keyword, location: The keyword being paginated
+            window_start: Start index of the first page of the last window
+            page_fills: {start_index: cards} for every answered page of the
+                        last window, counting the <li> cards as served
+                        (failed pages are left out)
+            window: Size of the last window
+            fetched_jobs: Jobs collected so far for the keyword
+        """
+        state = self._keywords[(keyword, location)]
+        pages_before = state["requests"] - window
+
+        for start in sorted(page_fills):
+            if page_fills[start] < PAGE_SIZE:
+                # From the start index, so failed pages before it don't shift the numbering
+                position = (start - window_start) // PAGE_SIZE
+                last_page = pages_before + position + 1
+                state["last_nonempty"] = last_page if page_fills[start] else last_page - 1
+                self.totals["wasted_pages"] += window - position - 1
+                return 0
+
+        expected = self._expected(keyword, location)
+        if expected is not None and fetched_jobs < expected:
+            next_window = self._pages_for(expected - fetched_jobs)
+        elif expected is not None:
+            # Already past last run's count: probe gently
+            next_window = window // 2
+        else:
+            next_window = window + 1
+
+        next_window = self._clamp(next_window)
+        state["requests"] += next_window
+        return next_window
+
+    def cut(self, keyword, location, window, fetched_jobs):
+        """
+        Cancel the window just planned because the keyword is being stopped
+        early (e.g. its pages are all postings seen under other keywords).
+
+        Returns:
+            Estimated requests avoided: the cancelled window, or the pages
+            history still expected if that is more
+        """
+        state = self._keywords[(keyword, location)]
+        state["requests"] -= window
+        state["cut"] = True
+
+        expected = self._expected(keyword, location)
+        remaining = 0 if expected is None else self._pages_for(expected - fetched_jobs) - 1
+        return max(window, remaining)
+
+    def finish(self, keyword, location, total_jobs):
+        """Close the bookkeeping of a keyword and remember its result count."""
+        state = self._keywords.pop((keyword, location), None)
+        if state is None:
+            return
+
+        if state["last_nonempty"] is None:
+            # End never seen (job limit or failures): no fair baseline
+            baseline = state["requests"]
+        else:
+            baseline = fixed_batch_requests(state["last_nonempty"])
+
+        self.totals["keywords"] += 1
+        self.totals["requests"] += state["requests"]
+        self.totals["baseline_requests"] += baseline
+        if not state.get("cut"):
+            # A keyword stopped early doesn't know its real result count
+            self.history.setdefault(location, {})[keyword] = total_jobs
+
+    def report(self):
+        """Requests issued vs. the old fixed 5-page batching, for the whole run."""
+        return {
+            **self.totals,
+            "requests_saved": self.totals["baseline_requests"] - self.totals["requests"],
+        }
+
+
+def load_history(history_file, scraped_dir=None):
+    """
+    Load per-keyword result counts of earlier runs.
+
+    Falls back to counting rows per search_keyword in the existing CSV tree
+    (Data/Scraped/<Country>/<Category>/<Category>.csv) when no history file
+    exists yet.
+
+    Returns:
+        {country: {keyword: result_count}}
+    """
+    if os.path.exists(history_file):
+        try:
+            with open(history_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            print(f"Ignoring unreadable pagination history: {history_file}")
+
+    if scraped_dir is None or not os.path.isdir(scraped_dir):
+        return {}
+
+    counts = defaultdict(lambda: defaultdict(int))
+    for csv_file in Path(scraped_dir).rglob("*.csv"):
+        country = csv_file.parent.parent.name
+        with open(csv_file, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                keyword = row.get("search_keyword")
+                if keyword:
+                    counts[country][keyword] += 1
+
+    return {country: dict(keywords) for country, keywords in counts.items()}
+
+
+def save_history(history, history_file):
+    """Persist per-keyword result counts for the next run's planner."""
+    os.makedirs(os.path.dirname(history_file), exist_ok=True)
+    tmp_file = f"{history_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, history_file)
@@ -0,0 +1,80 @@
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from helpers.card_parser import configure_card_parser, get_card_parser
+
+
+class ParsePool:
+    """
+    Bounded process pool that takes page parsing off the event loop.
+
+    At most `max_pending` pages are queued for or being parsed at a time;
+    callers beyond that wait, which holds back the windows that issue new
+    requests instead of letting fetched pages pile up in memory.
+
+    Args:
+        workers: Number of parser processes (default: CPU count)
+        max_pending: Pages in the pool at once (default: 2 per worker)
+    """
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        # Workers parse with the same card parser backend as this process
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=configure_card_parser,
+            initargs=(get_card_parser(),),
+        )
+        self._slots = None
+        self.stats = {"pages": 0, "waits": 0}
+
+    async def run(self, func, *args):
+        """Run func(*args) in a worker process once a slot is free."""
+        if self._slots is None:
+            # Created lazily so it binds to the running event loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+        if self._slots.locked():
+            self.stats["waits"] += 1
+
+        async with self._slots:
+            self.stats["pages"] += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+_pool = None
+
+
+def configure_parse_pool(workers, max_pending=None):
+    """Parse pages in `workers` processes (0 = parse on the event loop)."""
+    global _pool
+
+    close_parse_pool()
+    if workers:
+        _pool = ParsePool(workers, max_pending)
+    return _pool
+
+
+def get_parse_pool():
+    """Return the process-wide parse pool, or None if pages are parsed inline."""
+    return _pool
+
+
+def close_parse_pool():
+    global _pool
+
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+async def parse_off_loop(func, *args):
+    """Run a parser on the parse pool if one is configured, inline otherwise."""
+    if _pool is None:
+        return func(*args)
+    return await _pool.run(func, *args)
@@ -0,0 +1,88 @@
+import os
+import json
+
+# The project root is taken from JOB_MARKET_ROOT, else from where this package lives
+ROOT_ENV = "JOB_MARKET_ROOT"
+# Optional JSON file overriding the named directories (default: <root>/paths.json)
+CONFIG_ENV = "JOB_MARKET_PATHS"
+CONFIG_FILE = "paths.json"
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Named directories, relative to the project root
+DEFAULT_DIRS = {
+    "data": "Data",
+    "scraped": "Data/Scraped",
+    "processed": "Data/Processed",
+    "cache": "Data/Cache",
+    "dataset": "Data/Dataset",
+    "archive": "Data/Archive",
+    "examples": "Data/HTML_example_parsing_issues",
+}
+
+
+class PathRegistry:
+    """
+    Absolute locations of the project's directories, resolved once.
+
+    Args:
+        root: Project root
+        dirs: {name: path}; relative paths are taken from `root`
+    """
+
+    def __init__(self, root, dirs=None):
+        self.root = os.path.abspath(root)
+        self.dirs = {"root": self.root}
+        for name, path in {**DEFAULT_DIRS, **(dirs or {})}.items():
+            self.dirs[name] = os.path.normpath(os.path.join(self.root, path))
+
+    def path(self, name, *parts):
+        """Absolute path of `parts` inside the directory called `name`."""
+        try:
+            base = self.dirs[name]
+        except KeyError:
+            raise KeyError(f"Unknown project directory: {name} (known: {', '.join(self.dirs)})") from None
+        return os.path.join(base, *parts)
+
+    @classmethod
+    def from_environment(cls):
+        """Build the registry from JOB_MARKET_ROOT / JOB_MARKET_PATHS, falling back to the package location."""
+        root = os.environ.get(ROOT_ENV) or PACKAGE_ROOT
+        config_file = os.environ.get(CONFIG_ENV) or os.path.join(root, CONFIG_FILE)
+
+        dirs = {}
+        if os.path.isfile(config_file):
+            with open(config_file, "r", encoding="utf-8") as f:
+                dirs = json.load(f)
+            # A root in the config file is relative to the file itself
+            root = os.path.join(os.path.dirname(os.path.abspath(config_file)), dirs.pop("root", root))
+        return cls(root, dirs)
+
+
+_registry = None
+
+
+def configure_paths(root=None, dirs=None):
+    """Replace the process-wide registry (default: rebuild it from the environment)."""
+    global _registry
+
+    _registry = PathRegistry(root, dirs) if root is not None else PathRegistry.from_environment()
+    return _registry
+
+
+def get_paths():
+    """Return the process-wide registry, building it on first use."""
+    if _registry is None:
+        configure_paths()
+    return _registry
+
+
+def project_path(name, *parts):
+    """
+    Absolute path inside one of the project's named directories.
+
+    Example:
+        project_path("processed", "job_details.jsonl")
+        project_path("scraped", "Egypt", "Cybersecurity", "Cybersecurity.csv")
+    """
+    return get_paths().path(name, *parts)
@@ -0,0 +1,173 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+# Statuses LinkedIn uses to throttle or block guest traffic
+THROTTLE_STATUSES = {429, 999}
+
+
+class _RateState:
+    """Pacing state of one host or one country."""
+
+    def __init__(self, rate):
+        self.rate = rate                # allowed requests per second
+        self.next_slot = 0.0            # monotonic time of the next free slot
+        self.blocked_until = 0.0        # set from Retry-After
+        self.successes = 0
+        self.throttles = 0
+
+
+class AIMDRateController:
+    """
+    Additive-increase / multiplicative-decrease request pacing.
+
+    Every request reserves a slot with both its host state and its country
+    state, so a request goes out only when both allow it. Fast 200 responses
+    raise the allowed rate by `additive_increase`, throttles (429/999) cut it
+    by `decrease_factor`, and empty bodies cut it by the gentler
+    `empty_decrease_factor` (an empty page is also how the guest API ends a
+    result set, so it is weaker evidence of throttling). A Retry-After header
+    pauses the host until the given time.
+
+    Args:
+        initial_rate: Starting requests/second for every host and country
+        min_rate: Floor the rate never drops below
+        max_rate: Ceiling the rate never grows above
+        additive_increase: Requests/second added per fast successful response
+        decrease_factor: Multiplier applied on 429/999
+        empty_decrease_factor: Multiplier applied on an empty 200 body
+        slow_latency: Responses slower than this (seconds) don't raise the rate
+        jitter: Relative random spread added to each slot (0.2 = ±20%)
+    """
+
+    def __init__(self, initial_rate=1.0, min_rate=0.1, max_rate=10.0,
+                 additive_increase=0.05, decrease_factor=0.5,
+                 empty_decrease_factor=0.9, slow_latency=2.0, jitter=0.2):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.empty_decrease_factor = empty_decrease_factor
+        self.slow_latency = slow_latency
+        self.jitter = jitter
+        self._hosts = {}
+        self._countries = {}
+
+    def _state(self, table, key):
+        if key not in table:
+            table[key] = _RateState(self.initial_rate)
+        return table[key]
+
+    def _reserve(self, state, now):
+        start = max(now, state.next_slot, state.blocked_until)
+        spacing = 1.0 / state.rate
+        spacing *= 1 + random.uniform(-self.jitter, self.jitter)
+        state.next_slot = start + spacing
+        return start
+
+    def reserve(self, host, country=None):
+        """
+        Reserve the next request slot for (host, country).
+
+        Returns:
+            Seconds the caller has to wait before sending the request
+        """
+        now = time.monotonic()
+        start = self._reserve(self._state(self._hosts, host), now)
+        if country is not None:
+            start = max(start, self._reserve(self._state(self._countries, country), now))
+        return max(0.0, start - now)
+
+    async def acquire(self, host, country=None):
+        """Wait (asynchronously) until a request to (host, country) is allowed."""
+        delay = self.reserve(host, country)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self, host, country=None):
+        """Blocking variant of acquire() for the requests-based scraper."""
+        delay = self.reserve(host, country)
+        if delay:
+            time.sleep(delay)
+
+    def record(self, host, country=None, status=200, latency=0.0,
+               empty=False, retry_after=None):
+        """
+        Feed one response back into the controller.
+
+        Args:
+            host: Host the request went to
+            country: Country (search location) of the request, if any
+            status: HTTP status code (None for a network error)
+            latency: Response time in seconds
+            empty: True if a 200 response had an empty body
+            retry_after: Raw Retry-After header value, if present
+        """
+        states = [self._state(self._hosts, host)]
+        if country is not None:
+            states.append(self._state(self._countries, country))
+
+        if status in THROTTLE_STATUSES:
+            factor = self.decrease_factor
+        elif status == 200 and empty:
+            factor = self.empty_decrease_factor
+        elif status == 200 and latency < self.slow_latency:
+            factor = None
+        else:
+            # Slow or unexpected responses: hold the current rate
+            return
+
+        for state in states:
+            if factor is None:
+                state.rate = min(self.max_rate, state.rate + self.additive_increase)
+                state.successes += 1
+            else:
+                state.rate = max(self.min_rate, state.rate * factor)
+                state.throttles += 1
+
+        pause = parse_retry_after(retry_after)
+        if pause:
+            host_state = states[0]
+            host_state.blocked_until = max(host_state.blocked_until, time.monotonic() + pause)
+
+    def snapshot(self):
+        """Current rate and counters for every tracked host and country."""
+        def dump(table):
+            return {
+                key: {
+                    "rate": round(state.rate, 3),
+                    "successes": state.successes,
+                    "throttles": state.throttles,
+                }
+                for key, state in table.items()
+            }
+        return {"hosts": dump(self._hosts), "countries": dump(self._countries)}
+
+
+def parse_retry_after(value):
+    """Convert a Retry-After header (seconds or HTTP date) to seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+_controller = None
+
+
+def get_rate_controller():
+    """Return the process-wide rate controller, creating it on first use."""
+    global _controller
+
+    if _controller is None:
+        _controller = AIMDRateController()
+    return _controller
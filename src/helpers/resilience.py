@@ -0,0 +1,116 @@
+import asyncio
+import random
+import time
+from collections import deque
+
+import aiohttp
+
+# Outcome classes for one guest API request
+OK = "ok"
+END_OF_RESULTS = "end_of_results"   # 200 with an empty body: the result set is exhausted
+TIMEOUT = "timeout"
+THROTTLE = "throttle"               # 429
+BLOCK = "block"                     # 999 / 403: LinkedIn's bot wall
+SERVER_ERROR = "server_error"       # 5xx
+NETWORK_ERROR = "network_error"     # connection reset, DNS failure, ...
+CLIENT_ERROR = "client_error"       # other 4xx: retrying won't help
+
+RETRYABLE = {TIMEOUT, THROTTLE, BLOCK, SERVER_ERROR, NETWORK_ERROR}
+
+
+def classify(status=None, text=None, exc=None):
+    """
+    Classify a response (or the exception raised instead of one).
+
+    Args:
+        status: HTTP status code, if a response arrived
+        text: Response body, if it was read
+        exc: Exception raised by the request, if any
+
+    Returns:
+        One of the outcome constants of this module
+    """
+    if exc is not None:
+        if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+            return TIMEOUT
+        if isinstance(exc, aiohttp.ClientResponseError) and exc.status:
+            return classify(status=exc.status)
+        return NETWORK_ERROR
+
+    if status == 200:
+        return OK if text and text.strip() else END_OF_RESULTS
+    if status == 429:
+        return THROTTLE
+    if status in (403, 999):
+        return BLOCK
+    if status is not None and status >= 500:
+        return SERVER_ERROR
+    return CLIENT_ERROR
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Pauses the whole crawl when LinkedIn starts blocking.
+
+    Keeps the outcomes of the last `window` requests. Once at least
+    `min_requests` are known and the share of blocks/throttles reaches
+    `threshold`, the breaker opens and every caller of wait_if_open() sleeps
+    until `cooldown` seconds have passed. The window is then cleared
+    (half-open) so the next requests decide again.
+
+    Args:
+        window: Number of recent outcomes considered
+        threshold: Block/throttle share that opens the breaker
+        min_requests: Outcomes required before the breaker may open
+        cooldown: Seconds the crawl is paused once open
+    """
+
+    def __init__(self, window=50, threshold=0.3, min_requests=20, cooldown=300.0):
+        self.window = window
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self._outcomes = deque(maxlen=window)
+        self._open_until = 0.0
+        self.trips = 0
+
+    @property
+    def is_open(self):
+        return time.monotonic() < self._open_until
+
+    def record(self, outcome):
+        """Register one request outcome and open the breaker if needed."""
+        self._outcomes.append(outcome in (BLOCK, THROTTLE))
+
+        if self.is_open or len(self._outcomes) < self.min_requests:
+            return
+
+        block_rate = sum(self._outcomes) / len(self._outcomes)
+        if block_rate >= self.threshold:
+            self._open_until = time.monotonic() + self.cooldown
+            self._outcomes.clear()
+            self.trips += 1
+            print(f"Circuit breaker open: block rate {block_rate:.0%}, "
+                  f"pausing crawl for {self.cooldown:.0f}s")
+
+    async def wait_if_open(self):
+        """Sleep until the breaker closes (returns at once when it is closed)."""
+        while self.is_open:
+            await asyncio.sleep(self._open_until - time.monotonic())
+
+
+_breaker = None
+
+
+def get_circuit_breaker():
+    """Return the process-wide circuit breaker, creating it on first use."""
+    global _breaker
+
+    if _breaker is None:
+        _breaker = CircuitBreaker()
+    return _breaker
@@ -1,4 +1,16 @@
 import os
+import sys
+
+def _caller_dir(depth):
+    """
+    Directory of the script `depth` frames up the stack.
+
+    Only the frame's code object is read; inspect.stack() would build frame
+    info (and read source lines) for the whole stack on every call. Paths
+    that are used over and over belong in helpers/paths.py instead.
+    """
+    return os.path.dirname(os.path.abspath(sys._getframe(depth).f_code.co_filename))
+
 
 def resolve_file_path(file_path, base_dir=None):
     """
@@ -35,24 +47,14 @@ def resolve_file_path(file_path, base_dir=None):
         return os.path.abspath(os.path.join(base_dir, file_path))
 
     # Otherwise, use the directory of the calling script (like in your original code)
-    # Get the directory of the script that called this function
-    import inspect
-    caller_frame = inspect.stack()[1]
-    caller_file = caller_frame.filename
-    caller_dir = os.path.dirname(os.path.abspath(caller_file))
-
-    return os.path.abspath(os.path.join(caller_dir, file_path))
+    return os.path.abspath(os.path.join(_caller_dir(2), file_path))
 
 
 # More specialized versions for common use cases:
 
 def resolve_from_script(file_path):
     """Resolve path relative to the calling script's directory."""
-    import inspect
-    caller_frame = inspect.stack()[1]
-    caller_file = caller_frame.filename
-    caller_dir = os.path.dirname(os.path.abspath(caller_file))
-    return os.path.abspath(os.path.join(caller_dir, file_path))
+    return os.path.abspath(os.path.join(_caller_dir(2), file_path))
 
 
 def resolve_from_module(file_path, module_file):
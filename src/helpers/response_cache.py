@@ -0,0 +1,90 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+
+# Default freshness of cached responses for live crawls (replay ignores it)
+DEFAULT_TTL = 7 * 24 * 3600
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of guest API responses.
+
+    Every entry lives at <cache_dir>/<h[:2]>/<h>.json.gz where h is the
+    SHA-256 of the request key (endpoint, keywords, location, start). The
+    gzip'd JSON holds the key, the fetch timestamp and the raw body.
+
+    Args:
+        cache_dir: Directory holding the cache
+        ttl: Seconds an entry stays fresh for live crawls
+        replay: If True, entries never expire and a miss is answered as
+                "no such page" instead of going to the network
+    """
+
+    def __init__(self, cache_dir, ttl=DEFAULT_TTL, replay=False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.replay = replay
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "writes": 0}
+
+    @staticmethod
+    def make_key(endpoint, params):
+        return {
+            "endpoint": endpoint,
+            "keywords": params["keywords"],
+            "location": params["location"],
+            "start": int(params["start"]),
+        }
+
+    def _path(self, key):
+        digest = hashlib.sha256(
+            json.dumps(key, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json.gz")
+
+    def get(self, endpoint, params):
+        """Return the cached body for a request, or None on a miss/stale entry."""
+        path = self._path(self.make_key(endpoint, params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, OSError, json.JSONDecodeError):
+            self.stats["misses"] += 1
+            return None
+
+        if not self.replay and time.time() - entry["fetched_at"] > self.ttl:
+            self.stats["stale"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return entry["body"]
+
+    def put(self, endpoint, params, body):
+        """Store a body atomically (write to a temp file, then rename)."""
+        key = self.make_key(endpoint, params)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump({"key": key, "fetched_at": time.time(), "body": body}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.stats["writes"] += 1
+
+
+_cache = None
+
+
+def configure_response_cache(cache_dir, ttl=DEFAULT_TTL, replay=False):
+    """Enable the process-wide response cache (call once at startup)."""
+    global _cache
+
+    _cache = ResponseCache(cache_dir, ttl=ttl, replay=replay)
+    return _cache
+
+
+def get_response_cache():
+    """Return the process-wide response cache, or None if caching is disabled."""
+    return _cache
@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: without it pandas falls back to Python's re per row
+    pa = None
+
+# Currency as written -> ISO code; a bare "$" is resolved per country below
+CURRENCIES = {
+    "$": "$",
+    "us$": "USD", "usd": "USD",
+    "ca$": "CAD", "c$": "CAD", "cad": "CAD",
+    "a$": "AUD", "aud": "AUD",
+    "r$": "BRL", "brl": "BRL",
+    "€": "EUR", "eur": "EUR",
+    "£": "GBP", "gbp": "GBP",
+    "e£": "EGP", "egp": "EGP",
+    "zł": "PLN", "zl": "PLN", "pln": "PLN",
+    "mad": "MAD", "dh": "MAD",
+    "mga": "MGA",
+}
+
+# Country (ISO code or name, as in job records and the scrape plan) -> currency of a bare "$"
+DOLLAR_BY_COUNTRY = {"CA": "CAD", "Canada": "CAD", "AU": "AUD", "Australia": "AUD"}
+
+# Period as written -> schema.org unitText, and how many of each make a year
+PERIODS = {
+    "yr": "YEAR", "year": "YEAR", "annum": "YEAR", "annual": "YEAR", "annually": "YEAR",
+    "mo": "MONTH", "month": "MONTH", "monthly": "MONTH",
+    "wk": "WEEK", "week": "WEEK", "weekly": "WEEK",
+    "day": "DAY", "daily": "DAY",
+    "hr": "HOUR", "hour": "HOUR", "hourly": "HOUR",
+}
+PERIODS_PER_YEAR = {"YEAR": 1, "MONTH": 12, "WEEK": 52, "DAY": 260, "HOUR": 2080}
+
+# The patterns are RE2-compatible (no lookaround), so with pyarrow installed
+# they run inside Arrow's regex kernel over the whole column at once
+_CURRENCY = r"(?:US\$|CA\$|C\$|A\$|R\$|E£|\$|€|£|zł|\b(?:USD|CAD|AUD|EUR|GBP|BRL|EGP|PLN|MAD|MGA|DH|zl)\b)"
+_PERIOD = r"(?:yr|year|annum|annually|annual|monthly|month|mo|weekly|week|wk|daily|day|hourly|hour|hr)\b"
+_PER = r"\s?(?:/\s?|per\s|an?\s|,\s)?"
+_RANGE = r"\s?(?:-|–|—|to|and)\s?"
+
+
+def _amount(n):
+    return rf"(?P<int{n}>\d{{1,3}}(?:[,.\s]\d{{3}})+|\d+)(?:[.,](?P<dec{n}>\d{{1,2}}))?\s?(?P<k{n}>k\b)?"
+
+
+# "$126,000.00/yr - $180,000.00/yr", "EGP 20,000 to 30,000 per month", "$45/hr"
+PREFIXED = (
+    rf"(?i)(?P<cur1>{_CURRENCY})\s?{_amount(1)}(?:{_PER}(?P<per1>{_PERIOD}))?"
+    rf"(?:{_RANGE}(?:{_CURRENCY})?\s?{_amount(2)})?(?:{_PER}(?P<per2>{_PERIOD}))?"
+)
+
+# "10 000 - 15 000 zł", "60.000 € - 75.000 € per year"
+SUFFIXED = (
+    rf"(?i){_amount(1)}\s?(?:{_CURRENCY})?{_RANGE}{_amount(2)}\s?(?P<cur1>{_CURRENCY})"
+    rf"(?:{_PER}(?P<per2>{_PERIOD}))?"
+)
+
+COLUMNS = ["salary_min", "salary_max", "salary_currency", "salary_period",
+           "salary_min_annual", "salary_max_annual", "salary_source"]
+
+
+def _as_strings(texts):
+    texts = pd.Series(texts, copy=False)
+    if pa is not None:
+        return texts.astype(pd.ArrowDtype(pa.string()))
+    return texts.astype(object).where(texts.notna(), None)
+
+
+def _extract(strings, pattern):
+    # Arrow's regex kernel returns "" for groups that took no part in the match
+    parts = strings.str.extract(pattern).astype(object)
+    return parts.mask(parts == "")
+
+
+def _to_number(parts, n):
+    integer = parts[f"int{n}"].str.replace(r"[,.\s]", "", regex=True)
+    value = pd.to_numeric(integer + "." + parts[f"dec{n}"].fillna("0"), errors="coerce").astype(float)
+    return value.where(parts[f"k{n}"].isna(), value * 1000)
+
+
+def _from_parts(parts, countries=None):
+    low = _to_number(parts, 1)
+    high = _to_number(parts, 2).fillna(low)
+
+    currency = parts["cur1"].str.lower().map(CURRENCIES).astype(object)
+    dollar = pd.Series("USD", index=parts.index, dtype=object)
+    if countries is not None:
+        dollar = pd.Series(countries, index=parts.index).map(DOLLAR_BY_COUNTRY).fillna("USD")
+    currency = currency.where(currency != "$", dollar)
+
+    period_text = parts["per2"].fillna(parts["per1"]) if "per1" in parts else parts["per2"]
+    period = period_text.str.lower().map(PERIODS).astype(object)
+
+    return pd.DataFrame({
+        "salary_min": np.fmin(low, high),
+        "salary_max": np.fmax(low, high),
+        "salary_currency": currency,
+        "salary_period": period,
+    })
+
+
+def parse_salaries(texts, countries=None, strict=False):
+    """
+    Parse salary amounts out of a whole column of text at once.
+
+    Args:
+        texts: Sequence/Series of strings (salary divs or descriptions)
+        countries: Optional country per row, used to tell USD from CAD "$"
+        strict: Only accept ranges or amounts with a period; use this for
+                free text such as descriptions, where a lone "$5" is noise
+
+    Returns:
+        DataFrame (same index) with salary_min, salary_max (floats),
+        salary_currency (ISO code) and salary_period (YEAR/MONTH/WEEK/DAY/HOUR);
+        rows without a salary are NaN/None
+    """
+    strings = _as_strings(texts)
+    parsed = _from_parts(_extract(strings, PREFIXED), countries)
+
+    # Amounts written before their currency, only where the first pattern found nothing
+    missing = parsed["salary_min"].isna()
+    if missing.any():
+        suffixed = _extract(strings[missing], SUFFIXED)
+        subset = countries[missing.to_numpy()] if countries is not None else None
+        parsed.loc[missing] = _from_parts(suffixed, subset).to_numpy()
+
+    if strict:
+        lone = (parsed["salary_min"] == parsed["salary_max"]) & parsed["salary_period"].isna()
+        parsed.loc[lone] = None
+
+    parsed["salary_min"] = parsed["salary_min"].astype(float)
+    parsed["salary_max"] = parsed["salary_max"].astype(float)
+    return parsed
+
+
+def annualize(frame):
+    """Add salary_min_annual / salary_max_annual (NaN when the period is unknown)."""
+    per_year = frame["salary_period"].map(PERIODS_PER_YEAR).astype(float)
+    frame["salary_min_annual"] = frame["salary_min"] * per_year
+    frame["salary_max_annual"] = frame["salary_max"] * per_year
+    return frame
+
+
+def normalize_salaries(records):
+    """
+    Normalize the salary of every job record (DataFrame of job_details.jsonl).
+
+    Sources by priority: the LD+JSON baseSalary, the compensation__salary
+    text, then ranges found in the description.
+
+    Returns:
+        DataFrame (same index as `records`) with the columns in COLUMNS
+    """
+    countries = records["country"] if "country" in records else None
+    result = pd.DataFrame(index=records.index, columns=COLUMNS[:4], dtype=object)
+    source = pd.Series(None, index=records.index, dtype=object)
+
+    if "salary_min" in records:
+        structured = records["salary_min"].notna()
+        result.loc[structured, "salary_min"] = records.loc[structured, "salary_min"]
+        result.loc[structured, "salary_max"] = records.loc[structured, "salary_max"].fillna(
+            records.loc[structured, "salary_min"])
+        result.loc[structured, "salary_currency"] = records.loc[structured, "salary_currency"]
+        result.loc[structured, "salary_period"] = records.loc[structured, "salary_unit"].str.upper()
+        source[structured] = "ld_json"
+
+    for column, strict in (("salary_text", False), ("description", True)):
+        todo = source.isna() & records[column].notna() if column in records else None
+        if todo is None or not todo.any():
+            continue
+        parsed = parse_salaries(
+            records.loc[todo, column],
+            countries=countries[todo] if countries is not None else None,
+            strict=strict,
+        )
+        found = parsed["salary_min"].notna()
+        result.loc[found[found].index, COLUMNS[:4]] = parsed.loc[found, COLUMNS[:4]].to_numpy()
+        source[found[found].index] = column
+
+    result["salary_min"] = pd.to_numeric(result["salary_min"], errors="coerce")
+    result["salary_max"] = pd.to_numeric(result["salary_max"], errors="coerce")
+    result = annualize(result)
+    result["salary_source"] = source
+    return result[COLUMNS]
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from helpers.LinkedinAPI2 import BASE_URL, paginate_keyword
+from helpers.http_client import get_async_session, close_async_session, client_stats
+from helpers.pagination import PaginationPlanner
+from helpers.resilience import get_circuit_breaker
+from helpers.response_cache import get_response_cache
+
+
+class _HostSlot:
+    """Holds one per-host slot and one global slot for the duration of a request."""
+
+    def __init__(self, global_semaphore, host_semaphore):
+        self._global = global_semaphore
+        self._host = host_semaphore
+
+    async def __aenter__(self):
+        # Take the host slot first so a busy host can't pin global slots
+        await self._host.acquire()
+        try:
+            await self._global.acquire()
+        except BaseException:
+            self._host.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._global.release()
+        self._host.release()
+        return False
+
+
+class RequestBudget:
+    """
+    Global + per-host concurrency budget shared by every request of a run.
+
+    Args:
+        max_concurrent: Maximum requests in flight across the whole run
+        per_host: Maximum requests in flight against a single host
+    """
+
+    def __init__(self, max_concurrent=8, per_host=6):
+        self.max_concurrent = max_concurrent
+        self.per_host = per_host
+        self._global = asyncio.Semaphore(max_concurrent)
+        self._hosts = {}
+
+    def for_url(self, url):
+        """Return an async context manager guarding a request to `url`'s host."""
+        host = urlsplit(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return _HostSlot(self._global, self._hosts[host])
+
+
+class CrawlScheduler:
+    """
+    Runs the whole country × category × keyword matrix on one event loop.
+
+    Every keyword of the plan becomes a task that paginates its result pages
+    (the start_index units) through a single shared session. All requests
+    draw from one RequestBudget, so the crawl is bounded by the configured
+    concurrency instead of by serial keyword iteration.
+
+    Args:
+        max_concurrent: Global request budget (default: 8)
+        per_host: Per-host request budget (default: 6)
+        max_keywords: Keywords paginated at the same time. Keywords spend
+                      most of their time waiting on the rate controller, so
+                      this should be well above max_concurrent.
+        history: Optional {country: {keyword: result_count}} of earlier runs,
+                 used to size each keyword's pagination windows
+        journal: Optional CrawlJournal; finished keywords and persisted
+                 pages are skipped and every page write goes through it
+                 (plan entries then need an absolute "csv_path")
+        seen: Optional SeenJobs; postings surfaced by an earlier keyword are
+              not written again and keywords that only repeat stop early
+    """
+
+    def __init__(self, max_concurrent=8, per_host=6, max_keywords=16, history=None,
+                 journal=None, seen=None):
+        self.budget_args = (max_concurrent, per_host)
+        self.max_keywords = max_keywords
+        self.planner = PaginationPlanner(history=history)
+        self.journal = journal
+        self.seen = seen
+        self.stats = {"keywords": 0, "skipped_keywords": 0, "jobs": 0, "failed_keywords": 0}
+        self.failed_pages = []
+
+    async def run(self, plan, on_results):
+        """
+        Crawl every entry of `plan`, streaming results as batches complete.
+
+        Args:
+            plan: Iterable of dicts with "country", "category" and "keyword"
+                  keys (any extra keys are passed through untouched)
+            on_results: Callback called as on_results(entry, jobs) for every
+                        completed batch. It runs on the event loop, so writes
+                        made from it never interleave.
+
+        Returns:
+            Dict of run statistics. Pages that failed permanently are kept
+            in self.failed_pages.
+        """
+        budget = RequestBudget(*self.budget_args)
+        semaphore = budget.for_url(BASE_URL)
+        queue = asyncio.Queue()
+        for entry in plan:
+            queue.put_nowait(entry)
+
+        started = time.perf_counter()
+
+        session = await get_async_session()
+
+        async def worker():
+            while True:
+                try:
+                    entry = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                journal = self.journal
+                if journal is not None and journal.is_done(entry):
+                    self.stats["skipped_keywords"] += 1
+                    continue
+
+                failures_before = len(self.failed_pages)
+
+                def on_batch(jobs, start_index, cards, entry=entry):
+                    self.stats["jobs"] += len(jobs)
+
+                    def write():
+                        if jobs:
+                            on_results(entry, jobs)
+
+                    if journal is None:
+                        write()
+                    else:
+                        # Pages whose jobs were all repeats are journaled too
+                        journal.persist(entry, start_index, cards, entry["csv_path"], write)
+
+                def on_failure(page, entry=entry):
+                    self.failed_pages.append({"category": entry["category"], **page})
+
+                try:
+                    await paginate_keyword(
+                        session, entry["keyword"], entry["country"], semaphore,
+                        on_batch=on_batch, on_failure=on_failure,
+                        planner=self.planner,
+                        completed_pages=journal.completed_pages(entry) if journal else None,
+                        seen=self.seen,
+                    )
+                    self.stats["keywords"] += 1
+                    # Keywords with failed pages stay open so a resumed run retries them
+                    if journal is not None and len(self.failed_pages) == failures_before:
+                        journal.keyword_done(entry)
+                except Exception as e:
+                    self.stats["failed_keywords"] += 1
+                    print(f"Error crawling {entry['keyword']} in {entry['country']}: {e}")
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_keywords)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            await close_async_session()
+
+        self.stats["elapsed_s"] = round(time.perf_counter() - started, 2)
+        self.stats["failed_pages"] = len(self.failed_pages)
+        self.stats["pagination"] = self.planner.report()
+        if self.seen is not None:
+            self.stats["seen"] = self.seen.report(self.stats["pagination"]["requests"])
+        self.stats["breaker_trips"] = get_circuit_breaker().trips
+        self.stats["http"] = client_stats()["async"]
+        if get_response_cache() is not None:
+            self.stats["cache"] = dict(get_response_cache().stats)
+        return self.stats
+
+
+def run_crawl(plan, on_results, **scheduler_kwargs):
+    """
+    Synchronous entry point: crawl `plan` on a single long-lived event loop.
+
+    Returns:
+        (stats, failed_pages) as produced by CrawlScheduler.run
+    """
+    scheduler = CrawlScheduler(**scheduler_kwargs)
+    stats = asyncio.run(scheduler.run(plan, on_results))
+    return stats, scheduler.failed_pages
@@ -0,0 +1,134 @@
+import csv
+import math
+import hashlib
+
+from helpers.normalize import extract_job_id
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over integer job IDs.
+
+    Args:
+        capacity: Number of IDs the filter is sized for
+        error_rate: Target false-positive rate at `capacity` IDs
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, job_id):
+        digest = hashlib.blake2b(job_id.to_bytes(8, "little"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, job_id):
+        """Add an ID; returns True if it was (probably) already present."""
+        present = True
+        for pos in self._positions(job_id):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+    def __contains__(self, job_id):
+        return all(self.bits[pos // 8] & (1 << (pos % 8)) for pos in self._positions(job_id))
+
+
+class _ExactSet(set):
+    def add(self, job_id):
+        present = job_id in self
+        super().add(job_id)
+        return present
+
+
+class SeenJobs:
+    """
+    Run-wide index of LinkedIn job IDs already collected.
+
+    Pages are filtered against it so a posting surfaced by several keywords
+    is written once, and a keyword whose pages keep coming back (nearly) all
+    seen stops paginating early.
+
+    Args:
+        use_bloom: Use a Bloom filter (bounded memory, rare false positives)
+                   instead of an exact set
+        capacity: Bloom filter capacity
+        error_rate: Bloom filter false-positive rate
+        stale_ratio: A page is "stale" once this share of its jobs was seen
+        stale_pages: Consecutive stale pages that end a keyword
+    """
+
+    def __init__(self, use_bloom=False, capacity=1_000_000, error_rate=0.001,
+                 stale_ratio=0.9, stale_pages=2):
+        self.ids = BloomFilter(capacity, error_rate) if use_bloom else _ExactSet()
+        self.stale_ratio = stale_ratio
+        self.stale_pages = stale_pages
+        self.stats = {"rows_seen": 0, "rows_avoided": 0, "keywords_cut": 0, "requests_avoided": 0}
+
+    def filter_new(self, jobs):
+        """Return the jobs whose ID wasn't seen before, and mark them all seen."""
+        new_jobs = []
+        for job in jobs:
+            job_id = job["job_id"] if "job_id" in job else extract_job_id(job.get("link"))
+            if job_id is None or not self.ids.add(job_id):
+                new_jobs.append(job)
+
+        self.stats["rows_seen"] += len(jobs)
+        self.stats["rows_avoided"] += len(jobs) - len(new_jobs)
+        return new_jobs
+
+    def is_stale(self, cards, new_cards):
+        """True if a page with `cards` jobs of which `new_cards` were new is mostly repeats."""
+        return cards > 0 and (cards - new_cards) >= cards * self.stale_ratio
+
+    def keyword_cut(self, requests_avoided):
+        """Record a keyword stopped early and the requests that saved (estimate)."""
+        self.stats["keywords_cut"] += 1
+        self.stats["requests_avoided"] += requests_avoided
+
+    def seed_from_csvs(self, csv_offsets):
+        """
+        Mark the job IDs of rows already written as seen.
+
+        Args:
+            csv_offsets: {csv_path: byte_offset}; only rows from the offset
+                         onwards are read (0 = the whole file)
+
+        Returns:
+            Number of IDs read
+        """
+        seeded = 0
+        for path, offset in csv_offsets.items():
+            try:
+                with open(path, "rb") as f:
+                    header = next(csv.reader([f.readline().decode("utf-8")]), [])
+                    if "link" not in header:
+                        continue
+                    link_col = header.index("link")
+                    f.seek(max(offset, f.tell()))
+                    lines = (line.decode("utf-8") for line in f)
+                    for row in csv.reader(lines):
+                        if len(row) > link_col:
+                            job_id = extract_job_id(row[link_col])
+                            if job_id is not None:
+                                self.ids.add(job_id)
+                                seeded += 1
+            except FileNotFoundError:
+                continue
+        return seeded
+
+    def report(self, requests_issued):
+        """Share of rows and (estimated) requests avoided by the index."""
+        rows_seen = self.stats["rows_seen"]
+        avoided = self.stats["requests_avoided"]
+        would_have_issued = requests_issued + avoided
+        return {
+            **self.stats,
+            "rows_avoided_fraction": round(self.stats["rows_avoided"] / rows_seen, 3) if rows_seen else 0.0,
+            "requests_avoided_fraction": round(avoided / would_have_issued, 3) if would_have_issued else 0.0,
+        }
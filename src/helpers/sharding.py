@@ -0,0 +1,173 @@
+import io
+import os
+import csv
+import json
+import shutil
+from itertools import islice
+from collections import defaultdict
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from helpers.resolve_path import resolve_from_module
+from helpers.csv_writer import sanitize_rows
+
+
+def shard_plan(plan, n_shards):
+    """
+    Partition a crawl plan into `n_shards` by (country, category).
+
+    Every (country, category) group goes to exactly one shard, so each output
+    CSV is written by a single process. Groups are assigned largest first to
+    the least loaded shard, which is deterministic for a given plan.
+
+    Returns:
+        List of `n_shards` lists of plan entries (some may be empty)
+    """
+    groups = defaultdict(list)
+    for entry in plan:
+        groups[(entry["country"], entry["category"])].append(entry)
+
+    shards = [[] for _ in range(n_shards)]
+    for key in sorted(groups, key=lambda k: (-len(groups[k]), k)):
+        lightest = min(range(n_shards), key=lambda i: (len(shards[i]), i))
+        shards[lightest].extend(groups[key])
+    return shards
+
+
+def shard_dir(shard_root, shard_id):
+    return os.path.join(shard_root, f"shard-{shard_id:03d}")
+
+
+def run_shards(shards, shard_root, worker, *worker_args):
+    """
+    Run `worker(shard_id, entries, shard_dir, *worker_args)` for every
+    non-empty shard, each in its own process (with its own event loop, rate
+    controller and budgets).
+
+    Returns:
+        List of (shard_id, worker result), ordered by shard_id
+    """
+    jobs = [(i, entries) for i, entries in enumerate(shards) if entries]
+    os.makedirs(shard_root, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=len(jobs) or 1) as pool:
+        futures = [
+            (i, pool.submit(worker, i, entries, shard_dir(shard_root, i), *worker_args))
+            for i, entries in jobs
+        ]
+        return [(i, future.result()) for i, future in futures]
+
+
+def _save_state(state_file, state):
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, state_file)
+
+
+def _copy_rows(source, target_file, target_header, chunk_rows=10_000):
+    """
+    Append the rows of one shard CSV (without its header) to an open target.
+
+    Rows are copied byte for byte when the headers match. A target with other
+    columns (e.g. one from before the job_id column) keeps its header and
+    gets the shard rows mapped onto it, like CsvWriter does for such files.
+    """
+    with open(source, "rb") as src:
+        header = src.readline()
+        if header.strip() == target_header.strip():
+            shutil.copyfileobj(src, target_file, length=1024 * 1024)
+            return
+
+    fieldnames = next(csv.reader([target_header.decode("utf-8")]))
+    print(f"{target_file.name} has columns {fieldnames}; merging the rows of {source} with those")
+    with open(source, "r", newline="", encoding="utf-8") as src:
+        reader = csv.DictReader(src)
+        while True:
+            rows = list(islice(reader, chunk_rows))
+            if not rows:
+                break
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(sanitize_rows(rows, fieldnames))
+            target_file.write(buffer.getvalue().encode("utf-8"))
+
+
+def merge_shards(shard_root, scraped_dir):
+    """
+    Merge per-shard CSVs into Data/Scraped/<Country>/<Category>/<Category>.csv.
+
+    Targets are merged one at a time in sorted order, shards in id order, by
+    a single process, so rows are never interleaved. The size of every target
+    before merging is recorded in <shard_root>/merge_state.json; an
+    interrupted merge truncates unfinished targets back to that size when it
+    is rerun, so no rows are duplicated. Once everything is merged the shard
+    CSVs and the merge state are removed; shard journals are left alone so an
+    unfinished shard can still resume.
+
+    Relative directories are resolved like ensure_dir() resolves them (from
+    helpers/), never from the working directory, so the merge lands in the
+    tree build_plan() created wherever the crawl is started from.
+
+    Returns:
+        Dict with the number of targets merged and bytes appended
+    """
+    shard_root = resolve_from_module(shard_root, __file__)
+    scraped_dir = resolve_from_module(scraped_dir, __file__)
+    state_file = os.path.join(shard_root, "merge_state.json")
+    state = {}
+    if os.path.exists(state_file):
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+    sources = defaultdict(list)
+    for shard in sorted(Path(shard_root).glob("shard-*")):
+        for csv_file in sorted(shard.rglob("*.csv")):
+            if csv_file.stat().st_size:
+                sources[str(csv_file.relative_to(shard))].append(csv_file)
+
+    merged = {"targets": 0, "bytes": 0}
+    for rel_path in sorted(sources):
+        target = os.path.join(scraped_dir, rel_path)
+        entry = state.get(rel_path)
+        if entry and entry["done"]:
+            continue
+
+        if entry is None:
+            size = os.path.getsize(target) if os.path.exists(target) else 0
+            entry = state[rel_path] = {"size": size, "done": False}
+            _save_state(state_file, state)
+        elif os.path.exists(target) and os.path.getsize(target) > entry["size"]:
+            # Left over from an interrupted merge
+            with open(target, "r+b") as f:
+                f.truncate(entry["size"])
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(sources[rel_path][0], "rb") as f:
+            shard_header = f.readline()
+
+        with open(target, "ab") as out:
+            if entry["size"] == 0:
+                out.write(shard_header)
+                target_header = shard_header
+            else:
+                with open(target, "rb") as existing:
+                    target_header = existing.readline()
+
+            for source in sources[rel_path]:
+                _copy_rows(source, out, target_header)
+            out.flush()
+            os.fsync(out.fileno())
+
+        merged["targets"] += 1
+        merged["bytes"] += os.path.getsize(target) - entry["size"]
+        entry["done"] = True
+        _save_state(state_file, state)
+
+    for files in sources.values():
+        for source in files:
+            source.unlink()
+    if os.path.exists(state_file):
+        os.remove(state_file)
+    return merged
@@ -0,0 +1,152 @@
+import os
+import time
+import sqlite3
+
+from helpers.normalize import extract_job_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id      INTEGER PRIMARY KEY,
+    title       TEXT,
+    company     TEXT,
+    location    TEXT,
+    link        TEXT,
+    country     TEXT,
+    category    TEXT,
+    first_seen  INTEGER NOT NULL,
+    last_seen   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_hits (
+    job_id      INTEGER NOT NULL,
+    country     TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    keyword     TEXT NOT NULL,
+    first_seen  INTEGER NOT NULL,
+    last_seen   INTEGER NOT NULL,
+    PRIMARY KEY (job_id, country, category, keyword)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_jobs_country_company ON jobs (country, company);
+CREATE INDEX IF NOT EXISTS idx_jobs_country_category ON jobs (country, category);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_hits_country_category ON job_hits (country, category);
+"""
+
+# A posting seen again keeps its first country/category and first_seen, the rest is refreshed
+UPSERT_JOB = """
+INSERT INTO jobs (job_id, title, company, location, link, country, category, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    link = excluded.link,
+    last_seen = excluded.last_seen
+"""
+
+UPSERT_HIT = """
+INSERT INTO job_hits (job_id, country, category, keyword, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_id, country, category, keyword) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+
+def connect(path, timeout=30.0):
+    """Open (creating if needed) the job database in WAL mode."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    connection = sqlite3.connect(path, timeout=timeout)
+    # WAL lets readers query while a crawl writes; NORMAL only syncs at checkpoints
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class JobStore:
+    """
+    SQLite store of scraped postings keyed by LinkedIn job ID.
+
+    Rows are buffered and upserted `batch_size` at a time in one
+    transaction: a posting is stored once in `jobs`, and every
+    (country, category, keyword) that surfaced it in `job_hits`. Several
+    processes (crawl shards) can write to the same file; a writer waits up
+    to `timeout` seconds for another one's transaction.
+
+    Args:
+        path: Database file
+        batch_size: Buffered rows that trigger a transaction
+        timeout: Seconds to wait for the database lock
+    """
+
+    def __init__(self, path, batch_size=2000, timeout=30.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = connect(path, timeout)
+        self.stats = {"rows": 0, "transactions": 0, "without_id": 0}
+        self._jobs = []
+        self._hits = []
+
+    def write(self, rows, country, category):
+        """Buffer scraped rows (dicts with title/company/location/link/job_id/search_keyword)."""
+        now = int(time.time())
+        for row in rows:
+            job_id = row.get("job_id") or extract_job_id(row.get("link"))
+            if job_id is None:
+                self.stats["without_id"] += 1
+                continue
+            self._jobs.append((int(job_id), row.get("title"), row.get("company"), row.get("location"),
+                               row.get("link"), country, category, now, now))
+            self._hits.append((int(job_id), country, category, row.get("search_keyword") or "", now, now))
+
+        if len(self._jobs) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._jobs:
+            return
+        with self.connection:
+            self.connection.executemany(UPSERT_JOB, self._jobs)
+            self.connection.executemany(UPSERT_HIT, self._hits)
+        self.stats["rows"] += len(self._jobs)
+        self.stats["transactions"] += 1
+        self._jobs, self._hits = [], []
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.connection.close()
+
+
+def jobs_per_company(connection, country, limit=20):
+    """[(company, postings)] of one country, most postings first (uses idx_jobs_country_company)."""
+    return connection.execute(
+        "SELECT company, COUNT(*) AS postings FROM jobs WHERE country = ? "
+        "GROUP BY company ORDER BY postings DESC LIMIT ?",
+        (country, limit),
+    ).fetchall()
+
+
+_store = None
+
+
+def configure_job_store(path, **kwargs):
+    """Also upsert every saved batch into the SQLite database at `path` (None = off)."""
+    global _store
+
+    close_job_store()
+    if path:
+        _store = JobStore(path, **kwargs)
+    return _store
+
+
+def get_job_store():
+    """Return the process-wide job store, or None when no database is written."""
+    return _store
+
+
+def close_job_store():
+    global _store
+
+    if _store is not None:
+        _store.close()
+        _store = None
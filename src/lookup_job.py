@@ -0,0 +1,45 @@
+import time
+import argparse
+
+from helpers.paths import project_path
+from helpers.job_index import JobIndex, update_job_index
+
+SCRAPED_DIR = project_path("scraped")
+INDEX_DIR = project_path("processed", "job_index")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Show every scraped row of some job IDs (which countries, categories and keywords surfaced them)."
+    )
+    parser.add_argument("job_ids", nargs="*", type=int, help="LinkedIn job IDs")
+    parser.add_argument("--input", default=SCRAPED_DIR,
+                        help="scraped CSV tree (<Country>/<Category>/<Category>.csv)")
+    parser.add_argument("--index", default=INDEX_DIR, help="job index directory")
+    parser.add_argument("--no-update", action="store_true",
+                        help="look up in the index as it is, without indexing rows added since")
+    args = parser.parse_args()
+
+    if not args.no_update:
+        started = time.perf_counter()
+        stats = update_job_index(args.input, args.index)
+        print(f"Index: {stats['entries']} rows; read {stats['read']} of {stats['files']} CSVs, "
+              f"{stats['added']} rows added in {1000 * (time.perf_counter() - started):.1f} ms")
+
+    index = JobIndex(args.index)
+    try:
+        for job_id in args.job_ids:
+            started = time.perf_counter()
+            rows = index.rows(job_id)
+            elapsed_us = 1e6 * (time.perf_counter() - started)
+
+            print(f"\nJob {job_id}: {len(rows)} rows ({elapsed_us:.0f} us)")
+            for row in rows:
+                print(f"  {row['country']} / {row['category']} / {row.get('search_keyword', '')}: "
+                      f"{row.get('title', '')} at {row.get('company', '')}, {row.get('location', '')}")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import os
+import csv
+import argparse
+from itertools import islice
+
+from helpers.paths import project_path
+from helpers.checkpointing import journal_pending
+from helpers.normalize import canonicalize_jobs
+from csv_to_dataset import iter_category_csvs
+
+SCRAPED_DIR = project_path("scraped")
+# Offsets recorded by an unfinished crawl would no longer match the rewritten files
+JOURNAL_FILE = project_path("processed", "crawl_journal.jsonl")
+SHARD_ROOT = project_path("cache", "shards")
+
+
+def crawl_in_progress():
+    """True if an interrupted crawl could still resume against the current CSVs."""
+    return os.path.isdir(SHARD_ROOT) or journal_pending(JOURNAL_FILE)
+
+
+class _ByteCounter:
+    """File-like sink that only counts the UTF-8 bytes written to it."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, text):
+        self.bytes += len(text.encode("utf-8"))
+
+
+def migrate_csv(csv_path, dry_run=False, chunk_rows=10_000):
+    """
+    Rewrite one CSV with canonical links and a job_id column (after link).
+
+    The new file is written next to the old one and renamed over it, so an
+    interruption leaves either the old or the new file.
+
+    Returns:
+        (bytes before, bytes after)
+    """
+    before = os.path.getsize(csv_path)
+    tmp_path = f"{csv_path}.migrating"
+
+    with open(csv_path, "r", newline="", encoding="utf-8") as src:
+        reader = csv.DictReader(src)
+        if not reader.fieldnames or "link" not in reader.fieldnames:
+            return before, before
+
+        fieldnames = [name for name in reader.fieldnames if name != "job_id"]
+        fieldnames.insert(fieldnames.index("link") + 1, "job_id")
+
+        dst = _ByteCounter() if dry_run else open(tmp_path, "w", newline="", encoding="utf-8")
+        try:
+            writer = csv.DictWriter(dst, fieldnames=fieldnames)
+            writer.writeheader()
+            while True:
+                rows = list(islice(reader, chunk_rows))
+                if not rows:
+                    break
+                writer.writerows(canonicalize_jobs(rows))
+        finally:
+            if not dry_run:
+                dst.flush()
+                os.fsync(dst.fileno())
+                dst.close()
+
+    if dry_run:
+        return before, dst.bytes
+    os.replace(tmp_path, csv_path)
+    return before, os.path.getsize(csv_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Canonicalize the links of every scraped CSV and add their job_id column."
+    )
+    parser.add_argument("--input", default=SCRAPED_DIR,
+                        help="scraped CSV tree (<Country>/<Category>/<Category>.csv)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="only estimate the bytes saved, don't rewrite anything")
+    parser.add_argument("--force", action="store_true",
+                        help="migrate even though an interrupted crawl could resume against these files")
+    args = parser.parse_args()
+
+    if not args.dry_run and not args.force and os.path.abspath(args.input) == SCRAPED_DIR and crawl_in_progress():
+        parser.error("an interrupted crawl is waiting to resume (see its journal); "
+                     "finish it first or pass --force")
+
+    total_before = total_after = 0
+    for country, category, csv_path in iter_category_csvs(args.input):
+        before, after = migrate_csv(csv_path, dry_run=args.dry_run)
+        total_before += before
+        total_after += after
+        print(f"  {country} / {category}: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB")
+
+    saved = total_before - total_after
+    verb = "Would save" if args.dry_run else "Saved"
+    print(f"{verb} {saved / 1e6:.1f} MB: {total_before / 1e6:.1f} MB -> {total_after / 1e6:.1f} MB "
+          f"({saved / total_before:.0%})" if total_before else "No CSVs found")
+
+
+if __name__ == "__main__":
+    main()
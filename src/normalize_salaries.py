@@ -0,0 +1,41 @@
+import argparse
+
+import pandas as pd
+
+from helpers.paths import project_path
+from helpers.resilience import OK
+from helpers.salary import normalize_salaries
+
+DETAILS_FILE = project_path("processed", "job_details.jsonl")
+SALARIES_FILE = project_path("processed", "job_salaries.csv")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Normalize the salary of every recorded job.")
+    parser.add_argument("--input", default=DETAILS_FILE,
+                        help="JSONL file of job records (default: job_details.jsonl written by DetailScraper.py)")
+    parser.add_argument("--output", default=SALARIES_FILE,
+                        help="CSV file of job_id + normalized salary columns")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    records = pd.read_json(args.input, lines=True, dtype=False)
+    if "status" in records:
+        records = records[records["status"] == OK]
+    print(f"Loaded {len(records)} job records from {args.input}")
+
+    salaries = normalize_salaries(records)
+    salaries.insert(0, "job_id", records["job_id"])
+    salaries.to_csv(args.output, index=False)
+
+    found = salaries["salary_source"].notna()
+    print(f"Salary found for {found.sum()}/{len(salaries)} jobs:")
+    print(salaries.loc[found, "salary_source"].value_counts().to_string())
+    print(f"Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Crash/resume behaviour of the crawl journal with the buffered CSV writer.
+
+    python -m pytest tests
+"""
+import os
+import csv
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.checkpointing import CrawlJournal  # noqa: E402
+from helpers.csv_writer import CsvWriter  # noqa: E402
+
+ENTRY = {"country": "Egypt", "category": "Cybersecurity", "keyword": "Security Analyst"}
+
+
+def card(n):
+    return {"title": f"Job {n}", "company": "C", "location": "Cairo",
+            "link": f"https://www.linkedin.com/jobs/view/{4000000000 + n}", "job_id": 4000000000 + n,
+            "search_keyword": ENTRY["keyword"]}
+
+
+def read_rows(csv_path):
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def crawl_pages(tmp_path, starts, max_rows):
+    """Persist one-card pages through an attached writer, then "crash" (no close, no flush)."""
+    csv_path = str(tmp_path / "Cybersecurity.csv")
+    journal = CrawlJournal(str(tmp_path / "journal.jsonl"))
+    writer = CsvWriter(max_rows=max_rows, flush_interval=3600)
+    journal.attach(writer)
+    for start in starts:
+        journal.persist(ENTRY, start, 1, csv_path, lambda s=start: writer.write(csv_path, [card(s)]))
+    return csv_path
+
+
+def test_flush_inside_write_commits_the_page_that_triggered_it(tmp_path):
+    csv_path = crawl_pages(tmp_path, [0, 10, 20], max_rows=3)
+
+    resumed = CrawlJournal(str(tmp_path / "journal.jsonl"))
+    rows = read_rows(csv_path)
+    assert resumed.completed_pages(ENTRY) == {0: 1, 10: 1, 20: 1}
+    assert rows[0] == list(card(0))
+    assert [row[0] for row in rows[1:]] == ["Job 0", "Job 10", "Job 20"]
+
+
+def test_rows_still_buffered_at_a_crash_are_fetched_again(tmp_path):
+    csv_path = crawl_pages(tmp_path, [0, 10, 20, 30], max_rows=3)
+
+    resumed = CrawlJournal(str(tmp_path / "journal.jsonl"))
+    # Page 30 never left the buffer: not on disk, not recorded as done
+    assert resumed.completed_pages(ENTRY) == {0: 1, 10: 1, 20: 1}
+    assert len(read_rows(csv_path)) == 1 + 3
@@ -0,0 +1,60 @@
+"""
+Duplicate classification of the scraped-CSV dedup.
+
+    python -m pytest tests
+"""
+import os
+import csv
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.dedup import DiskIndex, MemoryIndex, dedup_tree  # noqa: E402
+
+LINK = "https://www.linkedin.com/jobs/view/4000000001"
+
+
+def write_csv(path, keywords):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["title", "link", "search_keyword"])
+        writer.writerows(["Analyst", LINK, keyword] for keyword in keywords)
+
+
+def read_keywords(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return [row["search_keyword"] for row in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize("make_index", [MemoryIndex, DiskIndex])
+def test_repeats_within_a_later_file_are_removed(tmp_path, make_index):
+    # The posting first appeared in A.csv, then three times in B.csv
+    a, b = tmp_path / "A.csv", tmp_path / "B.csv"
+    write_csv(a, ["K"])
+    write_csv(b, ["K", "K", "K2"])
+    files = [("Egypt", "A", str(a)), ("Egypt", "B", str(b))]
+
+    report = dedup_tree(files, scope="file", dry_run=False, index=make_index())
+
+    assert report["duplicates"] == {"within_keyword": 1, "across_keywords": 1,
+                                    "across_categories": 1, "across_countries": 0}
+    assert report["removed"] == 2
+    assert report["unique"] == 1
+    assert read_keywords(a) == ["K"]
+    assert read_keywords(b) == ["K"]
+
+
+def test_wider_scopes_classify_against_country_then_tree(tmp_path):
+    paths = [tmp_path / name for name in ("A.csv", "B.csv", "C.csv")]
+    for path in paths:
+        write_csv(path, ["K", "K"])
+    files = [("Egypt", "A", str(paths[0])), ("Egypt", "B", str(paths[1])), ("Qatar", "A", str(paths[2]))]
+
+    report = dedup_tree(files, scope="country", dry_run=True)
+
+    assert report["duplicates"] == {"within_keyword": 3, "across_keywords": 0,
+                                    "across_categories": 1, "across_countries": 1}
+    assert report["removed"] == 4
+    assert read_keywords(paths[0]) == ["K", "K"]
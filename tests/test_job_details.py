@@ -0,0 +1,27 @@
+"""
+Which detail-page outcomes a rerun fetches again.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.job_details import JobDetailStore  # noqa: E402
+from helpers.resilience import OK, END_OF_RESULTS, CLIENT_ERROR  # noqa: E402
+
+
+def test_only_found_and_gone_jobs_are_skipped_on_rerun(tmp_path):
+    path = tmp_path / "job_details.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for job_id, status in ((1, OK), (2, CLIENT_ERROR), (3, END_OF_RESULTS)):
+            f.write(json.dumps({"job_id": job_id, "status": status}) + "\n")
+
+    store = JobDetailStore(str(path))
+    store.close()
+
+    # An empty 200 body is often throttling, not a deleted posting
+    assert 1 in store and 2 in store
+    assert 3 not in store
@@ -0,0 +1,75 @@
+"""
+Incremental reads of appended CSV rows and lookups in the job index.
+
+    python -m pytest tests
+"""
+import os
+import csv
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.csv_tail import read_appended  # noqa: E402
+from helpers.job_index import JobIndex, update_job_index  # noqa: E402
+
+HEADER = ["title", "link", "search_keyword", "job_id"]
+
+
+def row(n, keyword="Security Analyst"):
+    return [f"Job {n}", f"https://www.linkedin.com/jobs/view/{4000000000 + n}", keyword, str(4000000000 + n)]
+
+
+def write_csv(path, rows, mode="w"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode, newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if mode == "w":
+            writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def test_read_appended_returns_only_new_complete_lines(tmp_path):
+    path = str(tmp_path / "jobs.csv")
+    write_csv(path, [row(1)])
+    entry, _, _, data = read_appended(path)
+    assert data.count(b"\n") == 1
+
+    write_csv(path, [row(2)], mode="a")
+    with open(path, "ab") as f:
+        f.write(b"Job 3,half a row")
+    entry, _, start, data = read_appended(path, entry)
+
+    assert next(csv.reader([data.decode("utf-8")])) == row(2)
+    assert start + len(data) == entry["offset"]
+
+    # Rewritten in place (e.g. compacted): read again from the start
+    write_csv(path, [row(4)])
+    _, _, _, data = read_appended(path, entry)
+    assert next(csv.reader([data.decode("utf-8")])) == row(4)
+
+
+def test_lookup_after_an_incremental_append(tmp_path):
+    scraped_dir, index_dir = str(tmp_path / "Scraped"), str(tmp_path / "index")
+    egypt = os.path.join(scraped_dir, "Egypt", "Cybersecurity", "Cybersecurity.csv")
+    qatar = os.path.join(scraped_dir, "Qatar", "Cybersecurity", "Cybersecurity.csv")
+    write_csv(egypt, [row(n) for n in range(1, 50)])
+    write_csv(qatar, [row(7)])
+    assert update_job_index(scraped_dir, index_dir)["entries"] == 50
+
+    write_csv(egypt, [row(7, "SOC Analyst"), row(100)], mode="a")
+    stats = update_job_index(scraped_dir, index_dir)
+    assert (stats["read"], stats["added"], stats["entries"]) == (1, 2, 52)
+
+    index = JobIndex(index_dir)
+    try:
+        rows = index.rows(4000000007)
+        assert [(r["country"], r["search_keyword"]) for r in rows] == [
+            ("Egypt", "Security Analyst"), ("Egypt", "SOC Analyst"), ("Qatar", "Security Analyst")
+        ]
+        assert index.rows(4000000100)[0]["title"] == "Job 100"
+        assert index.lookup(4000000000) == [] and index.lookup(4000000101) == []
+    finally:
+        index.close()
+
+    # Nothing changed: nothing is read
+    assert update_job_index(scraped_dir, index_dir)["read"] == 0
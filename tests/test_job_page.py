@@ -0,0 +1,47 @@
+"""
+Flattening of a job page's LD+JSON into a job record.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.job_page import extract_job_page, job_record  # noqa: E402
+
+
+def page(posting):
+    return ('<html><head><script type="application/ld+json">'
+            f"{json.dumps(posting)}</script></head><body></body></html>")
+
+
+def test_list_valued_location_and_organization_take_the_first_object():
+    record = job_record(extract_job_page(page({
+        "@type": "JobPosting",
+        "title": "Analyst",
+        "hiringOrganization": [{"@type": "Organization", "name": "Acme"}],
+        "jobLocation": [
+            {"@type": "Place", "address": {"addressLocality": "Cairo", "addressCountry": "EG"}},
+            {"@type": "Place", "address": {"addressLocality": "Giza", "addressCountry": "EG"}},
+        ],
+    })))
+
+    assert record["title"] == "Analyst"
+    assert record["company"] == "Acme"
+    assert (record["locality"], record["country"]) == ("Cairo", "EG")
+
+
+def test_non_object_values_are_ignored():
+    record = job_record(extract_job_page(page({
+        "@type": "JobPosting",
+        "title": "Analyst",
+        "hiringOrganization": "Acme",
+        "jobLocation": [],
+        "baseSalary": {"currency": "USD", "value": 50000},
+    })))
+
+    assert record["title"] == "Analyst"
+    assert record["company"] is None and record["locality"] is None
+    assert record["salary_currency"] == "USD" and record["salary_min"] is None
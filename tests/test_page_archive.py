@@ -0,0 +1,62 @@
+"""
+Reading a page archive while a crawl is still archiving into it.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.page_archive import BLOBS_FILE, PageArchive, page_stem, read_page  # noqa: E402
+
+
+def page(n):
+    return f"<html><body><h1>Job {n}</h1>{'<li>card</li>' * n}</body></html>"
+
+
+def test_reader_sees_pages_put_by_a_live_writer(tmp_path):
+    writer = PageArchive(str(tmp_path), train_after=4)
+    for n in range(1, 7):
+        writer.put(4000000000 + n, page(n))
+
+    # Not closed or flushed: the dictionary trained after 4 pages is picked up too
+    reader = PageArchive(str(tmp_path), readonly=True)
+    assert len(reader) == 6
+    assert reader.get(4000000006) == page(6)
+    assert read_page(f"{tmp_path}:4000000001") == page(1)
+    reader.close()
+
+    writer.put(4000000007, page(7))
+    assert read_page(f"{tmp_path}:4000000007") == page(7)
+    writer.close()
+
+
+def test_reader_leaves_the_archive_alone(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        PageArchive(str(tmp_path / "missing"), readonly=True)
+    assert not (tmp_path / "missing").exists()
+
+    writer = PageArchive(str(tmp_path))
+    writer.put(4000000001, page(1))
+    writer.close()
+
+    # A writer's half-written entry is skipped, not truncated away
+    with open(tmp_path / BLOBS_FILE, "ab") as f:
+        f.write(b"torn")
+    size = os.path.getsize(tmp_path / BLOBS_FILE)
+
+    reader = PageArchive(str(tmp_path), readonly=True)
+    assert reader.get(4000000001) == page(1)
+    with pytest.raises(PermissionError):
+        reader.put(4000000002, page(2))
+    reader.close()
+    assert os.path.getsize(tmp_path / BLOBS_FILE) == size
+
+
+def test_output_names_of_archived_pages(tmp_path):
+    PageArchive(str(tmp_path)).close()
+    assert page_stem(f"{tmp_path}:4000000001") == "4000000001"
+    assert page_stem(os.path.join("pages", "4000000001.html")) == os.path.join("pages", "4000000001")
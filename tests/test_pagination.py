@@ -0,0 +1,56 @@
+"""
+End-of-results decisions of the pagination planner.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.card_parser import count_cards  # noqa: E402
+from helpers.pagination import PAGE_SIZE, PaginationPlanner  # noqa: E402
+
+
+def test_failed_page_does_not_shift_the_last_page():
+    planner = PaginationPlanner(initial_window=4)
+    planner.first_window("Analyst", "Egypt")
+
+    # Page 2 (start 10) failed; the short page is the 4th of the window
+    window = planner.next_window("Analyst", "Egypt", 0, {0: 10, 20: 10, 30: 3}, 4, 23)
+    planner.finish("Analyst", "Egypt", 23)
+
+    assert window == 0
+    report = planner.report()
+    # Counted as the 3rd page, the short page would leave one page of the window wasted
+    assert report["wasted_pages"] == 0
+    assert (report["requests"], report["baseline_requests"]) == (4, 10)
+    assert planner.history == {"Egypt": {"Analyst": 23}}
+
+
+def test_later_window_counts_pages_from_its_start():
+    planner = PaginationPlanner(initial_window=2)
+    planner.first_window("Analyst", "Egypt")
+    window = planner.next_window("Analyst", "Egypt", 0, {0: 10, 10: 10}, 2, 20)
+    assert window == 3
+
+    # Only the last page of the second window answered, and it is empty
+    assert planner.next_window("Analyst", "Egypt", 20, {40: 0}, window, 20) == 0
+    planner.finish("Analyst", "Egypt", 20)
+
+    report = planner.report()
+    assert report["wasted_pages"] == 0
+    assert (report["requests"], report["baseline_requests"]) == (5, 10)
+
+
+def test_full_page_with_an_unparseable_card_is_not_short():
+    card = ('<li><h3 class="base-search-card__title">Job</h3>'
+            '<h4 class="base-search-card__subtitle">C</h4>'
+            '<span class="job-search-card__location">Cairo</span>'
+            '<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{}"></a></li>')
+    page = "".join(card.format(4000000000 + n) for n in range(PAGE_SIZE - 1)) + "<li>promoted</li>"
+    assert count_cards(page) == PAGE_SIZE
+
+    planner = PaginationPlanner(initial_window=1)
+    planner.first_window("Analyst", "Egypt")
+    assert planner.next_window("Analyst", "Egypt", 0, {0: count_cards(page)}, 1, 9) == 2
@@ -0,0 +1,70 @@
+"""
+Salary range, currency and period parsing of the salary engine.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import math
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.salary import normalize_salaries, parse_salaries  # noqa: E402
+
+
+def parsed_rows(texts, **kwargs):
+    parsed = parse_salaries(texts, **kwargs)
+    return [tuple(None if isinstance(value, float) and math.isnan(value) else value for value in row)
+            for row in parsed[["salary_min", "salary_max", "salary_currency", "salary_period"]].itertuples(index=False)]
+
+
+def test_ranges_currencies_and_periods():
+    assert parsed_rows([
+        "$126,000.00/yr - $180,000.00/yr",
+        "EGP 20,000 to 30,000 per month",
+        "€45/hr",
+        "£40k - £55k a year",
+        "10 000 - 15 000 zł",
+        "60.000 € - 75.000 € per year",
+        "No salary here",
+        None,
+    ]) == [
+        (126000.0, 180000.0, "USD", "YEAR"),
+        (20000.0, 30000.0, "EGP", "MONTH"),
+        (45.0, 45.0, "EUR", "HOUR"),
+        (40000.0, 55000.0, "GBP", "YEAR"),
+        (10000.0, 15000.0, "PLN", None),
+        (60000.0, 75000.0, "EUR", "YEAR"),
+        (None, None, None, None),
+        (None, None, None, None),
+    ]
+
+
+def test_bare_dollar_follows_the_country():
+    rows = parsed_rows(["$80,000 - $95,000 per year"] * 3, countries=["Canada", "AU", "United States"])
+    assert [row[2] for row in rows] == ["CAD", "AUD", "USD"]
+
+
+def test_strict_drops_lone_amounts_without_a_period():
+    rows = parsed_rows(["Save $5 on lunch", "$30/hr", "$50,000 - $60,000"], strict=True)
+    assert rows == [(None, None, None, None), (30.0, 30.0, "USD", "HOUR"), (50000.0, 60000.0, "USD", None)]
+
+
+def test_structured_salary_wins_and_is_annualized():
+    records = pd.DataFrame({
+        "salary_min": [5000.0, None],
+        "salary_max": [None, None],
+        "salary_currency": ["USD", None],
+        "salary_unit": ["month", None],
+        "salary_text": ["$1/hr", "EGP 20,000 - 30,000 per month"],
+        "description": [None, None],
+        "country": ["United States", "Egypt"],
+    })
+
+    salaries = normalize_salaries(records)
+
+    assert salaries["salary_source"].tolist() == ["ld_json", "salary_text"]
+    assert salaries["salary_max"].tolist() == [5000.0, 30000.0]
+    assert salaries["salary_min_annual"].tolist() == [60000.0, 240000.0]
@@ -0,0 +1,88 @@
+"""
+Merging per-shard CSVs into the scraped tree.
+
+    python -m pytest tests
+"""
+import os
+import csv
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from helpers.sharding import merge_shards, shard_dir  # noqa: E402
+
+REL_PATH = os.path.join("Egypt", "Cybersecurity", "Cybersecurity.csv")
+OLD_HEADER = ["title", "company", "location", "link", "search_keyword"]
+HEADER = OLD_HEADER + ["job_id"]
+
+
+def row(n, header=HEADER):
+    values = {"title": f"Job {n}", "company": "C", "location": "Cairo",
+              "link": f"https://www.linkedin.com/jobs/view/{4000000000 + n}",
+              "search_keyword": "Security Analyst", "job_id": str(4000000000 + n)}
+    return [values[column] for column in header]
+
+
+def write_csv(path, header, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_merge_into_a_target_without_job_id(tmp_path):
+    shard_root, scraped_dir = str(tmp_path / "shards"), str(tmp_path / "Scraped")
+    write_csv(os.path.join(scraped_dir, REL_PATH), OLD_HEADER, [row(1, OLD_HEADER)])
+    write_csv(os.path.join(shard_dir(shard_root, 0), REL_PATH), HEADER, [row(2), row(3)])
+
+    merge_shards(shard_root, scraped_dir)
+
+    assert read_rows(os.path.join(scraped_dir, REL_PATH)) == [
+        OLD_HEADER, row(1, OLD_HEADER), row(2, OLD_HEADER), row(3, OLD_HEADER)
+    ]
+
+
+def test_merge_appends_shards_in_order_to_an_existing_target(tmp_path):
+    shard_root, scraped_dir = str(tmp_path / "shards"), str(tmp_path / "Scraped")
+    target = os.path.join(scraped_dir, REL_PATH)
+    write_csv(target, HEADER, [row(1)])
+    write_csv(os.path.join(shard_dir(shard_root, 1), REL_PATH), HEADER, [row(3)])
+    write_csv(os.path.join(shard_dir(shard_root, 0), REL_PATH), HEADER, [row(2)])
+
+    merged = merge_shards(shard_root, scraped_dir)
+
+    assert read_rows(target) == [HEADER, row(1), row(2), row(3)]
+    assert merged["targets"] == 1
+    # Shard CSVs and the merge state are gone once merged
+    assert not any(name.endswith((".csv", ".json")) for _, _, names in os.walk(shard_root) for name in names)
+
+
+def test_merge_into_a_missing_or_empty_target_writes_the_header(tmp_path):
+    shard_root, scraped_dir = str(tmp_path / "shards"), str(tmp_path / "Scraped")
+    empty_rel = os.path.join("Egypt", "Data Science", "Data Science.csv")
+    os.makedirs(os.path.dirname(os.path.join(scraped_dir, empty_rel)))
+    open(os.path.join(scraped_dir, empty_rel), "w").close()
+    write_csv(os.path.join(shard_dir(shard_root, 0), REL_PATH), HEADER, [row(1)])
+    write_csv(os.path.join(shard_dir(shard_root, 0), empty_rel), HEADER, [row(2)])
+
+    merge_shards(shard_root, scraped_dir)
+
+    assert read_rows(os.path.join(scraped_dir, REL_PATH)) == [HEADER, row(1)]
+    assert read_rows(os.path.join(scraped_dir, empty_rel)) == [HEADER, row(2)]
+
+
+def test_merge_maps_a_mismatched_header_onto_the_target_columns(tmp_path):
+    shard_root, scraped_dir = str(tmp_path / "shards"), str(tmp_path / "Scraped")
+    reordered = ["job_id", "link"] + [column for column in HEADER if column not in ("job_id", "link")]
+    write_csv(os.path.join(scraped_dir, REL_PATH), HEADER, [row(1)])
+    write_csv(os.path.join(shard_dir(shard_root, 0), REL_PATH), reordered, [row(2, reordered)])
+
+    merge_shards(shard_root, scraped_dir)
+
+    assert read_rows(os.path.join(scraped_dir, REL_PATH)) == [HEADER, row(1), row(2)]